@@ -4,11 +4,16 @@ AnyMailFinder Enricher Script
 Finds decision-maker emails for companies using AnyMailFinder API.
 
 Key Features:
-- Saves progress incrementally (won't lose work if interrupted)
+- Appends every lookup to a crash-safe progress journal (won't lose work if interrupted)
 - Can resume from where it left off
-- Handles rate limiting (1 request/second)
+- Handles rate limiting (token bucket, adapts to 429s and rate-limit headers)
+- Optional concurrent lookups (workers) under the same rate limit
+- Optional bulk mode: one AnyMailFinder bulk job per niche instead of a call per domain
+- Optional key pool: spread lookups over several AnyMailFinder accounts
+- Optional work queue: several worker processes share one niche (prepare / work / merge)
+- Skips social, directory, site-builder and franchise domains before paying for a lookup
 - Shows clear progress updates
-- Robust error handling
+- Retries with jittered backoff and Retry-After; stops the run on invalid key / no credits
 
 Usage:
     python anymailfinder_enricher.py
@@ -16,17 +21,37 @@ Usage:
 Workflow:
     1. Load leads from {niche}-leads.json
     2. For each lead with a domain, call AnyMailFinder API
-    3. Save progress after EVERY successful lookup
+    3. Append EVERY lookup to {niche}-leads-progress.jsonl
     4. Output enriched leads to {niche}-enriched.json
 """
 
 import requests
+import asyncio
 import json
+import sqlite3
+import threading
 import time
 import re
 import os
+import socket
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import List, Dict, Optional
+from itertools import count
+from types import SimpleNamespace
+from typing import Iterator, List, Dict, Optional, Tuple
+
+from compass_http import (
+    AsyncHttpTransport,
+    BackoffPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpTransport,
+    TokenBucket,
+    get_async_transport,
+    get_transport,
+    parse_retry_after
+)
 
 # =============================================================================
 # CONFIGURATION
@@ -34,20 +59,95 @@ from typing import List, Dict, Optional
 
 ANYMAILFINDER_API_KEY = ""  # Set via environment variable or pass to functions
 BASE_URL = "https://api.anymailfinder.com/v5.0/search/decision-maker.json"
+BULK_URL = "https://api.anymailfinder.com/v5.1/bulk"
 
-# Rate limiting: AnyMailFinder allows ~1 request/second
-REQUEST_DELAY = 1.0  # seconds between requests
+# Bulk jobs: poll status with backoff (2s, 3s, 4.5s, ... up to 30s)
+BULK_MIN_POLL_INTERVAL = 2
+BULK_MAX_POLL_INTERVAL = 30
+BULK_MAX_WAIT_SECONDS = 3 * 3600
 
-# Save progress every N leads (in addition to saving after each successful find)
-SAVE_INTERVAL = 10
+# Rate limiting: AnyMailFinder allows ~1 request/second on the base plan.
+# Pass rate_limit= to AnyMailFinderClient to match your account's real limit.
+REQUEST_DELAY = 1.0  # seconds between requests
+DEFAULT_RATE_LIMIT = 1 / REQUEST_DELAY  # requests per second
+
+# Domain cache shared across niches and runs (stored next to the leads files)
+DOMAIN_CACHE_FILE = os.path.join(".cache", "anymailfinder-domains.sqlite")
+CACHE_TTL_DAYS = 90  # Found decision makers
+NEGATIVE_CACHE_TTL_DAYS = 14  # "No email found" answers (re-check sooner)
+
+# Lookup outcomes (AnyMailFinderClient.lookup)
+LOOKUP_FOUND = "found"
+LOOKUP_NOT_FOUND = "not_found"
+LOOKUP_ERROR = "error"
+
+# Domains not worth a lookup: the website field points at a profile page,
+# a site builder or a national franchise, not the business's own domain.
+#   "example.com"     exact domain
+#   "*.example.com"   domain and all its subdomains
+#   "re:<regex>"      regular expression (searched in the domain)
+# Add your own in SKIP_DOMAINS_FILE (one entry per line, next to the leads file)
+DEFAULT_SKIP_DOMAINS = [
+    # Social profiles, directories and review sites
+    "*.facebook.com", "*.fb.com", "*.instagram.com", "*.twitter.com", "*.x.com",
+    "*.linkedin.com", "*.youtube.com", "*.tiktok.com", "*.pinterest.com", "*.linktr.ee",
+    "*.yelp.com", "*.yellowpages.com", "*.bbb.org", "*.nextdoor.com", "*.angi.com",
+    "*.angieslist.com", "*.homeadvisor.com", "*.thumbtack.com", "*.houzz.com", "*.porch.com",
+    "*.google.com", "*.g.page", "*.business.site", "*.goo.gl", "bit.ly", "tinyurl.com",
+    # Site builders and booking pages (shared domains)
+    "*.wixsite.com", "*.wix.com", "*.godaddysites.com", "*.squarespace.com", "*.weebly.com",
+    "*.wordpress.com", "*.square.site", "*.squareup.com", "*.mystrikingly.com", "*.webflow.io",
+    "*.carrd.co", "*.site123.me", "*.jimdosite.com", "*.myshopify.com", "*.vagaro.com",
+    "*.booksy.com", "*.setmore.com",
+    # National franchises / brands (local pages live on the brand's domain)
+    "*.servpro.com", "*.rotorooter.com", "*.mrrooter.com", "*.onehourheatandair.com",
+    "*.aireserv.com", "*.mrelectric.com", "*.mrhandyman.com", "*.mollymaid.com",
+    "*.servicemasterclean.com", "*.stanleysteemer.com", "*.chemdry.com", "*.terminix.com",
+    "*.orkin.com", "*.trugreen.com", "*.jiffylube.com", "*.statefarm.com", "*.allstate.com",
+    "*.edwardjones.com", "*.remax.com", "*.coldwellbanker.com", "*.century21.com", "*.kw.com",
+    # Government / military sites and bare IP addresses
+    r"re:\.(gov|mil)$",
+    r"re:^[0-9.]+$",
+]
+SKIP_DOMAINS_FILE = "skip-domains.txt"
+
+# Concurrent lookups in enrich_leads (all share the client's rate limiter)
+ENRICH_WORKERS = 5
+
+# Print a progress line every N domains (every lookup is journaled as it finishes)
+PROGRESS_INTERVAL = 10
+
+# Multi-process work queue (prepare_enrichment_queue / run_enrichment_worker)
+QUEUE_LEASE_SECONDS = 300  # A claimed batch goes back to the queue if not renewed in time
+QUEUE_BATCH_SIZE = 25  # Domains claimed per lease
+QUEUE_MAX_ATTEMPTS = 3  # Lookups that error are retried by other workers up to this many times
+QUEUE_IDLE_POLL = 5  # Seconds an idle worker waits for other workers' leases to finish or expire
 
 # =============================================================================
 # API CLIENT
 # =============================================================================
 
 class AnyMailFinderClient:
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        transport: HttpTransport = None,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        backoff: BackoffPolicy = None
+    ):
+        """
+        Args:
+            api_key: AnyMailFinder API key
+            transport: HTTP transport (default: shared get_transport())
+            rate_limit: Requests per second allowed for this account. Every
+                thread using the client shares one token bucket at this rate.
+            backoff: Retry policy for 429/5xx/timeouts (default: BackoffPolicy())
+        """
         self.api_key = api_key
+        self.transport = transport or get_transport()
+        self.rate_limiter = TokenBucket(rate_limit)
+        self.backoff = backoff or BackoffPolicy()
+        self.circuit = CircuitBreaker("AnyMailFinder")
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
@@ -55,6 +155,12 @@ class AnyMailFinderClient:
         self.requests_made = 0
         self.emails_found = 0
         self.errors = 0
+        self._lock = threading.Lock()
+
+    def _count(self, counter: str):
+        """Thread-safe increment of requests_made / emails_found / errors."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
 
     def find_decision_maker(self, domain: str, category: str = "ceo") -> Optional[dict]:
         """
@@ -66,83 +172,461 @@ class AnyMailFinderClient:
 
         Returns:
             Dict with email, name, title if found, None otherwise
+
+        Raises:
+            CircuitOpenError: API key invalid or out of credits (see lookup)
+        """
+        return self.lookup(domain, category)[1]
+
+    def lookup(self, domain: str, category: str = "ceo") -> Tuple[str, Optional[dict]]:
+        """
+        Like find_decision_maker, but also says why there is no result.
+
+        Rate limits (429), server errors (5xx) and network errors are retried
+        per self.backoff, honouring Retry-After. An invalid key (401) or
+        exhausted credits (402) trips the client's circuit breaker: this and
+        every later call raise CircuitOpenError without touching the API.
+
+        Returns:
+            (outcome, result) where outcome is LOOKUP_FOUND, LOOKUP_NOT_FOUND
+            (AnyMailFinder answered: no email) or LOOKUP_ERROR (no answer -
+            worth trying again later)
         """
         payload = {
             "domain": domain,
             "decision_maker_category": category
         }
+        attempt = 0
+
+        while True:
+            self.circuit.check()
+
+            try:
+                self.rate_limiter.acquire()
+                response = self.transport.request(
+                    "POST",
+                    BASE_URL,
+                    headers=self.headers,
+                    json=payload,
+                    timeout=30
+                )
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                if self.backoff.should_retry(attempt):
+                    time.sleep(self.backoff.delay(attempt))
+                    attempt += 1
+                    continue
+                print(f"Timeout for {domain}" if isinstance(e, requests.exceptions.Timeout) else f"Error for {domain}: {e}")
+                self._count("errors")
+                return LOOKUP_ERROR, None
+            except Exception as e:
+                print(f"Error for {domain}: {e}")
+                self._count("errors")
+                return LOOKUP_ERROR, None
+
+            self._count("requests_made")
+            self.rate_limiter.update_from_headers(response.headers)
 
-        try:
-            response = requests.post(
-                BASE_URL,
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            if response.status_code == 200:
+                self.rate_limiter.success()
+                try:
+                    result = parse_decision_maker(response.json())
+                except ValueError as e:
+                    print(f"Error for {domain}: unreadable response ({e})")
+                    self._count("errors")
+                    return LOOKUP_ERROR, None
+                if result:
+                    self._count("emails_found")
+                    return LOOKUP_FOUND, result
+                return LOOKUP_NOT_FOUND, None
+
+            if response.status_code in (401, 402):
+                reason = "Invalid API key" if response.status_code == 401 else "Out of credits"
+                print(f"ERROR: {reason}")
+                self._count("errors")
+                self.circuit.trip(reason)
+                self.circuit.check()
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if response.status_code == 429:
+                # The bucket pauses for Retry-After itself; back off only without one
+                self.rate_limiter.throttle(retry_after)
+                print(f"Rate limited - slowing to {self.rate_limiter.rate:.2f} req/s")
+
+            if self.backoff.should_retry(attempt, response.status_code):
+                if response.status_code != 429 or retry_after is None:
+                    time.sleep(self.backoff.delay(attempt, retry_after))
+                attempt += 1
+                continue
+
+            self._count("errors")
+            return LOOKUP_ERROR, None
+
+
+    # =========================================================================
+    # BULK SEARCH ENDPOINTS
+    # =========================================================================
+
+    def _bulk_request(self, method: str, url: str, **kwargs):
+        """Bulk API call; trips the circuit breaker on invalid key / no credits."""
+        self.circuit.check()
+        response = self.transport.request(method, url, headers=self.headers, **kwargs)
+        self._count("requests_made")
+
+        if response.status_code in (401, 402):
+            reason = "Invalid API key" if response.status_code == 401 else "Out of credits"
+            print(f"ERROR: {reason}")
+            self.circuit.trip(reason)
+            self.circuit.check()
+
+        response.raise_for_status()
+        return response.json() if response.text else {}
+
+    def submit_bulk_search(self, domains: List[str], category: str = "ceo", name: str = None) -> str:
+        """
+        Submit a list of domains as one bulk decision-maker search.
+
+        Returns:
+            Bulk job ID
+        """
+        payload = {
+            "data": [["domain"]] + [[domain] for domain in domains],
+            "domain_field_index": 0,
+            "decision_maker_category": category,
+            "file_name": name or f"compass-{datetime.now():%Y%m%d-%H%M%S}"
+        }
+        result = self._bulk_request("POST", f"{BULK_URL}/json", json=payload)
+        job_id = result.get("id")
+        if not job_id:
+            raise Exception(f"Bulk search not accepted: {result}")
+        print(f"Bulk job submitted: {job_id} ({len(domains)} domains)")
+        return job_id
+
+    def get_bulk_search(self, job_id: str) -> dict:
+        """Get status of a bulk job."""
+        return self._bulk_request("GET", f"{BULK_URL}/{job_id}")
+
+    def wait_for_bulk_search(self, job_id: str, timeout: int = BULK_MAX_WAIT_SECONDS) -> dict:
+        """
+        Poll a bulk job with backoff until it completes.
+
+        Returns:
+            Final job status
+        """
+        start_time = time.time()
+        interval = BULK_MIN_POLL_INTERVAL
+        last_status = None
+
+        while True:
+            job = self.get_bulk_search(job_id)
+            status = job.get("status")
+
+            if status != last_status:
+                print(f"Bulk job {job_id}: {status} ({int(time.time() - start_time)}s elapsed)")
+                last_status = status
+
+            if status == "completed":
+                return job
+            if status == "failed":
+                raise Exception(f"Bulk job {job_id} failed: {job.get('error', 'Unknown error')}")
+            if time.time() - start_time + interval > timeout:
+                raise TimeoutError(f"Bulk job {job_id} not done after {timeout} seconds")
+
+            time.sleep(interval)
+            interval = min(interval * 1.5, BULK_MAX_POLL_INTERVAL)
+
+    def iter_bulk_results(self, job_id: str) -> Iterator[Tuple[str, Optional[dict]]]:
+        """
+        Yield (domain, result) for every row of a completed bulk job.
+
+        result has the same shape as find_decision_maker's (None = no email).
+        """
+        rows = self._bulk_request(
+            "GET",
+            f"{BULK_URL}/{job_id}/download",
+            params={"download_as": "json_arr"},
+            timeout=(5, 300)
+        )
+        if isinstance(rows, dict):
+            rows = rows.get("results", [])
+
+        for row in rows:
+            domain = (row.get("domain") or "").lower()
+            if not domain:
+                continue
+            result = parse_decision_maker(row)
+            if result:
+                self._count("emails_found")
+            yield domain, result
+
+
+class AnyMailFinderKeyPool:
+    """
+    Drop-in replacement for AnyMailFinderClient that spreads lookups over
+    several API keys, each with its own rate limiter and circuit breaker.
+
+    Keys that come back 401 (invalid) or 402 (out of credits) are retired
+    and the lookup moves on to the next key. CircuitOpenError is raised only
+    once every key is retired. Counters add up across keys, so enrich_leads
+    and enrich_multiple_niches work unchanged.
+    """
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        transport: HttpTransport = None,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        backoff: BackoffPolicy = None
+    ):
+        """
+        Args:
+            api_keys: AnyMailFinder API keys (one per account)
+            transport: HTTP transport shared by all keys (default: get_transport())
+            rate_limit: Requests per second allowed PER KEY
+            backoff: Retry policy for 429/5xx/timeouts (default: BackoffPolicy())
+        """
+        if not api_keys:
+            raise ValueError("AnyMailFinderKeyPool needs at least one API key")
+
+        self.clients = [
+            AnyMailFinderClient(key, transport=transport, rate_limit=rate_limit, backoff=backoff)
+            for key in dict.fromkeys(api_keys)
+        ]
+        self._turn = count()
+        self._lock = threading.Lock()
+
+    def _live_clients(self) -> List[AnyMailFinderClient]:
+        return [c for c in self.clients if not c.circuit.is_open]
+
+    def _live_clients_or_raise(self) -> List[AnyMailFinderClient]:
+        live = self._live_clients()
+        if not live:
+            raise CircuitOpenError(f"AnyMailFinder: all {len(self.clients)} API keys retired")
+        return live
+
+    def _next_client(self) -> AnyMailFinderClient:
+        """Round-robin over keys that haven't been retired."""
+        live = self._live_clients_or_raise()
+        with self._lock:
+            return live[next(self._turn) % len(live)]
+
+    @property
+    def requests_made(self) -> int:
+        return sum(c.requests_made for c in self.clients)
+
+    @property
+    def emails_found(self) -> int:
+        return sum(c.emails_found for c in self.clients)
+
+    @property
+    def errors(self) -> int:
+        return sum(c.errors for c in self.clients)
+
+    @property
+    def rate_limiter(self):
+        """Combined view of the keys' limiters: live rate and total throttles."""
+        return SimpleNamespace(
+            rate=sum(c.rate_limiter.rate for c in self._live_clients()),
+            throttle_count=sum(c.rate_limiter.throttle_count for c in self.clients)
+        )
+
+    def find_decision_maker(self, domain: str, category: str = "ceo") -> Optional[dict]:
+        """Find decision-maker email for a domain (see AnyMailFinderClient)."""
+        return self.lookup(domain, category)[1]
+
+    def lookup(self, domain: str, category: str = "ceo") -> Tuple[str, Optional[dict]]:
+        """
+        AnyMailFinderClient.lookup on the next live key, moving on to
+        another key if this one gets retired mid-lookup.
+
+        Raises:
+            CircuitOpenError: Every key is invalid or out of credits
+        """
+        while True:
+            client = self._next_client()
+            try:
+                return client.lookup(domain, category)
+            except CircuitOpenError as e:
+                print(f"Retiring API key ...{client.api_key[-4:]}: {e} "
+                      f"({len(self._live_clients())} of {len(self.clients)} keys left)")
+
+    # Bulk jobs are tied to the key that submitted them: use the first live key
+    def submit_bulk_search(self, domains: List[str], category: str = "ceo", name: str = None) -> str:
+        return self._live_clients_or_raise()[0].submit_bulk_search(domains, category, name)
+
+    def get_bulk_search(self, job_id: str) -> dict:
+        return self._live_clients_or_raise()[0].get_bulk_search(job_id)
+
+    def wait_for_bulk_search(self, job_id: str, timeout: int = BULK_MAX_WAIT_SECONDS) -> dict:
+        return self._live_clients_or_raise()[0].wait_for_bulk_search(job_id, timeout)
+
+    def iter_bulk_results(self, job_id: str) -> Iterator[Tuple[str, Optional[dict]]]:
+        return self._live_clients_or_raise()[0].iter_bulk_results(job_id)
+
+
+class AsyncAnyMailFinderClient:
+    """
+    asyncio version of AnyMailFinderClient with the same methods, as coroutines.
+
+    Lookups from many niches can share one event loop. Every request waits
+    on the client's token bucket (rate_limit, throttled on 429), so gather()
+    as many lookups as you like without outrunning the account's limit;
+    in-flight requests are also capped by the AsyncHttpTransport.
+
+    Usage:
+        client = AsyncAnyMailFinderClient(api_key, rate_limit=1.0)
+        results = await asyncio.gather(*[client.find_decision_maker(d) for d in domains])
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        transport: AsyncHttpTransport = None,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        backoff: BackoffPolicy = None
+    ):
+        """
+        Args:
+            api_key: AnyMailFinder API key
+            transport: Async HTTP transport (default: shared get_async_transport())
+            rate_limit: Requests per second allowed for this account, shared
+                by every coroutine using the client
+            backoff: Retry policy for 429/5xx/timeouts (default: BackoffPolicy())
+        """
+        self.api_key = api_key
+        self.transport = transport
+        self.rate_limiter = TokenBucket(rate_limit)
+        self.backoff = backoff or BackoffPolicy()
+        self.circuit = CircuitBreaker("AnyMailFinder")
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        self.requests_made = 0
+        self.emails_found = 0
+        self.errors = 0
+
+    async def find_decision_maker(self, domain: str, category: str = "ceo") -> Optional[dict]:
+        """
+        Find decision-maker email for a domain (None if not found or no answer).
+
+        Raises:
+            CircuitOpenError: API key invalid or out of credits
+        """
+        return (await self.lookup(domain, category))[1]
+
+    async def lookup(self, domain: str, category: str = "ceo") -> Tuple[str, Optional[dict]]:
+        """
+        Like find_decision_maker, but also says why there is no result (see
+        AnyMailFinderClient.lookup for retry and circuit-breaker behaviour).
+
+        Returns:
+            (outcome, result) - outcome is LOOKUP_FOUND, LOOKUP_NOT_FOUND or
+            LOOKUP_ERROR
+        """
+        payload = {
+            "domain": domain,
+            "decision_maker_category": category
+        }
+        transport = self.transport or get_async_transport()
+        attempt = 0
+
+        while True:
+            self.circuit.check()
+
+            try:
+                await self.rate_limiter.acquire_async()
+                response = await transport.request(
+                    "POST",
+                    BASE_URL,
+                    headers=self.headers,
+                    json=payload,
+                    timeout=30
+                )
+            except (asyncio.TimeoutError, OSError) as e:
+                if self.backoff.should_retry(attempt):
+                    await asyncio.sleep(self.backoff.delay(attempt))
+                    attempt += 1
+                    continue
+                print(f"Timeout for {domain}" if isinstance(e, asyncio.TimeoutError) else f"Error for {domain}: {e}")
+                self.errors += 1
+                return LOOKUP_ERROR, None
+            except Exception as e:
+                print(f"Error for {domain}: {e}")
+                self.errors += 1
+                return LOOKUP_ERROR, None
 
             self.requests_made += 1
+            self.rate_limiter.update_from_headers(response.headers)
 
             if response.status_code == 200:
-                data = response.json()
-
-                # Check if email was found
-                email = data.get("email")
-                if email and "@" in email:
+                self.rate_limiter.success()
+                try:
+                    result = parse_decision_maker(response.json())
+                except ValueError as e:
+                    print(f"Error for {domain}: unreadable response ({e})")
+                    self.errors += 1
+                    return LOOKUP_ERROR, None
+                if result:
                     self.emails_found += 1
-                    return {
-                        "email": email,
-                        "full_name": data.get("personFullName", ""),
-                        "first_name": self._extract_first_name(data.get("personFullName", "")),
-                        "last_name": self._extract_last_name(data.get("personFullName", "")),
-                        "title": data.get("personJobTitle", ""),
-                        "linkedin_url": data.get("personLinkedinUrl", ""),
-                        "confidence": data.get("confidence", ""),
-                        "verification": data.get("verification", "")
-                    }
-                return None
-
-            elif response.status_code == 401:
-                print(f"ERROR: Invalid API key")
-                self.errors += 1
-                return None
+                    return LOOKUP_FOUND, result
+                return LOOKUP_NOT_FOUND, None
 
-            elif response.status_code == 402:
-                print(f"ERROR: Out of credits")
+            if response.status_code in (401, 402):
+                reason = "Invalid API key" if response.status_code == 401 else "Out of credits"
+                print(f"ERROR: {reason}")
                 self.errors += 1
-                return None
+                self.circuit.trip(reason)
+                self.circuit.check()
 
-            elif response.status_code == 429:
-                print(f"Rate limited - waiting 5 seconds...")
-                time.sleep(5)
-                return self.find_decision_maker(domain, category)  # Retry
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if response.status_code == 429:
+                # The bucket pauses for Retry-After itself; back off only without one
+                self.rate_limiter.throttle(retry_after)
+                print(f"Rate limited - slowing to {self.rate_limiter.rate:.2f} req/s")
 
-            else:
-                self.errors += 1
-                return None
+            if self.backoff.should_retry(attempt, response.status_code):
+                if response.status_code != 429 or retry_after is None:
+                    await asyncio.sleep(self.backoff.delay(attempt, retry_after))
+                attempt += 1
+                continue
 
-        except requests.exceptions.Timeout:
-            print(f"Timeout for {domain}")
             self.errors += 1
-            return None
+            return LOOKUP_ERROR, None
 
-        except Exception as e:
-            print(f"Error for {domain}: {e}")
-            self.errors += 1
-            return None
 
-    def _extract_first_name(self, full_name: str) -> str:
-        """Extract first name from full name."""
-        if not full_name:
-            return ""
-        parts = full_name.strip().split()
-        return parts[0] if parts else ""
+def parse_decision_maker(data: dict) -> Optional[dict]:
+    """Turn an AnyMailFinder response body into our result dict (None if no email)."""
+    email = data.get("email")
+    if not (email and "@" in email):
+        return None
 
-    def _extract_last_name(self, full_name: str) -> str:
-        """Extract last name from full name."""
-        if not full_name:
-            return ""
-        parts = full_name.strip().split()
-        return parts[-1] if len(parts) > 1 else ""
+    full_name = data.get("personFullName", "")
+    return {
+        "email": email,
+        "full_name": full_name,
+        "first_name": _extract_first_name(full_name),
+        "last_name": _extract_last_name(full_name),
+        "title": data.get("personJobTitle", ""),
+        "linkedin_url": data.get("personLinkedinUrl", ""),
+        "confidence": data.get("confidence", ""),
+        "verification": data.get("verification", "")
+    }
+
+
+def _extract_first_name(full_name: str) -> str:
+    """Extract first name from full name."""
+    if not full_name:
+        return ""
+    parts = full_name.strip().split()
+    return parts[0] if parts else ""
+
+
+def _extract_last_name(full_name: str) -> str:
+    """Extract last name from full name."""
+    if not full_name:
+        return ""
+    parts = full_name.strip().split()
+    return parts[-1] if len(parts) > 1 else ""
 
 
 # =============================================================================
@@ -170,48 +654,671 @@ def extract_domain(website: str) -> Optional[str]:
     return domain.lower() if domain else None
 
 
+# =============================================================================
+# DOMAIN FILTER
+# =============================================================================
+
+class DomainFilter:
+    """
+    Precompiled skip-list of domains that aren't worth an AnyMailFinder lookup.
+
+    Exact entries and "*." suffix entries live in dicts (domain -> entry
+    that matched), so a lookup is one dict probe per label of the domain.
+    All "re:" patterns are compiled into a single regex.
+
+    Usage:
+        skip = DomainFilter.load("user-workspace/skip-domains.txt")  # defaults + your file
+        skip.match("m.facebook.com")  # -> "*.facebook.com"
+        enrich_leads(client, input_file, output_file, domain_filter=skip)
+    """
+
+    def __init__(self, entries: List[str] = None, use_defaults: bool = True):
+        """
+        Args:
+            entries: Extra entries ("example.com", "*.example.com", "re:<regex>")
+            use_defaults: Include DEFAULT_SKIP_DOMAINS
+        """
+        self.exact = {}
+        self.suffixes = {}
+        patterns = []
+
+        for entry in (DEFAULT_SKIP_DOMAINS if use_defaults else []) + list(entries or []):
+            entry = entry.strip()
+            if not entry or entry.startswith("#"):
+                continue
+            if entry.startswith("re:"):
+                pattern = entry[3:]
+                re.compile(pattern)  # Fail on a bad entry, not inside the combined regex
+                patterns.append(pattern)
+            elif entry.startswith("*."):
+                self.suffixes[entry[2:].lower()] = entry
+            else:
+                self.exact[entry.lower()] = entry
+
+        self.patterns = patterns
+        self._regex = re.compile("|".join(f"(?:{p})" for p in patterns)) if patterns else None
+
+    @classmethod
+    def load(cls, path: str = None, use_defaults: bool = True) -> "DomainFilter":
+        """Defaults plus the entries in path (one per line, # comments), if it exists."""
+        entries = []
+        if path and os.path.exists(path):
+            with open(path, 'r') as f:
+                entries = f.read().splitlines()
+            print(f"Loaded skip list: {path}")
+        return cls(entries, use_defaults=use_defaults)
+
+    def match(self, domain: str) -> Optional[str]:
+        """The entry that filters this domain out, or None to look it up."""
+        if not domain:
+            return None
+        domain = domain.lower()
+
+        if domain in self.exact:
+            return self.exact[domain]
+
+        # "a.b.example.com" -> check "a.b.example.com", "b.example.com", "example.com", "com"
+        labels = domain.split(".")
+        for i in range(len(labels)):
+            entry = self.suffixes.get(".".join(labels[i:]))
+            if entry:
+                return entry
+
+        if self._regex and self._regex.search(domain):
+            return next(f"re:{p}" for p in self.patterns if re.search(p, domain))
+
+        return None
+
+    def __contains__(self, domain: str) -> bool:
+        return self.match(domain) is not None
+
+
+def _split_filtered(domains: List[str], domain_filter: Optional[DomainFilter]) -> Tuple[List[str], set]:
+    """Split domains into (kept, filtered) using domain_filter (None keeps all)."""
+    if domain_filter is None:
+        return list(domains), set()
+    filtered = {d for d in domains if d in domain_filter}
+    return [d for d in domains if d not in filtered], filtered
+
+
 # =============================================================================
 # PROGRESS TRACKING
 # =============================================================================
 
+class ProgressJournal:
+    """
+    Append-only enrichment checkpoint in JSON Lines format.
+
+    Each lookup is one line, {"domain": ..., "result": {...}}, appended and
+    fsync'd as soon as it finishes. A checkpoint is therefore one small
+    durable write instead of a rewrite of every processed domain. Resume
+    replays the lines, and the last line for a domain wins.
+
+    A kill mid-write can at worst leave a truncated final line. load()
+    drops it (and trims it off the file) with a warning instead of losing
+    the whole checkpoint.
+
+    Usage:
+        journal = ProgressJournal("hvac-leads-progress.jsonl")
+        processed = journal.load()
+        journal.record("acmehvac.com", {"email": None})
+        journal.close()
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.bulk_job_id = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, dict]:
+        """
+        Replay the journal into {domain: result}.
+
+        Also sets bulk_job_id to a submitted bulk job that hasn't finished
+        downloading, so a resumed run can reattach instead of resubmitting.
+        """
+        processed = {}
+        self.bulk_job_id = None
+        if not os.path.exists(self.path):
+            return processed
+
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+
+        # Anything after the last newline is a write that never completed
+        complete = raw[:raw.rfind(b"\n") + 1]
+        if len(complete) < len(raw):
+            print(f"WARNING: Dropping incomplete last entry in {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(len(complete))
+
+        for line_number, line in enumerate(complete.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                if "bulk_job" in entry:
+                    done = entry["status"] == "done"
+                    self.bulk_job_id = None if done else entry["bulk_job"]
+                    continue
+                processed[entry["domain"]] = entry["result"]
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"WARNING: Skipping unreadable entry {line_number} in {self.path}: {e}")
+
+        return processed
+
+    def record(self, domain: str, result: dict):
+        """Durably append one lookup result."""
+        self._append({"domain": domain, "result": result})
+
+    def record_bulk_job(self, job_id: str, status: str):
+        """Durably note a bulk job as "submitted" or "done"."""
+        self._append({"bulk_job": job_id, "status": status})
+
+    def _append(self, entry: dict):
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a')
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def remove(self):
+        """Delete the journal (after a successful run)."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _read_legacy_progress(progress_file: str) -> Optional[Dict[str, dict]]:
+    """
+    processed_domains from an old single-JSON progress file.
+
+    Returns None if the file is missing or is already a journal.
+    """
+    if not os.path.exists(progress_file):
+        return None
+
+    with open(progress_file, 'r') as f:
+        content = f.read()
+
+    try:
+        legacy = json.loads(content)
+    except ValueError as e:
+        if content.startswith("{\n"):  # Indented JSON cut off mid-write
+            print(f"WARNING: Progress file {progress_file} is corrupt ({e}) - starting over")
+            return {}
+        return None
+
+    if isinstance(legacy, dict) and "processed_domains" in legacy:
+        return legacy["processed_domains"]
+    return None
+
+
+def _upgrade_legacy_progress(legacy_file: str, journal_file: str):
+    """Rewrite a checkpoint from an older version as a journal."""
+    if legacy_file != journal_file and os.path.exists(journal_file):
+        return
+
+    processed = _read_legacy_progress(legacy_file)
+    if processed is None:
+        return
+
+    save_progress(journal_file, {"processed_domains": processed})
+    if legacy_file != journal_file:
+        os.remove(legacy_file)
+
+
 def load_progress(progress_file: str) -> dict:
-    """Load progress from checkpoint file."""
-    if os.path.exists(progress_file):
-        try:
-            with open(progress_file, 'r') as f:
-                return json.load(f)
-        except:
-            pass
-    return {"processed_domains": {}, "last_index": 0}
+    """
+    Load progress from a checkpoint file.
+
+    Reads the JSONL journal, or a legacy single-JSON progress file from
+    older versions. Returns {"processed_domains": {domain: result}}.
+    """
+    processed = _read_legacy_progress(progress_file)
+    if processed is None:
+        processed = ProgressJournal(progress_file).load()
+    return {"processed_domains": processed}
 
 
 def save_progress(progress_file: str, progress: dict):
-    """Save progress to checkpoint file."""
-    with open(progress_file, 'w') as f:
-        json.dump(progress, f, indent=2)
+    """
+    Write a compacted journal (one line per domain) atomically.
+
+    The new file is written beside the old one and swapped in with
+    os.replace, so a crash leaves either the old or the new checkpoint.
+    """
+    tmp_file = f"{progress_file}.tmp"
+    with open(tmp_file, 'w') as f:
+        for domain, result in progress.get("processed_domains", {}).items():
+            f.write(json.dumps({"domain": domain, "result": result}) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, progress_file)
+
+
+# =============================================================================
+# DOMAIN CACHE
+# =============================================================================
+
+class DomainCache:
+    """
+    Persistent domain -> decision-maker cache shared across niches and runs.
+
+    Backed by SQLite (WAL mode), so it survives enrich_leads cleaning up its
+    progress journal, and the same company appearing in several niche
+    scrapes, or next month's re-scrape, is looked up once. Found results
+    live for ttl_days. "No email found" answers are cached too, for the
+    shorter negative_ttl_days. Errors are never cached.
+
+    Usage:
+        cache = DomainCache("user-workspace/.cache/anymailfinder-domains.sqlite")
+        enrich_leads(client, input_file, output_file, domain_cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_days: float = CACHE_TTL_DAYS,
+        negative_ttl_days: float = NEGATIVE_CACHE_TTL_DAYS
+    ):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.negative_ttl = negative_ttl_days * 86400
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS domains ("
+            "domain TEXT PRIMARY KEY, result TEXT, found INTEGER, cached_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, domain: str) -> Optional[dict]:
+        """
+        Cached result for a domain, or None on a miss / expired entry.
+
+        A cached "no email found" comes back as {"email": None}.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, found, cached_at FROM domains WHERE domain = ?", (domain,)
+            ).fetchone()
+
+            if row is not None:
+                result, found, cached_at = row
+                ttl = self.ttl if found else self.negative_ttl
+                if time.time() - cached_at < ttl:
+                    if found:
+                        self.hits += 1
+                        return json.loads(result)
+                    self.negative_hits += 1
+                    return {"email": None}
+
+            self.misses += 1
+            return None
+
+    def put(self, domain: str, result: Optional[dict]):
+        """Cache a found result, or a "no email found" answer if result is None."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO domains VALUES (?, ?, ?, ?)",
+                (domain, json.dumps(result) if result else None, 1 if result else 0, time.time())
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        return {
+            "cache_hits": self.hits,
+            "cache_negative_hits": self.negative_hits,
+            "cache_misses": self.misses
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class EnrichmentQueue:
+    """
+    SQLite work queue of domains shared by several enrichment workers.
+
+    Workers claim small batches under a lease and renew it with heartbeats
+    while they work. If a worker crashes, its lease runs out and another
+    worker picks the batch up again. Results, and each worker's API
+    counters, are written back into the same file for the final merge.
+
+    Uses SQLite's rollback journal (not WAL), so the file also works for
+    workers on different machines sharing a volume, provided the volume
+    supports file locking.
+
+    Usage:
+        prepare_enrichment_queue("user-workspace/hvac-leads.json")
+        run_enrichment_worker(client, "user-workspace/hvac-leads-queue.sqlite")  # in N processes
+        merge_enrichment_queue("user-workspace/hvac-leads.json", "user-workspace/hvac-enriched.json")
+    """
+
+    def __init__(self, path: str, lease_seconds: float = QUEUE_LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "domain TEXT PRIMARY KEY, status TEXT NOT NULL DEFAULT 'pending', worker TEXT, "
+            "lease_expires REAL, attempts INTEGER NOT NULL DEFAULT 0, outcome TEXT, result TEXT);"
+            "CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_expires);"
+            "CREATE TABLE IF NOT EXISTS workers ("
+            "worker TEXT PRIMARY KEY, api_requests INTEGER, emails_found INTEGER, "
+            "errors INTEGER, rate_limited INTEGER, updated_at REAL);"
+        )
+
+    def _transaction(self, fn):
+        """Run fn(conn) inside BEGIN IMMEDIATE ... COMMIT (one writer at a time)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def add(self, domains: List[str]) -> int:
+        """Queue domains (already-queued ones are ignored). Returns how many were new."""
+        def insert(conn):
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO tasks (domain) VALUES (?)", [(d,) for d in domains])
+            return conn.total_changes - before
+        return self._transaction(insert)
+
+    def complete(self, domain: str, outcome: str, result: Optional[dict]):
+        """
+        Store a lookup result. LOOKUP_ERROR puts the domain back in the
+        queue until it has been tried QUEUE_MAX_ATTEMPTS times.
+        """
+        def update(conn):
+            retry = outcome == LOOKUP_ERROR
+            conn.execute(
+                "UPDATE tasks SET status = CASE WHEN ? AND attempts < ? THEN 'pending' ELSE 'done' END, "
+                "worker = NULL, lease_expires = NULL, outcome = ?, result = ? "
+                "WHERE domain = ? AND status != 'done'",
+                (retry, QUEUE_MAX_ATTEMPTS, outcome, json.dumps(result) if result else None, domain)
+            )
+        self._transaction(update)
+
+    def claim(self, worker: str, limit: int = QUEUE_BATCH_SIZE) -> List[str]:
+        """Lease up to limit pending (or expired) domains to a worker."""
+        def lease(conn):
+            now = time.time()
+            rows = conn.execute(
+                "SELECT domain, status FROM tasks WHERE status = 'pending' "
+                "OR (status = 'leased' AND lease_expires < ?) LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            expired = sum(1 for _, status in rows if status == "leased")
+            if expired:
+                print(f"[{worker}] Reclaiming {expired} domains from an expired lease")
+            conn.executemany(
+                "UPDATE tasks SET status = 'leased', worker = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE domain = ?",
+                [(worker, now + self.lease_seconds, domain) for domain, _ in rows]
+            )
+            return [domain for domain, _ in rows]
+        return self._transaction(lease)
+
+    def heartbeat(self, worker: str):
+        """Extend the lease on everything this worker holds."""
+        self._transaction(lambda conn: conn.execute(
+            "UPDATE tasks SET lease_expires = ? WHERE status = 'leased' AND worker = ?",
+            (time.time() + self.lease_seconds, worker)
+        ))
+
+    def release(self, worker: str):
+        """Hand this worker's unfinished domains back to the queue right away."""
+        self._transaction(lambda conn: conn.execute(
+            "UPDATE tasks SET status = 'pending', worker = NULL, lease_expires = NULL, "
+            "attempts = MAX(attempts - 1, 0) WHERE status = 'leased' AND worker = ?",
+            (worker,)
+        ))
+
+    def record_worker_stats(self, worker: str, stats: dict):
+        """Save a worker's API counters (summed into enrichment_stats by the merge)."""
+        self._transaction(lambda conn: conn.execute(
+            "INSERT OR REPLACE INTO workers VALUES (?, ?, ?, ?, ?, ?)",
+            (worker, stats["api_requests"], stats["emails_found"], stats["errors"],
+             stats["rate_limited"], time.time())
+        ))
+
+    def worker_stats(self) -> dict:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(api_requests), 0), COALESCE(SUM(emails_found), 0), "
+                "COALESCE(SUM(errors), 0), COALESCE(SUM(rate_limited), 0) FROM workers"
+            ).fetchone()
+        return dict(zip(("api_requests", "emails_found", "errors", "rate_limited"), row))
+
+    def counts(self) -> dict:
+        """Number of domains per status: pending, leased, done."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        return {"pending": 0, "leased": 0, "done": 0, **dict(rows)}
+
+    def results(self) -> Dict[str, dict]:
+        """{domain: result} for finished domains (no email => {"email": None})."""
+        with self._lock:
+            rows = self._conn.execute("SELECT domain, result FROM tasks WHERE status = 'done'").fetchall()
+        return {domain: json.loads(result) if result else {"email": None} for domain, result in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def remove(self):
+        self.close()
+        for suffix in ("", "-journal"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
 
 
 # =============================================================================
 # MAIN ENRICHMENT FUNCTION
 # =============================================================================
 
+def _lookup_domains(
+    client: AnyMailFinderClient,
+    domains: List[str],
+    workers: int = 1
+) -> Iterator[Tuple[str, str, Optional[dict]]]:
+    """
+    Yield (domain, outcome, result) for each domain as its lookup finishes.
+
+    With workers > 1, lookups run on a thread pool (pacing comes from the
+    client's shared rate limiter). Only a small window of lookups is queued
+    at a time, so a caller that stops iterating doesn't leave hundreds of
+    paid requests in flight.
+    """
+    if workers <= 1:
+        for domain in domains:
+            yield (domain, *client.lookup(domain))
+        return
+
+    queue = deque(domains)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight = {}
+        try:
+            while queue or in_flight:
+                while queue and len(in_flight) < workers * 2:
+                    domain = queue.popleft()
+                    in_flight[executor.submit(client.lookup, domain)] = domain
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield (in_flight.pop(future), *future.result())
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def _bulk_lookup_domains(
+    client: AnyMailFinderClient,
+    domains: List[str],
+    journal: ProgressJournal,
+    name: str = None
+) -> Iterator[Tuple[str, str, Optional[dict]]]:
+    """
+    Bulk-mode counterpart of _lookup_domains: one job for all domains.
+
+    The job ID is journaled before waiting, so an interrupted run reattaches
+    to the same job (journal.bulk_job_id) instead of paying for a new one.
+    Domains missing from the job's results come back as LOOKUP_ERROR.
+    """
+    if not domains:
+        return
+
+    job_id = journal.bulk_job_id
+    if job_id:
+        print(f"Reattaching to bulk job: {job_id}")
+    else:
+        job_id = client.submit_bulk_search(domains, name=name)
+        journal.record_bulk_job(job_id, "submitted")
+
+    client.wait_for_bulk_search(job_id)
+
+    remaining = set(domains)
+    for domain, result in client.iter_bulk_results(job_id):
+        if domain in remaining:
+            remaining.discard(domain)
+            yield domain, LOOKUP_FOUND if result else LOOKUP_NOT_FOUND, result
+
+    for domain in domains:
+        if domain in remaining:
+            yield domain, LOOKUP_ERROR, None
+
+    journal.record_bulk_job(job_id, "done")
+
+
+def _write_enriched_output(
+    data: dict,
+    processed_domains: Dict[str, dict],
+    input_file: str,
+    output_file: str,
+    enrichment_stats: dict
+) -> dict:
+    """
+    Apply {domain: result} to the leads file's leads and write {niche}-enriched.json.
+
+    Returns:
+        The output data that was written
+    """
+    # Apply results to leads (same domain => same decision maker)
+    enriched_leads = []
+    emails_found = 0
+
+    for lead in data.get("leads", []):
+        domain = _lead_domain(lead)
+        result = processed_domains.get(domain) if domain else None
+
+        if result and result.get("email"):
+            lead["email"] = result["email"]
+            lead["first_name"] = result.get("first_name", "")
+            lead["last_name"] = result.get("last_name", "")
+            lead["decision_maker_title"] = result.get("title", "")
+            lead["linkedin_url"] = result.get("linkedin_url", "")
+            emails_found += 1
+
+        enriched_leads.append(lead)
+
+    print()
+    print(f"Enrichment complete!")
+    print(f"Total leads: {len(enriched_leads)}")
+    print(f"Total emails found: {emails_found}")
+
+    output_data = {
+        "niche": data.get("niche", ""),
+        "location": data.get("location", ""),
+        "total_leads": len(enriched_leads),
+        "emails_found": emails_found,
+        "find_rate": f"{emails_found/max(len(enriched_leads),1)*100:.1f}%",
+        "enriched_at": datetime.now().isoformat(),
+        "source_file": input_file,
+        "leads": enriched_leads,
+        "enrichment_stats": enrichment_stats
+    }
+
+    with open(output_file, 'w') as f:
+        json.dump(output_data, f, indent=2)
+
+    return output_data
+
+
+def _lead_domain(lead: dict) -> Optional[str]:
+    """A lead's domain, lowercased (the key for journals, caches and bulk results)."""
+    domain = lead.get("domain") or extract_domain(lead.get("website", ""))
+    return domain.strip().lower() if domain else None
+
+
+def _lead_domains(leads: List[dict]) -> List[str]:
+    """Unique lead domains, in lead order."""
+    domains = (_lead_domain(lead) for lead in leads)
+    return list(dict.fromkeys(d for d in domains if d))
+
+
 def enrich_leads(
     client: AnyMailFinderClient,
     input_file: str,
     output_file: str,
-    progress_file: str = None
+    progress_file: str = None,
+    workers: int = 1,
+    domain_cache: DomainCache = None,
+    use_cache: bool = True,
+    bulk: bool = False,
+    domain_filter: DomainFilter = None,
+    use_filter: bool = True
 ) -> dict:
     """
     Enrich leads with decision-maker emails.
 
     Args:
-        client: AnyMailFinderClient instance
+        client: AnyMailFinderClient instance (its rate_limit paces all lookups)
         input_file: Path to leads JSON file (from Apify scraper)
         output_file: Path to save enriched leads
         progress_file: Path to checkpoint file (auto-generated if None)
+        workers: Concurrent lookups (e.g. ENRICH_WORKERS). Raise the client's
+            rate_limit to match your account, or extra workers just queue.
+        domain_cache: Shared DomainCache (default: DOMAIN_CACHE_FILE next to
+            input_file)
+        use_cache: Set False to skip the domain cache entirely
+        bulk: Submit all pending domains as one AnyMailFinder bulk job and
+            stream its results back (workers is ignored)
+        domain_filter: DomainFilter of domains to skip (default: DEFAULT_SKIP_DOMAINS
+            plus SKIP_DOMAINS_FILE next to input_file)
+        use_filter: Set False to look up every domain
 
     Returns:
         Enrichment stats
+
+    Raises:
+        CircuitOpenError: AnyMailFinder rejected the key or ran out of credits.
+            Every finished lookup is already journaled, so re-running resumes.
     """
     # Load input leads
     print(f"Loading leads from: {input_file}")
@@ -222,120 +1329,130 @@ def enrich_leads(
     total_leads = len(leads)
     print(f"Total leads to process: {total_leads}")
 
-    # Set up progress file
+    # Set up progress journal
     if progress_file is None:
-        progress_file = input_file.replace(".json", "-progress.json")
+        progress_file = input_file.replace(".json", "-progress.jsonl")
+        _upgrade_legacy_progress(input_file.replace(".json", "-progress.json"), progress_file)
+    else:
+        _upgrade_legacy_progress(progress_file, progress_file)
 
     # Load existing progress
-    progress = load_progress(progress_file)
-    processed_domains = progress.get("processed_domains", {})
-    start_index = progress.get("last_index", 0)
+    journal = ProgressJournal(progress_file)
+    processed_domains = journal.load()
 
-    print(f"Resuming from index: {start_index}")
     print(f"Previously processed: {len(processed_domains)} domains")
     print(f"Previously found: {sum(1 for v in processed_domains.values() if v.get('email'))} emails")
     print()
 
-    # Process each lead
-    enriched_leads = []
-    emails_found = 0
-    domains_processed = 0
-
-    for i, lead in enumerate(leads):
-        # Get domain
-        domain = lead.get("domain") or extract_domain(lead.get("website", ""))
-
-        if not domain:
-            # No domain - keep lead as-is
-            enriched_leads.append(lead)
-            continue
-
-        # Check if already processed
-        if domain in processed_domains:
-            # Use cached result
-            cached = processed_domains[domain]
-            if cached.get("email"):
-                lead["email"] = cached["email"]
-                lead["first_name"] = cached.get("first_name", "")
-                lead["last_name"] = cached.get("last_name", "")
-                lead["decision_maker_title"] = cached.get("title", "")
-                emails_found += 1
-            enriched_leads.append(lead)
-            continue
-
-        # Skip if before resume point
-        if i < start_index:
-            enriched_leads.append(lead)
-            continue
-
-        # Call AnyMailFinder API
-        domains_processed += 1
-        result = client.find_decision_maker(domain)
-
-        # Store result (even if None, to avoid re-processing)
-        processed_domains[domain] = result or {"email": None}
-
-        if result:
-            lead["email"] = result["email"]
-            lead["first_name"] = result["first_name"]
-            lead["last_name"] = result["last_name"]
-            lead["decision_maker_title"] = result["title"]
-            lead["linkedin_url"] = result.get("linkedin_url", "")
-            emails_found += 1
-
-            # Save progress immediately after finding an email
-            progress["processed_domains"] = processed_domains
-            progress["last_index"] = i + 1
-            save_progress(progress_file, progress)
-
-        enriched_leads.append(lead)
-
-        # Progress update every 10 leads
-        if domains_processed % 10 == 0:
-            print(f"Progress: {i+1}/{total_leads} | Domains checked: {domains_processed} | Emails found: {emails_found} | Rate: {emails_found/max(domains_processed,1)*100:.1f}%")
+    # Unique domains that still need a lookup, in lead order
+    pending = [d for d in _lead_domains(leads) if d not in processed_domains]
+
+    # Skip profile pages, site builders and franchises before they cost a credit
+    filter_stats = {"filtered_domains": 0, "filtered_leads": 0}
+    if use_filter:
+        if domain_filter is None:
+            domain_filter = DomainFilter.load(os.path.join(os.path.dirname(input_file), SKIP_DOMAINS_FILE))
+        pending, filtered = _split_filtered(pending, domain_filter)
+        filter_stats = {
+            "filtered_domains": len(filtered),
+            "filtered_leads": sum(
+                1 for lead in leads
+                if _lead_domain(lead) in filtered
+            )
+        }
+        print(f"Domain filter: skipping {filter_stats['filtered_domains']} domains "
+              f"({filter_stats['filtered_leads']} leads)")
+
+    # Answer what we can from the long-lived domain cache
+    owns_cache = use_cache and domain_cache is None
+    if owns_cache:
+        domain_cache = DomainCache(os.path.join(os.path.dirname(input_file), DOMAIN_CACHE_FILE))
+    cache_stats = {"cache_hits": 0, "cache_negative_hits": 0, "cache_misses": 0}
+
+    if use_cache:
+        before = domain_cache.stats()
+        uncached = []
+        for domain in pending:
+            cached = domain_cache.get(domain)
+            if cached is None:
+                uncached.append(domain)
+            else:
+                processed_domains[domain] = cached
+        cache_stats = {k: v - before[k] for k, v in domain_cache.stats().items()}
+        print(f"Domain cache: {cache_stats['cache_hits']} hits, "
+              f"{cache_stats['cache_negative_hits']} known no-email, {cache_stats['cache_misses']} misses")
+        pending = uncached
 
-            # Save progress periodically
-            progress["processed_domains"] = processed_domains
-            progress["last_index"] = i + 1
-            save_progress(progress_file, progress)
 
-        # Rate limiting
-        time.sleep(REQUEST_DELAY)
+    # Call AnyMailFinder API
+    domains_processed = 0
+    new_emails = 0
+    failed_domains = 0
+
+    if bulk:
+        print(f"Domains to look up: {len(pending)} (bulk job)")
+        lookups = _bulk_lookup_domains(client, pending, journal, name=os.path.basename(input_file))
+    else:
+        print(f"Domains to look up: {len(pending)} ({workers} worker{'s' if workers != 1 else ''}, "
+              f"{client.rate_limiter.rate:g} req/s)")
+        lookups = _lookup_domains(client, pending, workers)
+
+    try:
+        for domain, outcome, result in lookups:
+            domains_processed += 1
+
+            # No answer (timeouts, retries exhausted): leave it pending so a
+            # re-run looks it up again instead of recording "no email"
+            if outcome == LOOKUP_ERROR:
+                failed_domains += 1
+                continue
+
+            # Store result (even if None, to avoid re-processing)
+            processed_domains[domain] = result or {"email": None}
+            journal.record(domain, processed_domains[domain])
+            if use_cache:
+                domain_cache.put(domain, result)
+
+            if result:
+                new_emails += 1
+
+            # Progress update every PROGRESS_INTERVAL domains
+            if domains_processed % PROGRESS_INTERVAL == 0:
+                print(f"Progress: {domains_processed}/{len(pending)} domains | Emails found: {new_emails} | Rate: {new_emails/max(domains_processed,1)*100:.1f}%")
+    except CircuitOpenError as e:
+        print(f"\nSTOPPED: {e}")
+        print(f"Progress saved to {progress_file} - fix the account and re-run to resume.")
+        raise
+    finally:
+        journal.close()
+        if owns_cache:
+            domain_cache.close()
 
     # Final save
-    print()
-    print(f"Enrichment complete!")
-    print(f"Total leads: {total_leads}")
-    print(f"Domains processed this run: {domains_processed}")
-    print(f"Total emails found: {emails_found}")
-    print(f"Find rate: {emails_found/max(domains_processed,1)*100:.1f}%")
-
-    # Build output data
-    output_data = {
-        "niche": data.get("niche", ""),
-        "location": data.get("location", ""),
-        "total_leads": len(enriched_leads),
-        "emails_found": emails_found,
-        "find_rate": f"{emails_found/max(len(enriched_leads),1)*100:.1f}%",
-        "enriched_at": datetime.now().isoformat(),
-        "source_file": input_file,
-        "leads": enriched_leads,
-        "enrichment_stats": {
+    output_data = _write_enriched_output(
+        data,
+        processed_domains,
+        input_file,
+        output_file,
+        enrichment_stats={
             "api_requests": client.requests_made,
             "emails_found": client.emails_found,
-            "errors": client.errors
+            "errors": client.errors,
+            "rate_limited": client.rate_limiter.throttle_count,
+            **cache_stats,
+            **filter_stats
         }
-    }
-
-    # Save enriched leads
-    with open(output_file, 'w') as f:
-        json.dump(output_data, f, indent=2)
-
+    )
+    print(f"Domains processed this run: {domains_processed}")
+    print(f"Find rate this run: {new_emails/max(domains_processed,1)*100:.1f}%")
     print(f"Saved to: {output_file}")
 
-    # Clean up progress file on successful completion
-    if os.path.exists(progress_file):
-        os.remove(progress_file)
+    # Clean up progress journal on successful completion (kept if any
+    # lookups failed, so a re-run retries just those)
+    if failed_domains:
+        print(f"{failed_domains} domains got no answer - re-run to retry them (progress kept in {progress_file})")
+    elif os.path.exists(progress_file):
+        journal.remove()
         print(f"Cleaned up progress file")
 
     return output_data
@@ -344,7 +1461,13 @@ def enrich_leads(
 def enrich_multiple_niches(
     client: AnyMailFinderClient,
     input_files: List[str],
-    output_dir: str = None
+    output_dir: str = None,
+    workers: int = 1,
+    domain_cache: DomainCache = None,
+    use_cache: bool = True,
+    bulk: bool = False,
+    domain_filter: DomainFilter = None,
+    use_filter: bool = True
 ) -> List[dict]:
     """
     Enrich leads for multiple niches.
@@ -353,12 +1476,27 @@ def enrich_multiple_niches(
         client: AnyMailFinderClient instance
         input_files: List of paths to leads JSON files
         output_dir: Directory for output files (defaults to same as input)
+        workers: Concurrent lookups per file (see enrich_leads)
+        domain_cache: DomainCache shared by every file (default: DOMAIN_CACHE_FILE
+            next to the first input file)
+        use_cache: Set False to skip the domain cache entirely
+        bulk: One bulk job per file instead of per-domain calls
+        domain_filter: DomainFilter shared by every file (default: DEFAULT_SKIP_DOMAINS
+            plus SKIP_DOMAINS_FILE next to the first input file)
+        use_filter: Set False to look up every domain
 
     Returns:
         List of enrichment results
     """
     results = []
 
+    owns_cache = use_cache and domain_cache is None and bool(input_files)
+    if owns_cache:
+        domain_cache = DomainCache(os.path.join(os.path.dirname(input_files[0]), DOMAIN_CACHE_FILE))
+
+    if use_filter and domain_filter is None and input_files:
+        domain_filter = DomainFilter.load(os.path.join(os.path.dirname(input_files[0]), SKIP_DOMAINS_FILE))
+
     for i, input_file in enumerate(input_files, 1):
         print(f"\n{'='*60}")
         print(f"[{i}/{len(input_files)}] Enriching: {input_file}")
@@ -372,12 +1510,31 @@ def enrich_multiple_niches(
             output_file = input_file.replace("-leads.json", "-enriched.json")
 
         try:
-            result = enrich_leads(client, input_file, output_file)
+            result = enrich_leads(
+                client,
+                input_file,
+                output_file,
+                workers=workers,
+                domain_cache=domain_cache,
+                use_cache=use_cache,
+                bulk=bulk,
+                domain_filter=domain_filter,
+                use_filter=use_filter
+            )
             results.append(result)
+        except CircuitOpenError as e:
+            # Fatal for every remaining file too - stop instead of burning time
+            results.append({"error": str(e), "file": input_file})
+            for skipped in input_files[i:]:
+                results.append({"error": "Skipped - run stopped", "file": skipped})
+            break
         except Exception as e:
             print(f"ERROR enriching {input_file}: {e}")
             results.append({"error": str(e), "file": input_file})
 
+    if owns_cache:
+        domain_cache.close()
+
     # Summary
     print(f"\n{'='*60}")
     print("ENRICHMENT SUMMARY")
@@ -396,6 +1553,229 @@ def enrich_multiple_niches(
     return results
 
 
+# =============================================================================
+# MULTI-PROCESS ENRICHMENT (WORK QUEUE)
+# =============================================================================
+
+def _queue_file_for(input_file: str) -> str:
+    return input_file.replace(".json", "-queue.sqlite")
+
+
+def prepare_enrichment_queue(
+    input_file: str,
+    queue_file: str = None,
+    domain_cache: DomainCache = None,
+    use_cache: bool = True,
+    domain_filter: DomainFilter = None,
+    use_filter: bool = True
+) -> str:
+    """
+    Load a leads file's unique domains into an EnrichmentQueue.
+
+    Domains the domain cache already knows are stored as finished, so
+    workers only see real lookups. Safe to run again: queued domains are
+    left alone.
+
+    Args:
+        input_file: Path to leads JSON file
+        queue_file: Queue path (default: {input}-queue.sqlite)
+        domain_cache: Optional shared DomainCache instance
+        use_cache: Set False to skip the domain cache entirely
+        domain_filter: DomainFilter of domains to leave out of the queue
+            (default: DEFAULT_SKIP_DOMAINS plus SKIP_DOMAINS_FILE)
+        use_filter: Set False to queue every domain
+
+    Returns:
+        Path to the queue file
+    """
+    queue_file = queue_file or _queue_file_for(input_file)
+
+    with open(input_file, 'r') as f:
+        domains = _lead_domains(json.load(f).get("leads", []))
+
+    if use_filter:
+        if domain_filter is None:
+            domain_filter = DomainFilter.load(os.path.join(os.path.dirname(input_file), SKIP_DOMAINS_FILE))
+        domains, filtered = _split_filtered(domains, domain_filter)
+        print(f"Domain filter: skipping {len(filtered)} domains")
+
+    owns_cache = use_cache and domain_cache is None
+    if owns_cache:
+        domain_cache = DomainCache(os.path.join(os.path.dirname(input_file), DOMAIN_CACHE_FILE))
+
+    queue = EnrichmentQueue(queue_file)
+    try:
+        added = queue.add(domains)
+        if use_cache:
+            for domain in domains:
+                cached = domain_cache.get(domain)
+                if cached is not None:
+                    outcome = LOOKUP_FOUND if cached.get("email") else LOOKUP_NOT_FOUND
+                    queue.complete(domain, outcome, cached if cached.get("email") else None)
+        counts = queue.counts()
+    finally:
+        queue.close()
+        if owns_cache:
+            domain_cache.close()
+
+    print(f"Queue ready: {queue_file}")
+    print(f"Domains: {len(domains)} ({added} new) | To look up: {counts['pending'] + counts['leased']} | "
+          f"Done: {counts['done']}")
+    return queue_file
+
+
+def run_enrichment_worker(
+    client: AnyMailFinderClient,
+    queue_file: str,
+    worker_id: str = None,
+    workers: int = 1,
+    batch_size: int = QUEUE_BATCH_SIZE,
+    lease_seconds: float = QUEUE_LEASE_SECONDS,
+    domain_cache: DomainCache = None,
+    use_cache: bool = True
+) -> dict:
+    """
+    Pull domains from an EnrichmentQueue and look them up until it's drained.
+
+    Run one of these per process (or machine). Each claimed batch is kept
+    alive by a heartbeat thread; if the process dies, the batch is handed to
+    another worker once the lease expires. A worker with nothing left to
+    claim keeps polling while other workers still hold leases, so it can
+    take over work from a crashed one.
+
+    Args:
+        client: AnyMailFinderClient (or AnyMailFinderKeyPool) for this process
+        queue_file: Path from prepare_enrichment_queue
+        worker_id: Name for this worker (default: hostname-pid)
+        workers: Concurrent lookups inside this process
+        batch_size: Domains claimed per lease
+        lease_seconds: Lease length before an un-renewed batch is reclaimed
+        domain_cache: Optional shared DomainCache instance
+        use_cache: Set False to skip writing results to the domain cache
+
+    Returns:
+        This worker's stats
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    queue = EnrichmentQueue(queue_file, lease_seconds=lease_seconds)
+
+    owns_cache = use_cache and domain_cache is None
+    if owns_cache:
+        domain_cache = DomainCache(os.path.join(os.path.dirname(queue_file), DOMAIN_CACHE_FILE))
+
+    start = (client.requests_made, client.emails_found, client.errors, client.rate_limiter.throttle_count)
+    domains_processed = 0
+    new_emails = 0
+
+    stop_heartbeat = threading.Event()
+
+    def heartbeat():
+        while not stop_heartbeat.wait(lease_seconds / 3):
+            try:
+                queue.heartbeat(worker_id)
+            except sqlite3.Error as e:
+                print(f"[{worker_id}] Heartbeat failed: {e}")
+
+    heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
+    heartbeat_thread.start()
+    print(f"[{worker_id}] Worker started on {queue_file}")
+
+    try:
+        while True:
+            batch = queue.claim(worker_id, batch_size)
+            if not batch:
+                if queue.counts()["leased"] == 0:
+                    break
+                time.sleep(QUEUE_IDLE_POLL)
+                continue
+
+            for domain, outcome, result in _lookup_domains(client, batch, workers):
+                queue.complete(domain, outcome, result)
+                if use_cache and outcome != LOOKUP_ERROR:
+                    domain_cache.put(domain, result)
+                domains_processed += 1
+                if result:
+                    new_emails += 1
+
+            counts = queue.counts()
+            print(f"[{worker_id}] Processed: {domains_processed} | Emails found: {new_emails} | "
+                  f"Queue: {counts['pending']} pending, {counts['leased']} leased, {counts['done']} done")
+    finally:
+        stop_heartbeat.set()
+        heartbeat_thread.join()
+        try:
+            queue.release(worker_id)
+            stats = {
+                "api_requests": client.requests_made - start[0],
+                "emails_found": client.emails_found - start[1],
+                "errors": client.errors - start[2],
+                "rate_limited": client.rate_limiter.throttle_count - start[3]
+            }
+            queue.record_worker_stats(worker_id, stats)
+        finally:
+            queue.close()
+            if owns_cache:
+                domain_cache.close()
+
+    print(f"[{worker_id}] Queue drained - {domains_processed} domains, {new_emails} emails")
+    return {"worker": worker_id, "domains_processed": domains_processed, **stats}
+
+
+def merge_enrichment_queue(
+    input_file: str,
+    output_file: str,
+    queue_file: str = None,
+    allow_partial: bool = False
+) -> dict:
+    """
+    Write {niche}-enriched.json from a drained EnrichmentQueue.
+
+    Produces the same output as enrich_leads; enrichment_stats add up every
+    worker's counters. The queue file is removed afterwards.
+
+    Args:
+        input_file: Path to the leads JSON file the queue was prepared from
+        output_file: Path for enriched output
+        queue_file: Queue path (default: {input}-queue.sqlite)
+        allow_partial: Merge even if some domains haven't been looked up yet
+            (the queue is then kept so workers can finish it later)
+
+    Returns:
+        Enrichment stats
+    """
+    queue_file = queue_file or _queue_file_for(input_file)
+    if not os.path.exists(queue_file):
+        raise FileNotFoundError(f"No queue at {queue_file} - run prepare_enrichment_queue first")
+
+    queue = EnrichmentQueue(queue_file)
+    try:
+        counts = queue.counts()
+        unfinished = counts["pending"] + counts["leased"]
+        if unfinished and not allow_partial:
+            raise Exception(f"{unfinished} domains not looked up yet - run more workers "
+                            f"(or wait {int(queue.lease_seconds)}s for stale leases to expire)")
+        processed_domains = queue.results()
+        worker_stats = queue.worker_stats()
+    except BaseException:
+        queue.close()
+        raise
+
+    with open(input_file, 'r') as f:
+        data = json.load(f)
+
+    output_data = _write_enriched_output(data, processed_domains, input_file, output_file, worker_stats)
+    print(f"Saved to: {output_file}")
+
+    if unfinished:
+        queue.close()
+        print(f"Kept queue ({unfinished} domains unfinished): {queue_file}")
+    else:
+        queue.remove()
+        print(f"Cleaned up queue file")
+
+    return output_data
+
+
 # =============================================================================
 # EXAMPLE USAGE
 # =============================================================================
@@ -408,14 +1788,20 @@ if __name__ == "__main__":
     This script finds decision-maker emails for your scraped leads.
 
     Features:
-    - Saves progress after EVERY email found (won't lose work if interrupted)
+    - Journals EVERY lookup as it finishes (won't lose work if interrupted)
     - Can resume from where it left off
-    - Handles rate limiting automatically
+    - Handles rate limiting automatically (adapts to 429s)
+    - Optional concurrent lookups (workers=) under the same rate limit
     - Shows clear progress updates
 
     Usage:
 
-        from anymailfinder_enricher import AnyMailFinderClient, enrich_leads, enrich_multiple_niches
+        from anymailfinder_enricher import AnyMailFinderClient, AnyMailFinderKeyPool, enrich_leads, enrich_multiple_niches
+        from anymailfinder_enricher import prepare_enrichment_queue, run_enrichment_worker, merge_enrichment_queue
+
+        # Skip extra domains (one per line: example.com, *.example.com, re:<regex>)
+        #   -> user-workspace/skip-domains.txt is picked up automatically
+        # Look up everything: enrich_leads(..., use_filter=False)
 
         # Initialize client
         client = AnyMailFinderClient("your_anymailfinder_api_key")
@@ -435,6 +1821,27 @@ if __name__ == "__main__":
         ]
         results = enrich_multiple_niches(client, input_files)
 
+        # Concurrent lookups sized to your account's rate limit (e.g. 5 req/s)
+        client = AnyMailFinderClient("your_anymailfinder_api_key", rate_limit=5)
+        results = enrich_multiple_niches(client, input_files, workers=ENRICH_WORKERS)
+
+        # Bulk mode: one AnyMailFinder bulk job per niche
+        results = enrich_multiple_niches(client, input_files, bulk=True)
+
+        # Several accounts: each key gets its own rate limit; dead keys are retired
+        client = AnyMailFinderKeyPool(["key_account_1", "key_account_2", "key_account_3"], rate_limit=5)
+        results = enrich_multiple_niches(client, input_files, workers=3 * ENRICH_WORKERS)
+
+        # Several processes / machines on one niche (shared volume)
+        queue_file = prepare_enrichment_queue("user-workspace/hvac-leads.json")
+        run_enrichment_worker(client, queue_file, workers=ENRICH_WORKERS)  # start one per process
+        merge_enrichment_queue("user-workspace/hvac-leads.json", "user-workspace/hvac-enriched.json")
+
+        # asyncio (pip install aiohttp): many lookups from one event loop
+        client = AsyncAnyMailFinderClient("your_anymailfinder_api_key", rate_limit=1.0)
+        results = await asyncio.gather(*[client.find_decision_maker(d) for d in domains])
+        outcome, result = await client.lookup("acmehvac.com")  # LOOKUP_ERROR = retry later
+
     Output: {niche}-enriched.json with decision-maker emails
 
     Expected find rate: 50-60%
@@ -7,19 +7,32 @@ Usage:
     python apify_lead_scraper.py
 
 Workflow:
-    1. Start Google Maps Scraper actor run
-    2. Poll until complete (with timeout)
+    0. Reuse a cached scrape of the same query and parameters, if fresh
+    1. Start Google Maps Scraper actor run (or reattach to one left by a crashed run)
+    2. Wait until complete (long-poll, optional webhook, with timeout)
     3. Retrieve and process results
     4. Save to user-workspace/{niche-slug}-leads.json
+       (delta mode: merge into it and write only new/changed leads to
+       {niche-slug}-delta-leads.json)
 """
 
 import requests
+import base64
+import gzip
+import hashlib
 import json
+import threading
 import time
 import re
 import os
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
-from typing import List, Dict, Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+
+from compass_http import DEFAULT_TIMEOUT, AsyncHttpTransport, HttpTransport, get_async_transport, get_transport
 
 # =============================================================================
 # CONFIGURATION
@@ -36,29 +49,140 @@ COST_PER_PLACE = 0.004
 
 # Timeouts
 MAX_WAIT_SECONDS = 600  # 10 minutes max wait
-POLL_INTERVAL = 10  # Check every 10 seconds
+POLL_INTERVAL = 10  # Max seconds between status checks when falling back to polling
+MIN_POLL_INTERVAL = 1  # First fallback poll interval (doubles up to POLL_INTERVAL)
+WAIT_FOR_FINISH = 60  # Apify long-poll: server holds the status request up to 60s
+LONG_POLL_READ_MARGIN = 15  # Extra read timeout on long-polls beyond waitForFinish
+EARLY_STOP_POLL_INTERVAL = 5  # Seconds between dataset reads while following a running run
+
+# Dataset pagination (Apify returns at most this many items per request)
+DATASET_PAGE_SIZE = 1000
+DATASET_FETCH_WORKERS = 8  # Concurrent page requests in parallel fetch mode
+
+# Run statuses that mean the actor will not produce more results
+TERMINAL_STATUSES = ["SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"]
+
+# Ad-hoc webhook events fired when a run finishes (any outcome)
+RUN_FINISHED_EVENTS = [
+    "ACTOR.RUN.SUCCEEDED",
+    "ACTOR.RUN.FAILED",
+    "ACTOR.RUN.ABORTED",
+    "ACTOR.RUN.TIMED_OUT"
+]
+
+# Lead schema: each lead field, the Google Maps place keys it is read from (the
+# first key with a value wins) and its default. iter_unique_leads builds every
+# lead from this table; only company_name, location and domain get a final
+# touch in build_lead. Dataset downloads are projected to these keys only (see
+# dataset_fields), so bulky place data like reviews and images never leaves
+# Apify. A callable default is called per lead so leads never share a list.
+LEAD_SCHEMA = {
+    "company_name": (["title"], ""),
+    "location": (["city", "state"], ""),
+    "address": (["address"], ""),
+    "phone": (["phone"], ""),
+    "website": (["website"], ""),
+    "domain": (["website"], ""),
+    "email": (["email"], ""),
+    "rating": (["totalScore"], None),
+    "review_count": (["reviewsCount"], 0),
+    "categories": (["categories"], list),
+    "hours": (["openingHours"], ""),
+    "place_id": (["placeId"], ""),
+    "google_maps_url": (["url"], "")
+}
+
+# Concurrency: Apify runs actors in parallel on its side, so multiple niches
+# can be in flight at once. Keep this under your plan's concurrent-run limit.
+MAX_CONCURRENT_RUNS = 5
+
+# In-flight run state (run ID, dataset ID, query) saved under output_dir so a
+# crashed or timed-out scrape reattaches to its run instead of paying again
+RUN_STATE_DIR = ".apify-runs"
+
+# Scrape result cache (under output_dir): same query + actor input + fields
+# within the TTL is served from disk instead of a new paid run
+SCRAPE_CACHE_DIR = os.path.join(".cache", "apify-scrapes")
+SCRAPE_CACHE_TTL_HOURS = 7 * 24
+SCRAPE_CACHE_MAX_MB = 500  # Least recently used entries are evicted past this
+
+# Geographic sharding (scrape_leads_sharded): a state-wide search stops at
+# maxCrawledPlacesPerSearch, so the area is split into map boxes searched
+# separately. Boxes that hit the cap are split into 4 and searched again.
+SHARD_CELL_DEGREES = 2.0  # Starting grid (~220 km boxes)
+SHARD_MIN_CELL_DEGREES = 0.05  # Stop subdividing below ~5 km
+SHARD_MAX_RUNS = 200  # Actor-run budget per sharded scrape (stops subdividing past this)
+
+# Delta scrapes: a lead counts as changed if any of these fields differ from
+# the previous scrape (rating / review counts drift constantly and are ignored)
+DELTA_FIELDS = ["company_name", "address", "phone", "website", "domain", "email", "categories"]
 
 # =============================================================================
 # API CLIENT
 # =============================================================================
 
+def build_scraper_payload(
+    search_query: str,
+    max_places: int = 600,
+    language: str = "en",
+    geolocation: dict = None
+) -> dict:
+    """
+    Google Maps Scraper actor input for one search.
+
+    geolocation is an optional GeoJSON polygon (customGeolocation) that
+    restricts the search to an area - see bbox_polygon.
+    """
+    payload = {
+        "searchStringsArray": [search_query],
+        "maxCrawledPlacesPerSearch": max_places,
+        "language": language,
+        "includeWebsites": True,
+        "includeEmails": True,
+        "includePhones": True,
+        "skipClosedPlaces": False,
+        "scrapeDirectories": False,
+        "deeperCityScrape": False,
+        "oneReviewPerRow": False,
+        "allPlacesNoSearch": False
+    }
+    if geolocation:
+        payload["customGeolocation"] = geolocation
+    return payload
+
+
+def _long_poll_timeout(wait_for_finish: int) -> Optional[Tuple[float, float]]:
+    """
+    (connect, read) timeout for a waitForFinish status request.
+
+    Apify holds the request open for wait_for_finish seconds, so the read
+    timeout must outlast it or every long-poll on a running run times out.
+    None (the transport default) for a plain status check.
+    """
+    if not wait_for_finish:
+        return None
+    connect = DEFAULT_TIMEOUT[0] if isinstance(DEFAULT_TIMEOUT, tuple) else DEFAULT_TIMEOUT
+    return (connect, wait_for_finish + LONG_POLL_READ_MARGIN)
+
+
 class ApifyClient:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport: HttpTransport = None):
         self.api_key = api_key
+        self.transport = transport or get_transport()
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
 
-    def _request(self, method: str, endpoint: str, data: dict = None) -> dict:
-        """Make API request to Apify."""
+    def _request(self, method: str, endpoint: str, data: dict = None, params: dict = None, timeout=None) -> dict:
+        """Make API request to Apify (timeout overrides the transport default)."""
         url = f"{BASE_URL}{endpoint}"
 
         try:
             if method == "GET":
-                response = requests.get(url, headers=self.headers, params=data)
+                response = self.transport.request("GET", url, headers=self.headers, params=data, timeout=timeout)
             elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
+                response = self.transport.request("POST", url, headers=self.headers, json=data, params=params, timeout=timeout)
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
@@ -81,7 +205,9 @@ class ApifyClient:
         self,
         search_query: str,
         max_places: int = 600,
-        language: str = "en"
+        language: str = "en",
+        webhook_receiver: "RunWebhookReceiver" = None,
+        geolocation: dict = None
     ) -> dict:
         """
         Start Google Maps Scraper actor run.
@@ -90,106 +216,562 @@ class ApifyClient:
             search_query: e.g., "HVAC companies in California"
             max_places: Maximum places to scrape (default 600)
             language: Language for results (default "en")
+            webhook_receiver: Optional receiver to notify when the run finishes
+            geolocation: Optional GeoJSON polygon to search inside (bbox_polygon)
 
         Returns:
             Run info including run ID
         """
-        payload = {
-            "searchStringsArray": [search_query],
-            "maxCrawledPlacesPerSearch": max_places,
-            "language": language,
-            "includeWebsites": True,
-            "includeEmails": True,
-            "includePhones": True,
-            "skipClosedPlaces": False,
-            "scrapeDirectories": False,
-            "deeperCityScrape": False,
-            "oneReviewPerRow": False,
-            "allPlacesNoSearch": False
-        }
+        payload = build_scraper_payload(search_query, max_places, language, geolocation)
 
         print(f"Starting Google Maps scraper: {search_query}")
         print(f"Max places: {max_places}")
 
-        result = self._request("POST", f"/acts/{ACTOR_ID}/runs", payload)
+        params = None
+        if webhook_receiver is not None:
+            params = {"webhooks": webhook_receiver.webhooks_param()}
+
+        result = self._request("POST", f"/acts/{ACTOR_ID}/runs", payload, params=params)
         run_id = result.get("data", {}).get("id")
         print(f"Run started: {run_id}")
         return result
 
-    def get_run_status(self, run_id: str) -> dict:
-        """Get status of an actor run."""
-        result = self._request("GET", f"/actor-runs/{run_id}")
+    def get_run_status(self, run_id: str, wait_for_finish: int = 0) -> dict:
+        """
+        Get status of an actor run.
+
+        Args:
+            run_id: Actor run ID
+            wait_for_finish: Seconds for Apify to hold the request open until
+                the run finishes (0 = return immediately, max 60)
+        """
+        params = {"waitForFinish": wait_for_finish} if wait_for_finish else None
+        result = self._request("GET", f"/actor-runs/{run_id}", params, timeout=_long_poll_timeout(wait_for_finish))
         return result.get("data", {})
 
-    def wait_for_completion(self, run_id: str, timeout: int = MAX_WAIT_SECONDS) -> dict:
+    def wait_for_completion(
+        self,
+        run_id: str,
+        timeout: int = MAX_WAIT_SECONDS,
+        webhook_receiver: "RunWebhookReceiver" = None
+    ) -> dict:
         """
-        Poll until run completes or times out.
+        Wait until run completes or times out.
+
+        Uses Apify's waitForFinish long-poll, so each status request returns
+        as soon as the run finishes. If the server answers early without a
+        final status, falls back to polling with exponential backoff
+        (MIN_POLL_INTERVAL doubling up to POLL_INTERVAL).
+
+        With a webhook_receiver, waits for the run-finished webhook between
+        status checks instead, re-checking with backoff up to WAIT_FOR_FINISH
+        in case the webhook never arrives.
 
         Returns:
             Final run status
         """
         start_time = time.time()
         last_status = None
+        backoff = MIN_POLL_INTERVAL
+        max_backoff = WAIT_FOR_FINISH if webhook_receiver is not None else POLL_INTERVAL
 
         while True:
             elapsed = time.time() - start_time
-            if elapsed > timeout:
+            remaining = timeout - elapsed
+            if remaining <= 0:
                 raise TimeoutError(f"Scraper timed out after {timeout} seconds")
 
-            status_data = self.get_run_status(run_id)
+            long_polled = False
+            if webhook_receiver is not None:
+                status_data = self.get_run_status(run_id)
+            else:
+                wait = int(max(1, min(WAIT_FOR_FINISH, remaining)))
+                request_start = time.time()
+                status_data = self.get_run_status(run_id, wait_for_finish=wait)
+                long_polled = time.time() - request_start >= wait / 2
+
             status = status_data.get("status")
 
             if status != last_status:
-                print(f"Status: {status} ({int(elapsed)}s elapsed)")
+                print(f"Status: {status} ({int(time.time() - start_time)}s elapsed)")
                 last_status = status
 
             if status == "SUCCEEDED":
                 print("Scraper completed successfully!")
                 return status_data
 
-            if status in ["FAILED", "ABORTED", "TIMED-OUT"]:
+            if status in TERMINAL_STATUSES:
+                raise Exception(f"Scraper {status}: {status_data.get('statusMessage', 'Unknown error')}")
+
+            if long_polled:
+                # Server held the request for us; ask again straight away
+                backoff = MIN_POLL_INTERVAL
+                continue
+
+            remaining = timeout - (time.time() - start_time)
+            if webhook_receiver is not None:
+                webhook_receiver.wait(run_id, max(0, min(backoff, remaining)))
+            else:
+                time.sleep(max(0, min(backoff, remaining)))
+            backoff = min(backoff * 2, max_backoff)
+
+    def abort_run(self, run_id: str) -> dict:
+        """Abort a running actor run (places already scraped stay in its dataset)."""
+        result = self._request("POST", f"/actor-runs/{run_id}/abort")
+        print(f"Run aborted: {run_id}")
+        return result.get("data", {})
+
+    def _fetch_dataset_page(
+        self,
+        dataset_id: str,
+        offset: int,
+        limit: int,
+        fields: List[str] = None
+    ) -> List[dict]:
+        """Fetch one page of dataset items, optionally projected to fields."""
+        params = {"offset": offset, "limit": limit, "format": "json"}
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        response = self.transport.request(
+            "GET",
+            f"{BASE_URL}/datasets/{dataset_id}/items",
+            headers=self.headers,
+            params=params
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def iter_dataset_items(
+        self,
+        dataset_id: str,
+        page_size: int = DATASET_PAGE_SIZE,
+        fields: List[str] = None
+    ) -> Iterator[dict]:
+        """
+        Yield items from a dataset page by page.
+
+        Only one page is held in memory at a time, so callers can process
+        places as they arrive instead of waiting for the whole dataset.
+        Pass fields (e.g. dataset_fields()) to download only those keys.
+        """
+        offset = 0
+
+        while True:
+            items = self._fetch_dataset_page(dataset_id, offset, page_size, fields)
+
+            if not items:
+                break
+
+            offset += len(items)
+            print(f"Retrieved {offset} items...")
+            yield from items
+
+            if len(items) < page_size:
+                break
+
+    def iter_run_items(
+        self,
+        run_id: str,
+        dataset_id: str,
+        fields: List[str] = None,
+        page_size: int = DATASET_PAGE_SIZE,
+        poll_interval: int = EARLY_STOP_POLL_INTERVAL,
+        timeout: int = MAX_WAIT_SECONDS
+    ) -> Iterator[dict]:
+        """
+        Yield a run's dataset items while the run is still scraping.
+
+        Reads whatever is new in the dataset, then long-polls the run status
+        for up to poll_interval seconds, and repeats until the run succeeds
+        (with a last read to pick up the final items). Lets callers act on
+        places - or abort the run - before it finishes.
+        """
+        start_time = time.time()
+        offset = 0
+        last_status = None
+        finished = False
+
+        while True:
+            while True:
+                items = self._fetch_dataset_page(dataset_id, offset, page_size, fields)
+                offset += len(items)
+                yield from items
+                if len(items) < page_size:
+                    break
+
+            if finished:
+                return
+            if time.time() - start_time > timeout:
+                raise TimeoutError(f"Scraper timed out after {timeout} seconds")
+
+            status_data = self.get_run_status(run_id, wait_for_finish=poll_interval)
+            status = status_data.get("status")
+
+            if status != last_status:
+                print(f"Status: {status} ({int(time.time() - start_time)}s elapsed, {offset} places so far)")
+                last_status = status
+
+            if status == "SUCCEEDED":
+                finished = True
+            elif status in TERMINAL_STATUSES:
                 raise Exception(f"Scraper {status}: {status_data.get('statusMessage', 'Unknown error')}")
 
-            time.sleep(POLL_INTERVAL)
+    def iter_dataset_items_parallel(
+        self,
+        dataset_id: str,
+        item_count: int = None,
+        page_size: int = DATASET_PAGE_SIZE,
+        max_workers: int = DATASET_FETCH_WORKERS,
+        fields: List[str] = None
+    ) -> Iterator[dict]:
+        """
+        Yield dataset items, fetching page windows concurrently.
 
-    def get_dataset_items(self, dataset_id: str) -> List[dict]:
+        Plans every offset/limit window up front from the dataset's itemCount
+        (looked up if not given), keeps up to max_workers page requests in
+        flight and yields pages back in dataset order.
+        """
+        if item_count is None:
+            item_count = self.get_dataset_info(dataset_id).get("itemCount") or 0
+
+        windows = deque(range(0, item_count, page_size))
+        print(f"Fetching {item_count} items in {len(windows)} pages ({max_workers} at a time)...")
+
+        retrieved = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight = deque()
+            while windows or in_flight:
+                while windows and len(in_flight) < max_workers:
+                    offset = windows.popleft()
+                    in_flight.append(executor.submit(
+                        self._fetch_dataset_page, dataset_id, offset, page_size, fields
+                    ))
+
+                items = in_flight.popleft().result()
+                retrieved += len(items)
+                print(f"Retrieved {retrieved} items...")
+                yield from items
+
+    def get_dataset_info(self, dataset_id: str) -> dict:
+        """Get dataset details (including itemCount)."""
+        result = self._request("GET", f"/datasets/{dataset_id}")
+        return result.get("data", {})
+
+    def get_dataset_items(
+        self,
+        dataset_id: str,
+        parallel: bool = False,
+        item_count: int = None,
+        fields: List[str] = None
+    ) -> List[dict]:
         """
         Retrieve all items from a dataset.
 
+        Args:
+            dataset_id: Dataset ID
+            parallel: Fetch all pages concurrently instead of one after another
+            item_count: Known dataset size (parallel mode looks it up if None)
+            fields: Only download these place keys (None = full objects)
+
         Returns:
             List of scraped places
         """
         print(f"Retrieving results from dataset: {dataset_id}")
 
-        # Get items with pagination
-        all_items = []
+        if parallel:
+            all_items = list(self.iter_dataset_items_parallel(dataset_id, item_count, fields=fields))
+        else:
+            all_items = list(self.iter_dataset_items(dataset_id, fields=fields))
+
+        print(f"Total items retrieved: {len(all_items)}")
+        return all_items
+
+
+class AsyncApifyClient:
+    """
+    asyncio version of ApifyClient with the same methods, as coroutines.
+
+    Any number of these clients can run on one event loop; in-flight
+    requests per host are capped by the AsyncHttpTransport (shared per
+    loop by default).
+
+    Usage:
+        async def main():
+            client = AsyncApifyClient(api_key)
+            run = await client.start_scraper("HVAC companies in Texas")
+            await client.wait_for_completion(run["data"]["id"])
+            places = await client.get_dataset_items(run["data"]["defaultDatasetId"])
+            await get_async_transport().close()
+    """
+
+    def __init__(self, api_key: str, transport: AsyncHttpTransport = None):
+        self.api_key = api_key
+        self.transport = transport
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+    async def _request(self, method: str, endpoint: str, data: dict = None, params: dict = None, timeout=None) -> dict:
+        """Make API request to Apify (timeout overrides the transport default)."""
+        url = f"{BASE_URL}{endpoint}"
+        transport = self.transport or get_async_transport()
+
+        if method == "GET":
+            response = await transport.request("GET", url, headers=self.headers, params=data, timeout=timeout)
+        elif method == "POST":
+            response = await transport.request("POST", url, headers=self.headers, json=data, params=params, timeout=timeout)
+        else:
+            raise ValueError(f"Unsupported method: {method}")
+
+        if response.status_code >= 400:
+            print(f"HTTP Error: {response.status_code}")
+            print(f"Response: {response.text}")
+        response.raise_for_status()
+        return response.json() if response.text else {}
+
+    async def start_scraper(
+        self,
+        search_query: str,
+        max_places: int = 600,
+        language: str = "en",
+        webhook_receiver: "RunWebhookReceiver" = None,
+        geolocation: dict = None
+    ) -> dict:
+        """Start Google Maps Scraper actor run (see ApifyClient.start_scraper)."""
+        payload = build_scraper_payload(search_query, max_places, language, geolocation)
+        params = None
+        if webhook_receiver is not None:
+            params = {"webhooks": webhook_receiver.webhooks_param()}
+
+        print(f"Starting Google Maps scraper: {search_query}")
+        result = await self._request("POST", f"/acts/{ACTOR_ID}/runs", payload, params=params)
+        print(f"Run started: {result.get('data', {}).get('id')}")
+        return result
+
+    async def get_run_status(self, run_id: str, wait_for_finish: int = 0) -> dict:
+        """Get status of an actor run, optionally long-polling."""
+        params = {"waitForFinish": wait_for_finish} if wait_for_finish else None
+        result = await self._request("GET", f"/actor-runs/{run_id}", params, timeout=_long_poll_timeout(wait_for_finish))
+        return result.get("data", {})
+
+    async def abort_run(self, run_id: str) -> dict:
+        """Abort a running actor run (see ApifyClient.abort_run)."""
+        result = await self._request("POST", f"/actor-runs/{run_id}/abort")
+        print(f"Run aborted: {run_id}")
+        return result.get("data", {})
+
+    async def wait_for_completion(
+        self,
+        run_id: str,
+        timeout: int = MAX_WAIT_SECONDS,
+        webhook_receiver: "RunWebhookReceiver" = None
+    ) -> dict:
+        """Wait until run completes or times out (see ApifyClient.wait_for_completion)."""
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        last_status = None
+        backoff = MIN_POLL_INTERVAL
+        max_backoff = WAIT_FOR_FINISH if webhook_receiver is not None else POLL_INTERVAL
+
+        while True:
+            remaining = timeout - (loop.time() - start_time)
+            if remaining <= 0:
+                raise TimeoutError(f"Scraper timed out after {timeout} seconds")
+
+            long_polled = False
+            if webhook_receiver is not None:
+                status_data = await self.get_run_status(run_id)
+            else:
+                wait = int(max(1, min(WAIT_FOR_FINISH, remaining)))
+                request_start = loop.time()
+                status_data = await self.get_run_status(run_id, wait_for_finish=wait)
+                long_polled = loop.time() - request_start >= wait / 2
+
+            status = status_data.get("status")
+
+            if status != last_status:
+                print(f"Status: {status} ({int(loop.time() - start_time)}s elapsed)")
+                last_status = status
+
+            if status == "SUCCEEDED":
+                print("Scraper completed successfully!")
+                return status_data
+
+            if status in TERMINAL_STATUSES:
+                raise Exception(f"Scraper {status}: {status_data.get('statusMessage', 'Unknown error')}")
+
+            if long_polled:
+                backoff = MIN_POLL_INTERVAL
+                continue
+
+            remaining = timeout - (loop.time() - start_time)
+            if webhook_receiver is not None:
+                await asyncio.to_thread(webhook_receiver.wait, run_id, max(0, min(backoff, remaining)))
+            else:
+                await asyncio.sleep(max(0, min(backoff, remaining)))
+            backoff = min(backoff * 2, max_backoff)
+
+    async def _fetch_dataset_page(
+        self,
+        dataset_id: str,
+        offset: int,
+        limit: int,
+        fields: List[str] = None
+    ) -> List[dict]:
+        """Fetch one page of dataset items, optionally projected to fields."""
+        params = {"offset": offset, "limit": limit, "format": "json"}
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        transport = self.transport or get_async_transport()
+        response = await transport.request(
+            "GET",
+            f"{BASE_URL}/datasets/{dataset_id}/items",
+            headers=self.headers,
+            params=params
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def iter_dataset_items(
+        self,
+        dataset_id: str,
+        page_size: int = DATASET_PAGE_SIZE,
+        fields: List[str] = None
+    ):
+        """Async generator yielding dataset items page by page."""
         offset = 0
-        limit = 1000
 
         while True:
-            response = requests.get(
-                f"{BASE_URL}/datasets/{dataset_id}/items",
-                headers=self.headers,
-                params={"offset": offset, "limit": limit, "format": "json"}
-            )
-            response.raise_for_status()
-            items = response.json()
+            items = await self._fetch_dataset_page(dataset_id, offset, page_size, fields)
 
             if not items:
                 break
 
-            all_items.extend(items)
-            print(f"Retrieved {len(all_items)} items...")
+            offset += len(items)
+            print(f"Retrieved {offset} items...")
+            for item in items:
+                yield item
 
-            if len(items) < limit:
+            if len(items) < page_size:
                 break
 
-            offset += limit
+    async def get_dataset_info(self, dataset_id: str) -> dict:
+        """Get dataset details (including itemCount)."""
+        result = await self._request("GET", f"/datasets/{dataset_id}")
+        return result.get("data", {})
+
+    async def get_dataset_items(
+        self,
+        dataset_id: str,
+        parallel: bool = False,
+        item_count: int = None,
+        fields: List[str] = None
+    ) -> List[dict]:
+        """
+        Retrieve all items from a dataset.
+
+        parallel=True requests every page window at once (bounded by the
+        transport's per-host cap) and reassembles them in order.
+        """
+        print(f"Retrieving results from dataset: {dataset_id}")
+
+        if parallel:
+            if item_count is None:
+                item_count = (await self.get_dataset_info(dataset_id)).get("itemCount") or 0
+            pages = await asyncio.gather(*[
+                self._fetch_dataset_page(dataset_id, offset, DATASET_PAGE_SIZE, fields)
+                for offset in range(0, item_count, DATASET_PAGE_SIZE)
+            ])
+            all_items = [item for page in pages for item in page]
+        else:
+            all_items = [item async for item in self.iter_dataset_items(dataset_id, fields=fields)]
 
         print(f"Total items retrieved: {len(all_items)}")
         return all_items
 
 
+class RunWebhookReceiver:
+    """
+    Small local HTTP server that receives Apify run-finished webhooks.
+
+    Pass it to start_scraper() to register an ad-hoc webhook for the run and
+    to wait_for_completion() to wake up as soon as the webhook arrives.
+    Apify must be able to reach the server, so set public_url to the
+    externally visible address (e.g. a tunnel) that forwards to host:port.
+
+    Usage:
+        with RunWebhookReceiver(port=8765, public_url="https://abc.ngrok.io/") as receiver:
+            scrape_leads(client, niche, location, webhook_receiver=receiver)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, public_url: str = None):
+        self._events = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.url = public_url or f"http://{host}:{self.server.server_port}/"
+
+    def _make_handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    payload = {}
+                receiver._handle_webhook(payload)
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _event(self, run_id: str) -> threading.Event:
+        with self._lock:
+            if run_id not in self._events:
+                self._events[run_id] = threading.Event()
+            return self._events[run_id]
+
+    def _handle_webhook(self, payload: dict):
+        """Mark the run in the webhook payload as finished."""
+        run_id = (payload.get("resource") or {}).get("id") \
+            or (payload.get("eventData") or {}).get("actorRunId")
+        if run_id:
+            self._event(run_id).set()
+
+    def webhooks_param(self) -> str:
+        """Base64-encoded ad-hoc webhook definition for the run start request."""
+        webhooks = [{"eventTypes": RUN_FINISHED_EVENTS, "requestUrl": self.url}]
+        return base64.b64encode(json.dumps(webhooks).encode()).decode()
+
+    def wait(self, run_id: str, timeout: float) -> bool:
+        """Block until the run's webhook arrives or timeout passes."""
+        return self._event(run_id).wait(timeout)
+
+    def start(self) -> "RunWebhookReceiver":
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"Listening for Apify webhooks at {self.url}")
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "RunWebhookReceiver":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
 # =============================================================================
 # DATA PROCESSING
 # =============================================================================
@@ -219,91 +801,651 @@ def extract_domain(website: str) -> Optional[str]:
     return domain if domain else None
 
 
-def process_leads(raw_places: List[dict], niche: str, location: str) -> dict:
+def dataset_fields(extra_fields: List[str] = None) -> List[str]:
     """
-    Process raw Apify results into clean lead data.
+    Place keys to request from the dataset API.
+
+    Derived from LEAD_SCHEMA, plus any extra_fields the caller opts into
+    (e.g. ["reviews", "imageUrls"]), without duplicates.
+    """
+    fields = [key for keys, _ in LEAD_SCHEMA.values() for key in keys]
+    return list(dict.fromkeys(fields + list(extra_fields or [])))
+
+
+def build_lead(place: dict, location: str) -> dict:
+    """
+    Build one lead record from a raw Apify place, field by field from LEAD_SCHEMA.
+
+    Args:
+        place: Raw Google Maps place
+        location: Search location, used when the place has no city or state
 
     Returns:
-        Processed leads data structure
+        Lead dict with the LEAD_SCHEMA fields, in schema order
     """
-    print(f"Processing {len(raw_places)} places...")
+    lead = {}
+    for field, (keys, default) in LEAD_SCHEMA.items():
+        value = next((place[key] for key in keys if place.get(key) not in (None, "")), None)
+        if value is None:
+            value = default() if callable(default) else default
+        lead[field] = value
+
+    lead["company_name"] = str(lead["company_name"]).strip()
+    lead["location"] = lead["location"] or location
+    lead["domain"] = extract_domain(lead["domain"])
+    return lead
 
-    leads = []
+
+def iter_unique_leads(
+    raw_places: Iterable[dict],
+    location: str,
+    counts: dict,
+    extra_fields: List[str] = None
+) -> Iterator[dict]:
+    """
+    Turn raw Apify places into clean lead records, skipping duplicate domains.
+
+    Works on any iterable (list or streaming generator). Tallies are written
+    into counts as places are consumed:
+        counts["places"]: raw places seen
+        counts["emails_found"]: yielded leads that have an email
+
+    extra_fields are copied onto each lead under their place key.
+    """
     seen_domains = set()
-    emails_found = 0
+    counts.setdefault("places", 0)
+    counts.setdefault("emails_found", 0)
 
     for place in raw_places:
-        # Extract basic info
-        company_name = place.get("title", "").strip()
-        if not company_name:
-            continue
+        counts["places"] += 1
 
-        website = place.get("website", "")
-        domain = extract_domain(website)
+        lead = build_lead(place, location)
+        if not lead["company_name"]:
+            continue
 
         # Skip duplicates based on domain
+        domain = lead["domain"]
         if domain and domain in seen_domains:
             continue
         if domain:
             seen_domains.add(domain)
 
-        # Extract email (if available from Google Maps)
-        email = place.get("email", "")
-        if email:
-            emails_found += 1
-
-        # Build lead record
-        lead = {
-            "company_name": company_name,
-            "location": place.get("city", "") or place.get("state", "") or location,
-            "address": place.get("address", ""),
-            "phone": place.get("phone", ""),
-            "website": website,
-            "domain": domain,
-            "email": email,
-            "rating": place.get("totalScore"),
-            "review_count": place.get("reviewsCount", 0),
-            "categories": place.get("categories", []),
-            "hours": place.get("openingHours", ""),
-            "place_id": place.get("placeId", ""),
-            "google_maps_url": place.get("url", "")
-        }
+        # Email (if available from Google Maps)
+        if lead["email"]:
+            counts["emails_found"] += 1
 
-        leads.append(lead)
+        for key in extra_fields or []:
+            lead[key] = place.get(key)
 
-    # Calculate stats
-    total_found = len(leads)
+        yield lead
+
+
+def _lead_summary(niche: str, location: str, total_found: int, emails_found: int, places: int) -> dict:
+    """Build the stats header of a leads file and print it."""
     find_rate = (emails_found / total_found * 100) if total_found > 0 else 0
-    estimated_cost = len(raw_places) * COST_PER_PLACE
+    estimated_cost = places * COST_PER_PLACE
 
-    result = {
+    print(f"Processed {total_found} unique companies")
+    print(f"Emails found: {emails_found} ({find_rate:.1f}%)")
+    print(f"Estimated cost: ${estimated_cost:.2f}")
+
+    return {
         "niche": niche,
         "location": location,
         "total_found": total_found,
         "emails_found": emails_found,
         "find_rate": f"{find_rate:.1f}%",
         "estimated_cost": f"${estimated_cost:.2f}",
-        "scraped_at": datetime.now().isoformat(),
-        "leads": leads
+        "scraped_at": datetime.now().isoformat()
     }
 
-    print(f"Processed {total_found} unique companies")
-    print(f"Emails found: {emails_found} ({find_rate:.1f}%)")
-    print(f"Estimated cost: ${estimated_cost:.2f}")
+
+def process_leads(
+    raw_places: List[dict],
+    niche: str,
+    location: str,
+    extra_fields: List[str] = None,
+    billed_places: int = None
+) -> dict:
+    """
+    Process raw Apify results into clean lead data.
+
+    Args:
+        raw_places: Places from the dataset
+        niche: Niche name
+        location: Search location
+        extra_fields: Additional place keys to copy onto each lead
+        billed_places: Places paid for, if more than raw_places (e.g. shards
+            that overlapped before dedup) - used for estimated_cost
+
+    Returns:
+        Processed leads data structure
+    """
+    print(f"Processing {len(raw_places)} places...")
+
+    counts = {}
+    leads = list(iter_unique_leads(raw_places, location, counts, extra_fields))
+
+    places = counts["places"] if billed_places is None else billed_places
+    result = _lead_summary(niche, location, len(leads), counts["emails_found"], places)
+    result["leads"] = leads
 
     return result
 
 
+def process_leads_streaming(
+    raw_places: Iterable[dict],
+    niche: str,
+    location: str,
+    output_file: str,
+    metadata: dict = None,
+    extra_fields: List[str] = None
+) -> dict:
+    """
+    Streaming version of process_leads that writes leads as they arrive.
+
+    Each deduplicated lead is spooled to disk as soon as its place is read,
+    so memory stays flat no matter how large the dataset is. Once the input
+    is exhausted the spool is copied into output_file in the same layout
+    process_leads + json.dump produce.
+
+    Args:
+        raw_places: Any iterable of places, e.g. client.iter_dataset_items()
+        niche: Niche name
+        location: Search location
+        output_file: Path of the leads JSON file to write
+        metadata: Extra header fields (e.g. apify_run_id)
+        extra_fields: Additional place keys to copy onto each lead
+
+    Returns:
+        Leads stats WITHOUT the "leads" list (they live in output_file)
+    """
+    print("Processing places as they stream in...")
+
+    counts = {}
+    total_found = 0
+    spool_file = f"{output_file}.partial"
+
+    with open(spool_file, "w") as spool:
+        for lead in iter_unique_leads(raw_places, location, counts, extra_fields):
+            spool.write(json.dumps(lead) + "\n")
+            total_found += 1
+
+    summary = _lead_summary(niche, location, total_found, counts["emails_found"], counts["places"])
+    summary.update(metadata or {})
+
+    with open(spool_file, "r") as spool, open(output_file, "w") as f:
+        header = json.dumps(summary, indent=2)
+        f.write(header[:-2] + ',\n  "leads": [')
+        for i, line in enumerate(spool):
+            lead_json = json.dumps(json.loads(line), indent=2).replace("\n", "\n    ")
+            f.write(("," if i else "") + "\n    " + lead_json)
+        f.write("\n  ]\n}" if total_found else "]\n}")
+
+    os.remove(spool_file)
+
+    return summary
+
+
+def diff_leads(previous_leads: List[dict], current_leads: List[dict]) -> dict:
+    """
+    Compare a fresh scrape against the previous one.
+
+    Leads are matched by place_id, falling back to domain (place IDs
+    occasionally change when a listing is re-created).
+
+    Returns:
+        {"new": [...], "changed": [...], "unchanged": count,
+         "merged": previous leads updated in place + new leads appended}
+        Leads missing from the fresh scrape stay in merged - search results
+        vary between runs, so absence doesn't mean the company is gone.
+    """
+    merged = list(previous_leads)
+    by_place_id = {}
+    by_domain = {}
+    for i, lead in enumerate(merged):
+        if lead.get("place_id"):
+            by_place_id.setdefault(lead["place_id"], i)
+        if lead.get("domain"):
+            by_domain.setdefault(lead["domain"], i)
+
+    new, changed, unchanged = [], [], 0
+
+    for lead in current_leads:
+        i = by_place_id.get(lead.get("place_id")) if lead.get("place_id") else None
+        if i is None and lead.get("domain"):
+            i = by_domain.get(lead["domain"])
+
+        if i is None:
+            new.append(lead)
+            merged.append(lead)
+            if lead.get("place_id"):
+                by_place_id[lead["place_id"]] = len(merged) - 1
+            if lead.get("domain"):
+                by_domain.setdefault(lead["domain"], len(merged) - 1)
+        elif any(merged[i].get(f) != lead.get(f) for f in DELTA_FIELDS):
+            changed.append(lead)
+            merged[i] = lead
+        else:
+            unchanged += 1
+
+    return {"new": new, "changed": changed, "unchanged": unchanged, "merged": merged}
+
+
+def write_lead_delta(processed: dict, master_file: str, delta_file: str) -> dict:
+    """
+    Merge a fresh scrape into the master leads file and write the delta.
+
+    The delta file has the same layout as a leads file but only new and
+    changed leads, so enrichment and campaign upload can run on it alone.
+
+    Args:
+        processed: process_leads output for the fresh scrape
+        master_file: {niche-slug}-leads.json (created if missing)
+        delta_file: Where to write new + changed leads
+
+    Returns:
+        Master leads data with "delta" stats and "delta_file"
+    """
+    previous_leads = []
+    if os.path.exists(master_file):
+        with open(master_file, "r") as f:
+            previous_leads = json.load(f).get("leads", [])
+
+    diff = diff_leads(previous_leads, processed["leads"])
+    delta_leads = diff["new"] + diff["changed"]
+    stats = {
+        "previous": len(previous_leads),
+        "new": len(diff["new"]),
+        "changed": len(diff["changed"]),
+        "unchanged": diff["unchanged"]
+    }
+
+    header = {k: v for k, v in processed.items() if k != "leads"}
+
+    def leads_file(leads: List[dict]) -> dict:
+        emails_found = sum(1 for lead in leads if lead.get("email"))
+        return {
+            **header,
+            "total_found": len(leads),
+            "emails_found": emails_found,
+            "find_rate": f"{emails_found / len(leads) * 100 if leads else 0:.1f}%",
+            "delta": stats,
+            "leads": leads
+        }
+
+    for path, data in ((delta_file, leads_file(delta_leads)), (master_file, leads_file(diff["merged"]))):
+        tmp_file = path + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_file, path)
+
+    print(f"Delta: {stats['new']} new, {stats['changed']} changed, {stats['unchanged']} unchanged "
+          f"(master now {len(diff['merged'])} leads)")
+
+    master = leads_file(diff["merged"])
+    master["delta_file"] = delta_file
+    return master
+
+
+# =============================================================================
+# RUN STATE (REATTACH AFTER A CRASH)
+# =============================================================================
+
+def _run_state_file(output_dir: str, niche: str, location: str) -> str:
+    return os.path.join(output_dir, RUN_STATE_DIR, f"{slugify(niche)}--{slugify(location)}.json")
+
+
+def load_run_state(state_file: str) -> Optional[dict]:
+    """Saved run state, or None if there is none (or it's unreadable)."""
+    if not os.path.exists(state_file):
+        return None
+    try:
+        with open(state_file, 'r') as f:
+            return json.load(f)
+    except ValueError:
+        print(f"WARNING: Ignoring unreadable run state {state_file}")
+        return None
+
+
+def save_run_state(state_file: str, state: dict):
+    """Atomically write run state (a crash mid-write leaves the old file)."""
+    os.makedirs(os.path.dirname(state_file), exist_ok=True)
+    tmp_file = state_file + ".tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_file, state_file)
+
+
+def clear_run_state(state_file: str):
+    if os.path.exists(state_file):
+        os.remove(state_file)
+
+
+def _reattachable_run(client: ApifyClient, state: Optional[dict], search_query: str, max_places: int) -> Optional[dict]:
+    """
+    The saved run if it is for the same query and still usable.
+
+    Usable means running or succeeded. A failed/aborted run, or one Apify no
+    longer knows about, means starting over.
+    """
+    if not state:
+        return None
+    if state.get("search_query") != search_query or state.get("max_places") != max_places:
+        print(f"Saved run {state.get('run_id')} was for different parameters - starting a new run")
+        return None
+
+    try:
+        status = client.get_run_status(state["run_id"]).get("status")
+    except Exception as e:
+        print(f"Saved run {state.get('run_id')} can't be checked ({e}) - starting a new run")
+        return None
+
+    if status in TERMINAL_STATUSES and status != "SUCCEEDED":
+        print(f"Saved run {state['run_id']} ended {status} - starting a new run")
+        return None
+
+    print(f"Reattaching to run {state['run_id']} ({status}, started {state.get('started_at', '?')})")
+    return state
+
+
+# =============================================================================
+# SCRAPE CACHE
+# =============================================================================
+
+class ScrapeCache:
+    """
+    Local cache of downloaded datasets, keyed by what was scraped.
+
+    The key is a SHA-256 of the actor ID, the full start_scraper payload and
+    the projected fields, so any change to the query or parameters misses.
+    Places are stored as gzipped JSON lines (read back as a stream), next to
+    a small metadata file. Entries expire after ttl_hours; past max_mb the
+    least recently used entries are evicted.
+
+    Usage:
+        cache = ScrapeCache("user-workspace/.cache/apify-scrapes")
+        scrape_leads(client, "HVAC companies", "Texas", scrape_cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_hours: float = SCRAPE_CACHE_TTL_HOURS,
+        max_mb: float = SCRAPE_CACHE_MAX_MB
+    ):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.max_bytes = max_mb * 1024 * 1024
+        os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def key(search_query: str, max_places: int, fields: List[str] = None, language: str = "en") -> str:
+        """Cache key for a scrape: hash of actor, actor input and fields."""
+        spec = {
+            "actor": ACTOR_ID,
+            "payload": build_scraper_payload(search_query, max_places, language),
+            "fields": sorted(fields) if fields else None
+        }
+        return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+    def _paths(self, key: str):
+        base = os.path.join(self.path, key)
+        return base + ".jsonl.gz", base + ".json"
+
+    def get(self, key: str) -> Optional[dict]:
+        """Metadata of a fresh entry (marks it recently used), or None."""
+        data_file, meta_file = self._paths(key)
+        try:
+            with open(meta_file, 'r') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - meta.get("cached_at", 0) >= self.ttl or not os.path.exists(data_file):
+            self._remove(key)
+            return None
+
+        os.utime(meta_file)
+        return meta
+
+    def iter_items(self, key: str) -> Iterator[dict]:
+        """Stream a cached dataset back, one place at a time."""
+        data_file, _ = self._paths(key)
+        with gzip.open(data_file, 'rt', encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+
+    def tee(self, key: str, items: Iterable[dict], meta: dict) -> Iterator[dict]:
+        """
+        Pass items through while caching them.
+
+        The entry is only committed once items is exhausted, so an
+        interrupted download never leaves a partial dataset in the cache.
+        An empty dataset is never cached (a re-run should scrape again).
+        """
+        data_file, meta_file = self._paths(key)
+        tmp_file = f"{data_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        count = 0
+        try:
+            with gzip.open(tmp_file, 'wt', encoding='utf-8') as f:
+                for item in items:
+                    f.write(json.dumps(item) + "\n")
+                    count += 1
+                    yield item
+            if count:
+                os.replace(tmp_file, data_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+        if not count:
+            return
+
+        meta = {**meta, "key": key, "items": count, "cached_at": time.time()}
+        tmp_meta = f"{meta_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_meta, 'w') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_meta, meta_file)
+        print(f"Cached {count} places ({os.path.getsize(data_file) / 1024:.0f} KB): {key[:12]}")
+
+        self.evict()
+
+    def put(self, key: str, items: Iterable[dict], meta: dict):
+        """Cache a full dataset."""
+        for _ in self.tee(key, items, meta):
+            pass
+
+    def _remove(self, key: str):
+        for path in self._paths(key):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones past max_mb."""
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.path):
+            if not name.endswith(".json"):
+                continue
+            key = name[:-len(".json")]
+            data_file, meta_file = self._paths(key)
+            try:
+                with open(meta_file, 'r') as f:
+                    cached_at = json.load(f).get("cached_at", 0)
+                size = os.path.getsize(data_file)
+                last_used = os.path.getmtime(meta_file)
+            except (OSError, ValueError):
+                self._remove(key)
+                continue
+            if now - cached_at >= self.ttl:
+                self._remove(key)
+            else:
+                entries.append((last_used, size, key))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+
+
+# =============================================================================
+# GEOGRAPHIC SHARDING
+# =============================================================================
+
+# Approximate bounding boxes (south, west, north, east) of US states + DC.
+# Boxes spill into neighbours; out-of-state places are dropped by their state.
+US_STATE_BOUNDS = {
+    "AL": ("Alabama", (30.14, -88.47, 35.01, -84.89)),
+    "AK": ("Alaska", (51.20, -179.15, 71.44, -129.98)),
+    "AZ": ("Arizona", (31.33, -114.82, 37.00, -109.04)),
+    "AR": ("Arkansas", (33.00, -94.62, 36.50, -89.64)),
+    "CA": ("California", (32.53, -124.41, 42.01, -114.13)),
+    "CO": ("Colorado", (36.99, -109.06, 41.00, -102.04)),
+    "CT": ("Connecticut", (40.98, -73.73, 42.05, -71.79)),
+    "DE": ("Delaware", (38.45, -75.79, 39.84, -75.05)),
+    "DC": ("District of Columbia", (38.79, -77.12, 39.00, -76.91)),
+    "FL": ("Florida", (24.52, -87.63, 31.00, -80.03)),
+    "GA": ("Georgia", (30.36, -85.61, 35.00, -80.84)),
+    "HI": ("Hawaii", (18.91, -160.25, 22.24, -154.81)),
+    "ID": ("Idaho", (41.99, -117.24, 49.00, -111.04)),
+    "IL": ("Illinois", (36.97, -91.51, 42.51, -87.50)),
+    "IN": ("Indiana", (37.77, -88.10, 41.76, -84.78)),
+    "IA": ("Iowa", (40.38, -96.64, 43.50, -90.14)),
+    "KS": ("Kansas", (36.99, -102.05, 40.00, -94.59)),
+    "KY": ("Kentucky", (36.50, -89.57, 39.15, -81.96)),
+    "LA": ("Louisiana", (28.93, -94.04, 33.02, -88.82)),
+    "ME": ("Maine", (43.06, -71.08, 47.46, -66.95)),
+    "MD": ("Maryland", (37.91, -79.49, 39.72, -75.05)),
+    "MA": ("Massachusetts", (41.24, -73.51, 42.89, -69.93)),
+    "MI": ("Michigan", (41.70, -90.42, 48.31, -82.41)),
+    "MN": ("Minnesota", (43.50, -97.24, 49.38, -89.49)),
+    "MS": ("Mississippi", (30.17, -91.66, 35.00, -88.10)),
+    "MO": ("Missouri", (35.99, -95.77, 40.61, -89.10)),
+    "MT": ("Montana", (44.36, -116.05, 49.00, -104.04)),
+    "NE": ("Nebraska", (40.00, -104.05, 43.00, -95.31)),
+    "NV": ("Nevada", (35.00, -120.01, 42.00, -114.04)),
+    "NH": ("New Hampshire", (42.70, -72.56, 45.31, -70.61)),
+    "NJ": ("New Jersey", (38.93, -75.56, 41.36, -73.89)),
+    "NM": ("New Mexico", (31.33, -109.05, 37.00, -103.00)),
+    "NY": ("New York", (40.50, -79.76, 45.02, -71.86)),
+    "NC": ("North Carolina", (33.84, -84.32, 36.59, -75.46)),
+    "ND": ("North Dakota", (45.94, -104.05, 49.00, -96.55)),
+    "OH": ("Ohio", (38.40, -84.82, 41.98, -80.52)),
+    "OK": ("Oklahoma", (33.62, -103.00, 37.00, -94.43)),
+    "OR": ("Oregon", (41.99, -124.57, 46.29, -116.46)),
+    "PA": ("Pennsylvania", (39.72, -80.52, 42.27, -74.69)),
+    "RI": ("Rhode Island", (41.15, -71.86, 42.02, -71.12)),
+    "SC": ("South Carolina", (32.03, -83.35, 35.22, -78.54)),
+    "SD": ("South Dakota", (42.48, -104.06, 45.95, -96.44)),
+    "TN": ("Tennessee", (34.98, -90.31, 36.68, -81.65)),
+    "TX": ("Texas", (25.84, -106.65, 36.50, -93.51)),
+    "UT": ("Utah", (37.00, -114.05, 42.00, -109.04)),
+    "VT": ("Vermont", (42.73, -73.44, 45.02, -71.46)),
+    "VA": ("Virginia", (36.54, -83.68, 39.47, -75.24)),
+    "WA": ("Washington", (45.54, -124.85, 49.00, -116.92)),
+    "WV": ("West Virginia", (37.20, -82.64, 40.64, -77.72)),
+    "WI": ("Wisconsin", (42.49, -92.89, 47.31, -86.25)),
+    "WY": ("Wyoming", (41.00, -111.06, 45.01, -104.05)),
+}
+
+BBox = Tuple[float, float, float, float]  # (south, west, north, east)
+
+
+def find_state(location: str) -> Optional[Tuple[str, str, BBox]]:
+    """(abbreviation, name, bounds) for a US state name or code, else None."""
+    key = location.strip().lower()
+    for abbr, (name, bounds) in US_STATE_BOUNDS.items():
+        if key in (abbr.lower(), name.lower()):
+            return abbr, name, bounds
+    return None
+
+
+def bbox_polygon(bounds: BBox) -> dict:
+    """GeoJSON polygon (customGeolocation) for a bounding box."""
+    south, west, north, east = bounds
+    return {
+        "type": "Polygon",
+        "coordinates": [[[west, south], [east, south], [east, north], [west, north], [west, south]]]
+    }
+
+
+def grid_cells(bounds: BBox, cell_degrees: float) -> List[BBox]:
+    """Split bounds into a grid of boxes at most cell_degrees on a side."""
+    south, west, north, east = bounds
+    rows = max(1, int(-(-(north - south) // cell_degrees)))
+    cols = max(1, int(-(-(east - west) // cell_degrees)))
+    height = (north - south) / rows
+    width = (east - west) / cols
+    return [
+        (south + r * height, west + c * width, south + (r + 1) * height, west + (c + 1) * width)
+        for r in range(rows)
+        for c in range(cols)
+    ]
+
+
+def split_cell(bounds: BBox) -> List[BBox]:
+    """Quarter a box (used when a shard hits the per-search cap)."""
+    south, west, north, east = bounds
+    mid_lat = (south + north) / 2
+    mid_lng = (west + east) / 2
+    return [
+        (south, west, mid_lat, mid_lng),
+        (south, mid_lng, mid_lat, east),
+        (mid_lat, west, north, mid_lng),
+        (mid_lat, mid_lng, north, east)
+    ]
+
+
 # =============================================================================
 # MAIN SCRAPER FUNCTION
 # =============================================================================
 
+def _until_target_leads(
+    client: ApifyClient,
+    run_id: str,
+    raw_places: Iterable[dict],
+    target_leads: int
+) -> Iterator[dict]:
+    """
+    Pass places through until target_leads unique companies with a domain
+    have been seen, then abort the run so no more places are paid for.
+    """
+    domains = set()
+    for place in raw_places:
+        yield place
+
+        domain = extract_domain(place.get("website", ""))
+        if domain and place.get("title", "").strip():
+            domains.add(domain)
+            if len(domains) >= target_leads:
+                print(f"Target reached: {len(domains)} leads with a domain - stopping run {run_id}")
+                try:
+                    client.abort_run(run_id)
+                except Exception as e:
+                    print(f"Could not abort run {run_id} (it may have just finished): {e}")
+                return
+
+
 def scrape_leads(
     client: ApifyClient,
     niche: str,
     location: str,
     max_places: int = 600,
-    output_dir: str = "user-workspace"
+    output_dir: str = "user-workspace",
+    webhook_receiver: RunWebhookReceiver = None,
+    stream: bool = False,
+    parallel_fetch: bool = False,
+    extra_fields: List[str] = None,
+    project_fields: bool = True,
+    reattach: bool = True,
+    scrape_cache: ScrapeCache = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    target_leads: int = None,
+    delta: bool = False
 ) -> dict:
     """
     Complete lead scraping workflow for a niche.
@@ -314,10 +1456,38 @@ def scrape_leads(
         location: e.g., "California"
         max_places: Maximum places to scrape
         output_dir: Directory to save results
+        webhook_receiver: Optional started RunWebhookReceiver to get notified
+            the moment the run finishes
+        stream: Process and write leads page by page instead of loading the
+            whole dataset (flat memory for very large runs). The returned
+            dict then has no "leads" list - read them from the output file.
+        parallel_fetch: Download dataset pages concurrently (large datasets
+            finish in a few round trips instead of one per 1000 places)
+        extra_fields: Place keys to download and keep on each lead on top of
+            LEAD_SCHEMA (e.g. ["reviews"])
+        project_fields: Download only the fields leads need (set False to
+            fetch full place objects)
+        reattach: Reuse the run left behind by an earlier call for the same
+            niche/location that crashed or timed out (running or finished)
+            instead of starting and paying for a new one
+        scrape_cache: ScrapeCache to use (default: SCRAPE_CACHE_DIR under output_dir)
+        use_cache: Set False to bypass the scrape cache entirely (no read, no write)
+        refresh_cache: Always run a fresh scrape, but still cache its results
+        target_leads: Stop once this many unique leads with a domain are in:
+            the dataset is read while the run is still scraping and the run
+            is aborted at the target (max_places stays the upper bound).
+            Early-stopped results are not cached.
+        delta: Merge into the existing {niche-slug}-leads.json instead of
+            overwriting it, and write only new/changed leads (by place_id,
+            then domain) to {niche-slug}-delta-leads.json - enrich and
+            upload that file. Not available with stream.
 
     Returns:
         Processed leads data
     """
+    if delta and stream:
+        raise ValueError("delta mode needs the whole scrape in memory - use stream=False")
+
     print(f"\n{'='*60}")
     print(f"Scraping: {niche} in {location}")
     print(f"{'='*60}")
@@ -325,103 +1495,365 @@ def scrape_leads(
     # Build search query
     search_query = f"{niche} in {location}"
 
-    # Step 1: Start scraper
-    run_result = client.start_scraper(search_query, max_places)
+    niche_slug = slugify(niche)
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = os.path.join(output_dir, f"{niche_slug}-leads.json")
+    fields = dataset_fields(extra_fields) if project_fields else None
+    state_file = _run_state_file(output_dir, niche, location)
+
+    # Step 0: Same query and parameters scraped recently? Serve it from disk
+    if use_cache and scrape_cache is None:
+        scrape_cache = ScrapeCache(os.path.join(output_dir, SCRAPE_CACHE_DIR))
+    cache_key = ScrapeCache.key(search_query, max_places, fields) if use_cache else None
+    cached = scrape_cache.get(cache_key) if use_cache and not refresh_cache else None
+
+    # Step 1: Start scraper (or reattach to the run an earlier crash left behind)
+    state = None
+    if not cached and reattach:
+        state = _reattachable_run(client, load_run_state(state_file), search_query, max_places)
+
+    if cached:
+        run_id = cached.get("run_id")
+        print(f"Using cached scrape from {datetime.fromtimestamp(cached['cached_at']):%Y-%m-%d %H:%M} "
+              f"({cached['items']} places, run {run_id}) - pass use_cache=False to re-scrape")
+    elif state:
+        run_id = state["run_id"]
+        dataset_id = state["dataset_id"]
+    else:
+        run_result = client.start_scraper(search_query, max_places, webhook_receiver=webhook_receiver)
+        run_data = run_result.get("data", {})
+        run_id = run_data.get("id")
+        dataset_id = run_data.get("defaultDatasetId")
+
+        if not run_id:
+            raise Exception("Failed to start scraper - no run ID returned")
+
+        save_run_state(state_file, {
+            "run_id": run_id,
+            "dataset_id": dataset_id,
+            "niche": niche,
+            "location": location,
+            "search_query": search_query,
+            "max_places": max_places,
+            "started_at": datetime.now().isoformat()
+        })
+
+    if not cached:
+        print(f"Run ID: {run_id}")
+        print(f"Dataset ID: {dataset_id}")
+
+    if not cached and not target_leads:
+        # Step 2: Wait for completion
+        final_status = client.wait_for_completion(run_id, webhook_receiver=webhook_receiver)
+
+    cache_meta = {"search_query": search_query, "max_places": max_places, "fields": fields, "run_id": run_id}
+    # Early-stopped results are partial - don't serve them for the full max_places later
+    cache_results = use_cache and not cached and not target_leads
+
+    if stream:
+        # Steps 3-5: Retrieve, process and save page by page
+        if cached:
+            raw_places = scrape_cache.iter_items(cache_key)
+        elif target_leads:
+            # Step 2 folded in: read the dataset as the run fills it
+            raw_places = _until_target_leads(
+                client, run_id, client.iter_run_items(run_id, dataset_id, fields=fields), target_leads
+            )
+        elif parallel_fetch:
+            raw_places = client.iter_dataset_items_parallel(dataset_id, fields=fields)
+        else:
+            raw_places = client.iter_dataset_items(dataset_id, fields=fields)
+
+        if cache_results:
+            raw_places = scrape_cache.tee(cache_key, raw_places, cache_meta)
+
+        processed = process_leads_streaming(
+            raw_places,
+            niche,
+            location,
+            output_file,
+            metadata={"apify_run_id": run_id},
+            extra_fields=extra_fields
+        )
+        if not processed["total_found"]:
+            print("WARNING: No places found!")
+    else:
+        # Step 3: Retrieve results
+        if cached:
+            raw_places = list(scrape_cache.iter_items(cache_key))
+        elif target_leads:
+            raw_places = list(_until_target_leads(
+                client, run_id, client.iter_run_items(run_id, dataset_id, fields=fields), target_leads
+            ))
+        else:
+            raw_places = client.get_dataset_items(dataset_id, parallel=parallel_fetch, fields=fields)
+            if cache_results and raw_places:
+                scrape_cache.put(cache_key, raw_places, cache_meta)
+
+        if not raw_places:
+            print("WARNING: No places found!")
+            clear_run_state(state_file)
+            return {
+                "niche": niche,
+                "location": location,
+                "total_found": 0,
+                "emails_found": 0,
+                "find_rate": "0%",
+                "estimated_cost": "$0.00",
+                "scraped_at": datetime.now().isoformat(),
+                "leads": [],
+                "apify_run_id": run_id
+            }
+
+        # Step 4: Process results
+        processed = process_leads(raw_places, niche, location, extra_fields)
+        processed["apify_run_id"] = run_id
+
+        # Step 5: Save to file (delta mode: merge into it + write the delta)
+        if delta:
+            delta_file = os.path.join(output_dir, f"{niche_slug}-delta-leads.json")
+            processed = write_lead_delta(processed, output_file, delta_file)
+        else:
+            with open(output_file, "w") as f:
+                json.dump(processed, f, indent=2)
+
+    # The leads are on disk - the run is no longer needed
+    clear_run_state(state_file)
+    processed["from_cache"] = bool(cached)
+
+    print(f"\n✅ SCRAPING COMPLETE: {niche}")
+    print(f"   Companies found: {processed['total_found']}")
+    print(f"   Emails found: {processed['emails_found']} ({processed['find_rate']})")
+    print(f"   Cost: {'$0.00 (cached scrape)' if cached else processed['estimated_cost']}")
+    print(f"   Saved to: {output_file}")
+    if delta:
+        print(f"   New/changed leads: {processed['delta_file']}")
+
+    return processed
+
+
+def _scrape_shard(
+    client: ApifyClient,
+    niche: str,
+    bounds: BBox,
+    max_places: int,
+    fields: List[str],
+    webhook_receiver: RunWebhookReceiver = None
+) -> Tuple[str, List[dict]]:
+    """Run one map-box search to completion. Returns (run_id, places)."""
+    run_result = client.start_scraper(
+        niche, max_places, webhook_receiver=webhook_receiver, geolocation=bbox_polygon(bounds)
+    )
     run_data = run_result.get("data", {})
     run_id = run_data.get("id")
-    dataset_id = run_data.get("defaultDatasetId")
-
     if not run_id:
         raise Exception("Failed to start scraper - no run ID returned")
 
-    print(f"Run ID: {run_id}")
-    print(f"Dataset ID: {dataset_id}")
+    client.wait_for_completion(run_id, webhook_receiver=webhook_receiver)
+    return run_id, client.get_dataset_items(run_data.get("defaultDatasetId"), fields=fields)
 
-    # Step 2: Wait for completion
-    final_status = client.wait_for_completion(run_id)
 
-    # Step 3: Retrieve results
-    raw_places = client.get_dataset_items(dataset_id)
+def scrape_leads_sharded(
+    client: ApifyClient,
+    niche: str,
+    location: str,
+    max_places_per_shard: int = 600,
+    output_dir: str = "user-workspace",
+    bounds: BBox = None,
+    max_concurrent_runs: int = MAX_CONCURRENT_RUNS,
+    cell_degrees: float = SHARD_CELL_DEGREES,
+    min_cell_degrees: float = SHARD_MIN_CELL_DEGREES,
+    max_runs: int = SHARD_MAX_RUNS,
+    webhook_receiver: RunWebhookReceiver = None,
+    extra_fields: List[str] = None
+) -> dict:
+    """
+    Scrape a whole state (or any bounding box) past the per-search place cap.
 
-    if not raw_places:
-        print("WARNING: No places found!")
-        return {
-            "niche": niche,
-            "location": location,
-            "total_found": 0,
-            "emails_found": 0,
-            "find_rate": "0%",
-            "estimated_cost": "$0.00",
-            "scraped_at": datetime.now().isoformat(),
-            "leads": [],
-            "apify_run_id": run_id
-        }
+    The area is cut into a grid of map boxes, each searched for the niche by
+    its own actor run (up to max_concurrent_runs at once). A box that comes
+    back with max_places_per_shard places probably had more, so it is split
+    into 4 and each quarter is searched again, down to min_cell_degrees.
+    All places are merged through process_leads' domain dedup (and by place
+    ID), and places outside the state are dropped.
 
-    # Step 4: Process results
-    processed = process_leads(raw_places, niche, location)
-    processed["apify_run_id"] = run_id
+    Args:
+        client: ApifyClient instance
+        niche: e.g., "HVAC companies" (searched inside each box)
+        location: US state name or code, e.g. "California" / "CA"
+        max_places_per_shard: maxCrawledPlacesPerSearch for each box
+        output_dir: Directory to save results
+        bounds: (south, west, north, east) to shard instead of a bundled state
+        max_concurrent_runs: Max actor runs active at once
+        cell_degrees: Starting grid cell size
+        min_cell_degrees: Don't split boxes smaller than this
+        max_runs: Stop subdividing once this many runs have been started
+        webhook_receiver: Optional started RunWebhookReceiver shared by all runs
+        extra_fields: Place keys to keep on each lead on top of LEAD_SCHEMA
+
+    Returns:
+        Processed leads data (plus shard stats), saved as {niche-slug}-leads.json
+    """
+    print(f"\n{'='*60}")
+    print(f"Sharded scrape: {niche} in {location}")
+    print(f"{'='*60}")
+
+    state = find_state(location)
+    if bounds is None:
+        if state is None:
+            raise ValueError(f"No bundled bounds for '{location}' - pass bounds=(south, west, north, east)")
+        bounds = state[2]
+
+    fields = dataset_fields(extra_fields)
+    cells = grid_cells(bounds, cell_degrees)
+    print(f"Starting with {len(cells)} shards ({cell_degrees}° grid), "
+          f"up to {max_places_per_shard} places each, {max_concurrent_runs} at a time")
+
+    places_by_id = {}
+    run_ids = []
+    stats = {"shards": 0, "capped_shards": 0, "failed_shards": 0, "unsplit_capped_shards": 0, "places_billed": 0}
+    runs_started = 0
+
+    with ThreadPoolExecutor(max_workers=max_concurrent_runs) as executor:
+        in_flight = {}
+
+        def submit(cell):
+            nonlocal runs_started
+            runs_started += 1
+            future = executor.submit(
+                _scrape_shard, client, niche, cell, max_places_per_shard, fields, webhook_receiver
+            )
+            in_flight[future] = cell
+
+        for cell in cells:
+            submit(cell)
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                cell = in_flight.pop(future)
+                stats["shards"] += 1
+                try:
+                    run_id, places = future.result()
+                except Exception as e:
+                    print(f"ERROR in shard {cell}: {e}")
+                    stats["failed_shards"] += 1
+                    continue
+
+                run_ids.append(run_id)
+                stats["places_billed"] += len(places)  # Every shard run pays, overlaps included
+                for place in places:
+                    places_by_id.setdefault(place.get("placeId") or id(place), place)
+
+                capped = len(places) >= max_places_per_shard
+                print(f"Shard {stats['shards']}: {len(places)} places"
+                      f"{' (capped)' if capped else ''} | {len(places_by_id)} unique so far")
+                if not capped:
+                    continue
+
+                stats["capped_shards"] += 1
+                too_small = cell[2] - cell[0] <= min_cell_degrees and cell[3] - cell[1] <= min_cell_degrees
+                if too_small or runs_started + 4 > max_runs:
+                    stats["unsplit_capped_shards"] += 1
+                    print(f"WARNING: shard {cell} is capped but won't be split "
+                          f"({'minimum size' if too_small else f'{max_runs}-run budget'} reached)")
+                    continue
+                for quarter in split_cell(cell):
+                    submit(quarter)
+
+    raw_places = list(places_by_id.values())
+    if state is not None:
+        abbr, name = state[0].lower(), state[1].lower()
+        raw_places = [p for p in raw_places if (p.get("state") or "").strip().lower() in ("", abbr, name)]
+
+    processed = process_leads(raw_places, niche, location, extra_fields, billed_places=stats["places_billed"])
+    processed["apify_run_ids"] = run_ids
+    processed["shard_stats"] = stats
 
-    # Step 5: Save to file
     niche_slug = slugify(niche)
     os.makedirs(output_dir, exist_ok=True)
     output_file = os.path.join(output_dir, f"{niche_slug}-leads.json")
-
     with open(output_file, "w") as f:
         json.dump(processed, f, indent=2)
 
-    print(f"\n✅ SCRAPING COMPLETE: {niche}")
+    print(f"\n✅ SHARDED SCRAPING COMPLETE: {niche}")
+    print(f"   Shards run: {stats['shards']} ({stats['capped_shards']} capped and split, "
+          f"{stats['failed_shards']} failed)")
     print(f"   Companies found: {processed['total_found']}")
     print(f"   Emails found: {processed['emails_found']} ({processed['find_rate']})")
-    print(f"   Cost: {processed['estimated_cost']}")
+    print(f"   Cost: {processed['estimated_cost']} ({stats['places_billed']} places across all shard runs)")
     print(f"   Saved to: {output_file}")
 
     return processed
 
 
-def scrape_multiple_niches(
+def _scrape_niche_config(
+    client: ApifyClient,
+    niche_config: dict,
+    output_dir: str,
+    webhook_receiver: RunWebhookReceiver = None
+) -> dict:
+    """Scrape one niche config, returning an error record instead of raising."""
+    try:
+        if niche_config.get("sharded"):
+            return scrape_leads_sharded(
+                client=client,
+                niche=niche_config["niche"],
+                location=niche_config["location"],
+                max_places_per_shard=niche_config.get("max_places", 600),
+                output_dir=output_dir,
+                webhook_receiver=webhook_receiver
+            )
+        return scrape_leads(
+            client=client,
+            niche=niche_config["niche"],
+            location=niche_config.get("location", "United States"),
+            max_places=niche_config.get("max_places", 600),
+            output_dir=output_dir,
+            webhook_receiver=webhook_receiver
+        )
+    except Exception as e:
+        print(f"ERROR scraping {niche_config['niche']}: {e}")
+        return {
+            "niche": niche_config["niche"],
+            "error": str(e)
+        }
+
+
+def _scrape_niches_concurrently(
     client: ApifyClient,
     niches: List[dict],
-    output_dir: str = "user-workspace"
+    output_dir: str,
+    max_concurrent_runs: int,
+    webhook_receiver: RunWebhookReceiver = None
 ) -> List[dict]:
     """
-    Scrape leads for multiple niches.
-
-    Args:
-        client: ApifyClient instance
-        niches: List of {"niche": "...", "location": "...", "max_places": 600}
-        output_dir: Directory to save results
+    Scrape niches in parallel, with at most max_concurrent_runs actor runs active.
 
-    Returns:
-        List of processed lead data for each niche
+    Each worker owns one actor run from start to finish, so the pool size is
+    the cap on active runs. Results are collected as runs finish and returned
+    in the same order as the input configs.
     """
-    results = []
+    results = [None] * len(niches)
+    print(f"Scraping {len(niches)} niches concurrently (max {max_concurrent_runs} active runs)...")
+
+    with ThreadPoolExecutor(max_workers=max_concurrent_runs) as executor:
+        futures = {
+            executor.submit(
+                _scrape_niche_config, client, niche_config, output_dir, webhook_receiver
+            ): i
+            for i, niche_config in enumerate(niches)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            results[i] = future.result()
+            print(f"\n[{done}/{len(niches)}] Finished: {niches[i]['niche']}")
 
-    for i, niche_config in enumerate(niches, 1):
-        print(f"\n[{i}/{len(niches)}] Processing niche...")
+    return results
 
-        try:
-            result = scrape_leads(
-                client=client,
-                niche=niche_config["niche"],
-                location=niche_config.get("location", "United States"),
-                max_places=niche_config.get("max_places", 600),
-                output_dir=output_dir
-            )
-            results.append(result)
 
-        except Exception as e:
-            print(f"ERROR scraping {niche_config['niche']}: {e}")
-            results.append({
-                "niche": niche_config["niche"],
-                "error": str(e)
-            })
-
-        # Small delay between niches
-        if i < len(niches):
-            print("Waiting 5 seconds before next niche...")
-            time.sleep(5)
-
-    # Summary
+def _print_scraping_summary(results: List[dict]):
+    """Print totals across all scraped niches."""
     print(f"\n{'='*60}")
     print("SCRAPING SUMMARY")
     print(f"{'='*60}")
@@ -442,6 +1874,49 @@ def scrape_multiple_niches(
     print(f"\nTotal: {total_leads} companies, {total_emails} emails")
     print(f"Total cost: ${total_cost:.2f}")
 
+
+def scrape_multiple_niches(
+    client: ApifyClient,
+    niches: List[dict],
+    output_dir: str = "user-workspace",
+    concurrent: bool = False,
+    max_concurrent_runs: int = MAX_CONCURRENT_RUNS,
+    webhook_receiver: RunWebhookReceiver = None
+) -> List[dict]:
+    """
+    Scrape leads for multiple niches.
+
+    Args:
+        client: ApifyClient instance
+        niches: List of {"niche": "...", "location": "...", "max_places": 600}
+            (add "sharded": True to split a state into map boxes - see
+            scrape_leads_sharded)
+        output_dir: Directory to save results
+        concurrent: Run niches in parallel instead of one at a time
+        max_concurrent_runs: Max actor runs active at once (concurrent mode only)
+        webhook_receiver: Optional started RunWebhookReceiver shared by all runs
+
+    Returns:
+        List of processed lead data for each niche (same order as niches)
+    """
+    if concurrent:
+        results = _scrape_niches_concurrently(
+            client, niches, output_dir, max_concurrent_runs, webhook_receiver
+        )
+    else:
+        results = []
+
+        for i, niche_config in enumerate(niches, 1):
+            print(f"\n[{i}/{len(niches)}] Processing niche...")
+            results.append(_scrape_niche_config(client, niche_config, output_dir, webhook_receiver))
+
+            # Small delay between niches
+            if i < len(niches):
+                print("Waiting 5 seconds before next niche...")
+                time.sleep(5)
+
+    _print_scraping_summary(results)
+
     return results
 
 
@@ -458,7 +1933,7 @@ if __name__ == "__main__":
 
     Usage:
 
-        from apify_lead_scraper import ApifyClient, scrape_leads, scrape_multiple_niches
+        from apify_lead_scraper import ApifyClient, scrape_leads, scrape_leads_sharded, scrape_multiple_niches
 
         # Initialize client
         client = ApifyClient("your_apify_api_key")
@@ -471,6 +1946,22 @@ if __name__ == "__main__":
             max_places=600
         )
 
+        # Very large scrapes: process and write leads page by page (flat memory)
+        result = scrape_leads(client, "HVAC companies", "Texas", max_places=50000, stream=True)
+
+        # Re-running the same niche/location/max_places within 7 days is served
+        # from user-workspace/.cache/apify-scrapes (free). Force a new scrape:
+        result = scrape_leads(client, "HVAC companies", "Texas", refresh_cache=True)
+
+        # Stop (and stop paying) once 300 companies with a website are in
+        result = scrape_leads(client, "HVAC companies", "Texas", max_places=2000, target_leads=300)
+
+        # Monthly re-scrape: only new/changed leads go to hvac-companies-delta-leads.json
+        result = scrape_leads(client, "HVAC companies", "Texas", delta=True)
+
+        # Whole state past the per-search cap: map boxes, split further where capped
+        result = scrape_leads_sharded(client, "HVAC companies", "California", max_places_per_shard=600)
+
         # Multiple niches (Mission 2)
         niches = [
             {"niche": "HVAC inspection companies", "location": "California", "max_places": 600},
@@ -479,6 +1970,15 @@ if __name__ == "__main__":
         ]
         results = scrape_multiple_niches(client, niches)
 
+        # Multiple niches in parallel (up to 5 actor runs at once)
+        results = scrape_multiple_niches(client, niches, concurrent=True, max_concurrent_runs=5)
+
+        # asyncio (pip install aiohttp): drive many runs from one event loop
+        client = AsyncApifyClient("your_apify_api_key")
+        run = await client.start_scraper("HVAC inspection companies in California")
+        await client.wait_for_completion(run["data"]["id"])
+        places = await client.get_dataset_items(run["data"]["defaultDatasetId"], fields=dataset_fields())
+
     Output saved to: user-workspace/{niche-slug}-leads.json
 
     Cost: ~$2.40 per niche (600 places × $0.004)
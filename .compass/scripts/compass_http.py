@@ -0,0 +1,505 @@
+"""
+Compass HTTP Transport
+======================
+Shared HTTP layer used by the Apify, AnyMailFinder and Instantly clients.
+
+Key Features:
+- One pooled requests.Session (keep-alive) shared by every client
+- Per-host connection pool sizing
+- Default connect/read timeouts on every request
+- Pluggable retry policy (urllib3 Retry)
+- asyncio transport (aiohttp) with bounded concurrency per host
+- Thread-safe adaptive token bucket rate limiter
+- Backoff policy (exponential, jittered, Retry-After aware) and circuit breaker
+
+Usage:
+    from compass_http import HttpTransport, get_transport, set_transport
+
+    # All clients share get_transport() by default
+    response = get_transport().request("GET", url, headers=headers)
+
+    # Custom transport (e.g. longer timeouts, different retry policy)
+    transport = HttpTransport(timeout=(5, 120), retry=Retry(total=5, backoff_factor=1))
+    client = ApifyClient(api_key, transport=transport)   # one client
+    set_transport(transport)                              # or every client
+
+    # asyncio clients (requires: pip install aiohttp)
+    async with AsyncHttpTransport() as transport:
+        client = AsyncApifyClient(api_key, transport=transport)
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:  # Optional: only the async clients need it
+    aiohttp = None
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# (connect, read) timeout in seconds applied when a call doesn't pass one
+DEFAULT_TIMEOUT = (5, 60)
+
+# Keep-alive connections kept open per host
+DEFAULT_POOL_SIZE = 10
+HOST_POOL_SIZES = {
+    "api.apify.com": 16,           # concurrent runs + parallel dataset pages
+    "api.anymailfinder.com": 10,
+    "api.instantly.ai": 10
+}
+
+# Max in-flight requests per host for the async transport
+DEFAULT_HOST_CONCURRENCY = 50
+HOST_CONCURRENCY = {
+    "api.apify.com": 64,
+    "api.anymailfinder.com": 50,
+    "api.instantly.ai": 50
+}
+
+# Token bucket recovery: requests/second regained per successful request
+# after a 429 halved the rate (additive increase, multiplicative decrease)
+RATE_RECOVERY_STEP = 0.05
+
+# Backoff for retryable responses (429, 5xx, timeouts)
+MAX_RETRIES = 4
+RETRY_BASE_DELAY = 1.0  # seconds; doubles per attempt (with full jitter)
+RETRY_MAX_DELAY = 60.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# =============================================================================
+# TRANSPORT
+# =============================================================================
+
+
+def default_retry() -> Retry:
+    """
+    Default retry policy: retry connection failures only.
+
+    A failed connect means the request never reached the server, so it is
+    safe to retry for any method. Read errors and HTTP status codes are not
+    retried here - POSTs aren't idempotent, and each client decides how to
+    handle 429/5xx itself.
+    """
+    return Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=0.5,
+        raise_on_status=False
+    )
+
+
+class HttpTransport:
+    def __init__(
+        self,
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        retry: Optional[Retry] = None,
+        pool_sizes: Dict[str, int] = None,
+        default_pool_size: int = DEFAULT_POOL_SIZE
+    ):
+        """
+        Args:
+            timeout: Default (connect, read) timeout for every request
+            retry: urllib3 Retry policy (default: default_retry())
+            pool_sizes: Per-host pool sizes, e.g. {"api.apify.com": 32}
+            default_pool_size: Pool size for hosts not in pool_sizes
+        """
+        self.timeout = timeout
+        self.retry = retry if retry is not None else default_retry()
+        self.session = requests.Session()
+
+        self.session.mount("https://", self._adapter(default_pool_size))
+        self.session.mount("http://", self._adapter(default_pool_size))
+        for host, size in {**HOST_POOL_SIZES, **(pool_sizes or {})}.items():
+            self.set_pool_size(host, size)
+
+    def _adapter(self, pool_size: int) -> HTTPAdapter:
+        return HTTPAdapter(pool_maxsize=pool_size, max_retries=self.retry)
+
+    def set_pool_size(self, host: str, pool_size: int):
+        """Give a host its own keep-alive pool of pool_size connections."""
+        self.session.mount(f"https://{host}", self._adapter(pool_size))
+
+    def request(self, method: str, url: str, timeout=None, **kwargs) -> requests.Response:
+        """Send a request over the pooled session (same kwargs as requests)."""
+        return self.session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+
+_shared_transport = None
+_shared_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """Return the process-wide shared transport, creating it on first use."""
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is None:
+            _shared_transport = HttpTransport()
+        return _shared_transport
+
+
+def set_transport(transport: HttpTransport):
+    """Replace the shared transport used by clients created afterwards."""
+    global _shared_transport
+    with _shared_lock:
+        _shared_transport = transport
+
+
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def request_never_sent(error: Exception) -> bool:
+    """
+    Whether a transport error means the request never reached the server.
+
+    Only then is re-sending a POST safe. After a read timeout or a dropped
+    connection the server may already have acted on it.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    if aiohttp is not None:
+        connect_errors = (aiohttp.ClientConnectorError, getattr(aiohttp, "ConnectionTimeoutError", aiohttp.ClientConnectorError))
+        return isinstance(error, connect_errors)
+    return False
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        min_rate: float = None
+    ):
+        """
+        Thread-safe token bucket shared by every worker hitting one API.
+
+        acquire() blocks until a request may be sent (await acquire_async()
+        from asyncio code - it sleeps without blocking the event loop, and
+        both may share one bucket). The refill rate adapts
+        to the server: throttle() (on 429) halves it and pauses for any
+        Retry-After, update_from_headers() pauses when the server says the
+        window is used up, and each success() creeps the rate back toward
+        the configured ceiling.
+
+        Args:
+            rate: Requests per second - set to the account's real limit
+            capacity: Burst size (default 1 = evenly spaced requests, which
+                stays under strict sliding-window limits)
+            min_rate: Floor for throttling (default: rate / 20)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate or rate / 20
+        self.capacity = capacity
+        self.tokens = self.capacity
+        self.paused_until = 0.0
+        self.throttle_count = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self) -> float:
+        """Take a token if one is available (returns 0), else the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """acquire() for coroutines: waits with asyncio.sleep."""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def throttle(self, retry_after: float = None):
+        """Server said slow down (429): halve the rate and drain the bucket."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = 0
+            self.throttle_count += 1
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+
+    def success(self):
+        """Request went through: additively recover toward the configured rate."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + RATE_RECOVERY_STEP)
+
+    def update_from_headers(self, headers):
+        """
+        Tune from rate-limit headers when the API sends them.
+
+        Understands X-RateLimit-Remaining / X-RateLimit-Reset (and the
+        RateLimit-* draft names): when nothing is left in the window, wait
+        for the reset (seconds, or a Unix timestamp) before the next request.
+        """
+        remaining = headers.get("X-RateLimit-Remaining", headers.get("RateLimit-Remaining"))
+        reset = headers.get("X-RateLimit-Reset", headers.get("RateLimit-Reset"))
+        try:
+            if remaining is None or float(remaining) > 0 or reset is None:
+                return
+            reset_seconds = float(reset)
+        except ValueError:
+            return
+
+        if reset_seconds > time.time():  # Absolute epoch timestamp
+            reset_seconds -= time.time()
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + min(reset_seconds, 3600))
+
+
+# =============================================================================
+# RETRIES & CIRCUIT BREAKING
+# =============================================================================
+
+
+class BackoffPolicy:
+    def __init__(
+        self,
+        max_retries: int = MAX_RETRIES,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        retry_statuses: Tuple[int, ...] = RETRY_STATUSES
+    ):
+        """
+        When and how long to wait before retrying a request.
+
+        Delays grow exponentially with "full jitter" (a random wait between
+        0 and base_delay * 2^attempt), so parallel workers that failed
+        together don't retry together. A server-sent Retry-After always
+        wins over the computed delay.
+
+        Args:
+            max_retries: Retries after the first attempt before giving up
+            base_delay: Upper bound of the first retry's delay (seconds)
+            max_delay: Cap on any single delay
+            retry_statuses: HTTP statuses worth retrying
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+
+    def should_retry(self, attempt: int, status_code: int = None) -> bool:
+        """attempt is 0 for the first try. status_code None = network error."""
+        if attempt >= self.max_retries:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: float = None) -> float:
+        """Seconds to sleep before retry number attempt + 1."""
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitOpenError(Exception):
+    """A circuit breaker tripped: calls can't succeed until someone steps in."""
+
+
+class CircuitBreaker:
+    """
+    Latching circuit breaker for errors that retrying can't fix.
+
+    Trip it on fatal responses (invalid key, no credits). From then on
+    check() raises CircuitOpenError immediately, so every worker and every
+    queued call stops instead of spending time on requests that will fail.
+    It stays open for the rest of the process; fix the cause and re-run.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.reason = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.reason is not None
+
+    def trip(self, reason: str):
+        with self._lock:
+            if self.reason is None:
+                self.reason = reason
+
+    def check(self):
+        """Raise CircuitOpenError if the breaker has tripped."""
+        if self.reason is not None:
+            raise CircuitOpenError(f"{self.name}: {self.reason}")
+
+
+# =============================================================================
+# ASYNC TRANSPORT
+# =============================================================================
+
+
+class AsyncResponse:
+    """Fully read aiohttp response with the parts of requests.Response we use."""
+
+    def __init__(self, method: str, url: str, status_code: int, headers, content: bytes):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        """Raise requests' HTTPError so sync and async callers handle errors alike."""
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+
+class AsyncHttpTransport:
+    def __init__(
+        self,
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        host_concurrency: Dict[str, int] = None,
+        default_host_concurrency: int = DEFAULT_HOST_CONCURRENCY
+    ):
+        """
+        asyncio counterpart of HttpTransport, built on aiohttp.
+
+        One keep-alive session serves every async client on the event loop,
+        and a semaphore per host caps in-flight requests to that host.
+        Create and use it inside a single event loop.
+
+        Args:
+            timeout: Default (connect, read) timeout for every request
+            host_concurrency: Per-host in-flight caps, e.g. {"api.apify.com": 100}
+            default_host_concurrency: Cap for hosts not in host_concurrency
+        """
+        if aiohttp is None:
+            raise ImportError("The async clients need aiohttp: pip install aiohttp")
+
+        self.timeout = timeout
+        self.host_concurrency = {**HOST_CONCURRENCY, **(host_concurrency or {})}
+        self.default_host_concurrency = default_host_concurrency
+        self._semaphores = {}
+        self._session = None
+
+    def _client_timeout(self, timeout) -> "aiohttp.ClientTimeout":
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=timeout)
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._semaphores:
+            limit = self.host_concurrency.get(host, self.default_host_concurrency)
+            self._semaphores[host] = asyncio.Semaphore(limit)
+        return self._semaphores[host]
+
+    async def request(self, method: str, url: str, timeout=None, **kwargs) -> AsyncResponse:
+        """Send a request (aiohttp kwargs: params, json, headers) and read the body."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0),
+                timeout=self._client_timeout(self.timeout)
+            )
+
+        if kwargs.get("params"):
+            kwargs["params"] = {k: str(v) for k, v in kwargs["params"].items() if v is not None}
+
+        request_kwargs = dict(kwargs)
+        if timeout is not None:
+            request_kwargs["timeout"] = self._client_timeout(timeout)
+
+        async with self._semaphore(urlsplit(url).hostname):
+            async with self._session.request(method, url, **request_kwargs) as response:
+                content = await response.read()
+                return AsyncResponse(method, url, response.status, response.headers, content)
+
+    async def close(self):
+        """Close the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncHttpTransport":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+_async_transports = weakref.WeakKeyDictionary()
+
+
+def get_async_transport() -> AsyncHttpTransport:
+    """
+    Return the shared async transport for the running event loop.
+
+    Call `await get_async_transport().close()` before the loop ends.
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in _async_transports:
+        _async_transports[loop] = AsyncHttpTransport()
+    return _async_transports[loop]
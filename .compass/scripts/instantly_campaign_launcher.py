@@ -8,15 +8,34 @@ Usage:
 
 Workflow:
     1. Create campaign with embedded 3-step sequence (Day 0, Day 3, Day 7)
-    2. Add leads in bulk with custom variables
+    2. Add leads in bulk with custom variables (one request per chunk)
     3. Activate campaign
 """
 
 import requests
+import asyncio
+import hashlib
 import json
+import math
+import os
+import re
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+from compass_http import (
+    AsyncHttpTransport,
+    BackoffPolicy,
+    HttpTransport,
+    TokenBucket,
+    get_async_transport,
+    get_transport,
+    parse_retry_after,
+    request_never_sent
+)
 
 # =============================================================================
 # CONFIGURATION
@@ -25,13 +44,138 @@ from typing import List, Dict, Optional
 INSTANTLY_API_KEY = ""  # Set via environment variable or config file
 BASE_URL = "https://api.instantly.ai/api/v2"
 
+# Bulk lead import: leads per POST /leads/add request, pause between requests
+LEAD_BATCH_SIZE = 500
+BATCH_DELAY = 0.5
+
+# Per-lead uploads (rows the bulk import rejects, or bulk=False): a worker pool
+# shares one token bucket. Set rate_limit= to your workspace's API limit.
+INSTANTLY_RATE_LIMIT = 10  # requests per second
+UPLOAD_WORKERS = 8
+UPLOAD_PROGRESS_INTERVAL = 500  # Print progress every N per-lead uploads
+
+# Launch journals (under output_dir): one JSONL file per campaign name recording
+# the campaign ID, accepted emails and activation, so a re-run resumes instead
+# of duplicating
+LAUNCH_JOURNAL_DIR = ".instantly-launches"
+
+# launch_campaigns: campaigns created/filled at once (all share the client's rate limit)
+MAX_CONCURRENT_LAUNCHES = 3
+
+# Suppression index (under output_dir): every email (and company domain) ever
+# uploaded or contacted, checked before payloads are built so nobody is
+# uploaded twice across niche files and campaigns
+SUPPRESSION_INDEX_FILE = os.path.join(".cache", "instantly-suppression.sqlite")
+SUPPRESSION_BLOOM_CAPACITY = 1_000_000  # Entries before the filter is rebuilt twice as large
+SUPPRESSION_BLOOM_ERROR_RATE = 0.001
+# Shared mailbox providers - never suppressed as a whole domain
+FREE_EMAIL_DOMAINS = {
+    "gmail.com", "googlemail.com", "yahoo.com", "hotmail.com", "outlook.com", "live.com",
+    "msn.com", "aol.com", "icloud.com", "me.com", "comcast.net", "att.net", "proton.me"
+}
+
 # =============================================================================
 # API CLIENT
 # =============================================================================
 
+def build_campaign_payload(name: str) -> dict:
+    """Campaign creation body with the embedded 3-step sequence (see create_campaign)."""
+    return {
+        "name": name,
+        "campaign_schedule": {
+            "schedules": [
+                {
+                    "name": f"{name} Schedule",
+                    "timing": {
+                        "from": "09:00",
+                        "to": "17:00"
+                    },
+                    "days": {
+                        "0": False,  # Sunday - OFF
+                        "1": True,   # Monday - ON
+                        "2": True,   # Tuesday - ON
+                        "3": True,   # Wednesday - ON
+                        "4": True,   # Thursday - ON
+                        "5": True,   # Friday - ON
+                        "6": False   # Saturday - OFF
+                    },
+                    "timezone": "America/Dawson"  # Pacific Time (Instantly accepted format)
+                }
+            ]
+        },
+        "sequences": [
+            {
+                "steps": [
+                    # Email 1 - Day 0 (Initial email with A/B/C subject testing)
+                    # delay: 3 = wait 3 days AFTER this email before sending Email 2
+                    {
+                        "type": "email",
+                        "delay": 3,
+                        "variants": [
+                            {
+                                "subject": "{{subject_variant_a}}",
+                                "body": "{{email_body}}"
+                            },
+                            {
+                                "subject": "{{subject_variant_b}}",
+                                "body": "{{email_body}}"
+                            },
+                            {
+                                "subject": "{{subject_variant_c}}",
+                                "body": "{{email_body}}"
+                            }
+                        ]
+                    },
+                    # Email 2 - Day 3 (Follow-up)
+                    # delay: 4 = wait 4 days AFTER this email before sending Email 3
+                    {
+                        "type": "email",
+                        "delay": 4,
+                        "variants": [
+                            {
+                                "subject": "Re: {{subject_variant_a}}",
+                                "body": "{{follow_up_day_3}}"
+                            }
+                        ]
+                    },
+                    # Email 3 - Day 7 (Final follow-up)
+                    # delay: 0 = no delay after (last email in sequence)
+                    {
+                        "type": "email",
+                        "delay": 0,
+                        "variants": [
+                            {
+                                "subject": "Last note - {{problem_angle}}",
+                                "body": "{{follow_up_day_7}}"
+                            }
+                        ]
+                    }
+                ]
+            }
+        ]
+    }
+
+
 class InstantlyClient:
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        transport: HttpTransport = None,
+        rate_limit: float = INSTANTLY_RATE_LIMIT,
+        backoff: BackoffPolicy = None
+    ):
+        """
+        Args:
+            api_key: Instantly API key
+            transport: HTTP transport (default: shared get_transport())
+            rate_limit: Requests per second for this workspace, shared by
+                every request and upload worker of this client
+            backoff: Retry policy for 429/5xx/timeouts on per-lead uploads
+        """
         self.api_key = api_key
+        self.transport = transport or get_transport()
+        self.rate_limiter = TokenBucket(rate_limit)
+        self.backoff = backoff or BackoffPolicy()
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
@@ -42,14 +186,15 @@ class InstantlyClient:
         url = f"{BASE_URL}{endpoint}"
 
         try:
+            self.rate_limiter.acquire()
             if method == "GET":
-                response = requests.get(url, headers=self.headers, params=data)
+                response = self.transport.request("GET", url, headers=self.headers, params=data)
             elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
+                response = self.transport.request("POST", url, headers=self.headers, json=data)
             elif method == "PATCH":
-                response = requests.patch(url, headers=self.headers, json=data)
+                response = self.transport.request("PATCH", url, headers=self.headers, json=data)
             elif method == "DELETE":
-                response = requests.delete(url, headers=self.headers)
+                response = self.transport.request("DELETE", url, headers=self.headers)
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
@@ -87,80 +232,7 @@ class InstantlyClient:
         - Email 2: delay 3 (3 days after Email 1 = Day 3)
         - Email 3: delay 4 (4 days after Email 2 = Day 7)
         """
-        payload = {
-            "name": name,
-            "campaign_schedule": {
-                "schedules": [
-                    {
-                        "name": f"{name} Schedule",
-                        "timing": {
-                            "from": "09:00",
-                            "to": "17:00"
-                        },
-                        "days": {
-                            "0": False,  # Sunday - OFF
-                            "1": True,   # Monday - ON
-                            "2": True,   # Tuesday - ON
-                            "3": True,   # Wednesday - ON
-                            "4": True,   # Thursday - ON
-                            "5": True,   # Friday - ON
-                            "6": False   # Saturday - OFF
-                        },
-                        "timezone": "America/Dawson"  # Pacific Time (Instantly accepted format)
-                    }
-                ]
-            },
-            "sequences": [
-                {
-                    "steps": [
-                        # Email 1 - Day 0 (Initial email with A/B/C subject testing)
-                        # delay: 3 = wait 3 days AFTER this email before sending Email 2
-                        {
-                            "type": "email",
-                            "delay": 3,
-                            "variants": [
-                                {
-                                    "subject": "{{subject_variant_a}}",
-                                    "body": "{{email_body}}"
-                                },
-                                {
-                                    "subject": "{{subject_variant_b}}",
-                                    "body": "{{email_body}}"
-                                },
-                                {
-                                    "subject": "{{subject_variant_c}}",
-                                    "body": "{{email_body}}"
-                                }
-                            ]
-                        },
-                        # Email 2 - Day 3 (Follow-up)
-                        # delay: 4 = wait 4 days AFTER this email before sending Email 3
-                        {
-                            "type": "email",
-                            "delay": 4,
-                            "variants": [
-                                {
-                                    "subject": "Re: {{subject_variant_a}}",
-                                    "body": "{{follow_up_day_3}}"
-                                }
-                            ]
-                        },
-                        # Email 3 - Day 7 (Final follow-up)
-                        # delay: 0 = no delay after (last email in sequence)
-                        {
-                            "type": "email",
-                            "delay": 0,
-                            "variants": [
-                                {
-                                    "subject": "Last note - {{problem_angle}}",
-                                    "body": "{{follow_up_day_7}}"
-                                }
-                            ]
-                        }
-                    ]
-                }
-            ]
-        }
+        payload = build_campaign_payload(name)
 
         print(f"Creating campaign: {name}")
         result = self._request("POST", "/campaigns", payload)
@@ -186,9 +258,17 @@ class InstantlyClient:
         """Get campaign details."""
         return self._request("GET", f"/campaigns/{campaign_id}")
 
-    def list_campaigns(self) -> dict:
-        """List all campaigns."""
-        return self._request("GET", "/campaigns")
+    def list_campaigns(self, search: str = None, limit: int = None, starting_after: str = None) -> dict:
+        """
+        List campaigns, one page at a time.
+
+        Args:
+            search: Only campaigns whose name contains this
+            limit: Page size
+            starting_after: next_starting_after from the previous page
+        """
+        params = {"search": search, "limit": limit, "starting_after": starting_after}
+        return self._request("GET", "/campaigns", {k: v for k, v in params.items() if v is not None} or None)
 
     def get_campaign_analytics(self, campaign_id: str) -> dict:
         """Get campaign analytics."""
@@ -202,49 +282,165 @@ class InstantlyClient:
         self,
         campaign_id: str,
         leads: List[dict],
-        skip_if_in_workspace: bool = False
+        skip_if_in_workspace: bool = False,
+        bulk: bool = True
     ) -> dict:
         """
         Step 2: Add leads in bulk to a campaign with custom variables.
 
-        Endpoint: POST /api/v2/leads
+        Endpoint: POST /api/v2/leads/add (one request for the whole chunk -
+        keep chunks to LEAD_BATCH_SIZE). Rows the import doesn't create are
+        retried one by one through POST /api/v2/leads, so a single bad row
+        doesn't cost the chunk. The bulk request itself is rate limited and
+        retried on 429/5xx/connect errors. Only if the server rejects the
+        payload (other 4xx) is every row posted singly; after a read timeout
+        or persistent 5xx the chunk is marked failed rather than re-posted,
+        since the import may have gone through.
 
-        IMPORTANT: V2 API requires 'campaign' field directly in each lead object,
-        NOT 'campaign_id' in the parent payload.
+        IMPORTANT: The per-lead endpoint requires 'campaign' directly in each
+        lead object; the bulk endpoint takes 'campaign_id' once.
 
         Each lead must include:
         - email: Lead's email address (required)
-        - campaign: Campaign ID (required)
         - first_name, last_name, company_name: Lead info
         - custom_variables: Dict with email_body, subject variants, follow-ups, etc.
+
+        Returns:
+            {"added": n, "errors": n, "failed": [...], "manifest": [...]} -
+            manifest has one row per lead: {"email", "status" ("added" /
+            "failed" / "submitted" when the bulk response has no per-row
+            detail), "via" ("bulk" / "single"), "lead_id" or "error"}
         """
-        # V2 API: Each lead needs 'campaign' field directly in the lead object
-        leads_with_campaign = []
-        for lead in leads:
-            lead_copy = lead.copy()
-            lead_copy["campaign"] = campaign_id
-            if skip_if_in_workspace:
-                lead_copy["skip_if_in_workspace"] = True
-            leads_with_campaign.append(lead_copy)
-
-        print(f"Adding {len(leads_with_campaign)} leads to campaign {campaign_id}")
-
-        # Add leads one at a time or in small batches (V2 API prefers this)
-        added = 0
-        errors = 0
+        print(f"Adding {len(leads)} leads to campaign {campaign_id}")
+
+        manifest = []
+        retry = leads
+        reasons = {}
+
+        if bulk and leads:
+            outcome, detail = self._post_bulk(_bulk_leads_payload(leads, campaign_id, skip_if_in_workspace))
+            manifest, retry, reasons = _bulk_outcome(leads, outcome, detail)
+
+        if retry:
+            manifest += self.upload_leads_individually(campaign_id, retry, skip_if_in_workspace)
+
+        return _upload_summary(manifest, reasons)
+
+    def _post_bulk(self, payload: dict) -> Tuple[str, object]:
+        """
+        POST /leads/add with rate limiting and retries.
 
-        for lead in leads_with_campaign:
+        Returns:
+            ("ok", response body), ("rejected", error) if the server refused
+            the payload itself (4xx other than 429), or ("failed", error) if
+            it's unknown whether the import happened (read timeout, 5xx or
+            429 after all retries)
+        """
+        attempt = 0
+
+        while True:
+            retry_after = None
             try:
-                result = self._request("POST", "/leads", lead)
-                if result.get("id"):
-                    added += 1
-            except Exception as e:
-                errors += 1
-                if errors <= 3:  # Only print first 3 errors
-                    print(f"  Error adding lead {lead.get('email')}: {e}")
+                self.rate_limiter.acquire()
+                response = self.transport.request("POST", f"{BASE_URL}/leads/add", headers=self.headers, json=payload)
+            except requests.exceptions.RequestException as e:
+                if not request_never_sent(e):
+                    return "failed", f"{type(e).__name__}: {e}"
+                status = None
+                error = str(e)
+            else:
+                status = response.status_code
+                self.rate_limiter.update_from_headers(response.headers)
+                outcome = _bulk_response_outcome(response)
+                if outcome is not None:
+                    if outcome[0] == "ok":
+                        self.rate_limiter.success()
+                    return outcome
+
+                error = f"HTTP {status}: {response.text[:200]}"
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if status == 429:
+                    self.rate_limiter.throttle(retry_after)
+
+            if not self.backoff.should_retry(attempt, status):
+                return "failed", error
+            if status != 429 or retry_after is None:
+                time.sleep(self.backoff.delay(attempt, retry_after))
+            attempt += 1
+
+    def upload_leads_individually(
+        self,
+        campaign_id: str,
+        leads: List[dict],
+        skip_if_in_workspace: bool = False,
+        workers: int = UPLOAD_WORKERS
+    ) -> List[dict]:
+        """
+        POST /api/v2/leads for each lead from a pool of workers.
 
-        print(f"Leads added: {added}, Errors: {errors}")
-        return {"added": added, "errors": errors}
+        All workers share the client's rate limiter; 429s slow it down (and
+        honour Retry-After), 429/5xx/connect errors are retried per
+        self.backoff. A read timeout is not retried - the lead may already
+        exist - and is recorded as failed with that note. Nothing is raised per lead - every outcome goes into
+        the manifest.
+
+        Returns:
+            Manifest rows in lead order (see add_leads_to_campaign)
+        """
+        leads_with_campaign = _leads_with_campaign(leads, campaign_id, skip_if_in_workspace)
+        manifest = []
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for done, row in enumerate(executor.map(self._post_lead, leads_with_campaign), 1):
+                manifest.append(row)
+                if done % UPLOAD_PROGRESS_INTERVAL == 0:
+                    print(f"  Uploaded {done}/{len(leads_with_campaign)} "
+                          f"({self.rate_limiter.rate:g} req/s)")
+
+        return manifest
+
+    def _post_lead(self, lead: dict) -> dict:
+        """Upload one lead with rate limiting and retries; returns its manifest row."""
+        row = {"email": lead.get("email"), "via": "single"}
+        attempt = 0
+
+        while True:
+            row["attempts"] = attempt + 1
+            retry_after = None
+            try:
+                self.rate_limiter.acquire()
+                response = self.transport.request("POST", f"{BASE_URL}/leads", headers=self.headers, json=lead)
+            except Exception as e:
+                if not request_never_sent(e):
+                    return {**row, "status": "failed", "error": _unknown_post_error(e)}
+                status = None
+                row["error"] = str(e)
+            else:
+                status = response.status_code
+                self.rate_limiter.update_from_headers(response.headers)
+
+                if status < 400:
+                    self.rate_limiter.success()
+                    try:
+                        lead_id = (response.json() if response.text else {}).get("id")
+                    except ValueError:
+                        lead_id = None
+                    if lead_id:
+                        row.pop("error", None)
+                        return {**row, "status": "added", "lead_id": lead_id}
+                    return {**row, "status": "failed", "error": "Not created"}
+
+                row["error"] = f"HTTP {status}: {response.text[:200]}"
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if status == 429:
+                    # The bucket pauses for Retry-After itself; back off only without one
+                    self.rate_limiter.throttle(retry_after)
+
+            if not self.backoff.should_retry(attempt, status):
+                return {**row, "status": "failed"}
+            if status != 429 or retry_after is None:
+                time.sleep(self.backoff.delay(attempt, retry_after))
+            attempt += 1
 
     def move_leads_to_campaign(
         self,
@@ -275,6 +471,740 @@ class InstantlyClient:
         return self._request("POST", "/leads/move", payload)
 
 
+def _email_key(lead: dict) -> str:
+    return (lead.get("email") or "").strip().lower()
+
+
+def _bulk_leads_payload(leads: List[dict], campaign_id: str, skip_if_in_workspace: bool) -> dict:
+    """POST /leads/add body: campaign once, leads as-is (no per-lead copies)."""
+    return {
+        "campaign_id": campaign_id,
+        "skip_if_in_workspace": skip_if_in_workspace,
+        "leads": leads
+    }
+
+
+def _unknown_post_error(error: Exception) -> str:
+    """Manifest error for a POST that may or may not have reached Instantly."""
+    return f"{type(error).__name__}: {error} - not retried, the lead may already exist"
+
+
+def _bulk_response_outcome(response) -> Optional[Tuple[str, object]]:
+    """_post_bulk result for a response, or None if it should be retried."""
+    status = response.status_code
+    if status < 400:
+        try:
+            return "ok", response.json() if response.text else {}
+        except ValueError:
+            return "failed", "Unreadable bulk import response"
+    if status != 429 and status < 500:
+        return "rejected", f"HTTP {status}: {response.text[:200]}"
+    return None
+
+
+def _bulk_outcome(leads: List[dict], outcome: str, detail) -> Tuple[List[dict], List[dict], dict]:
+    """(manifest, leads to post one by one, reasons) from a _post_bulk result."""
+    if outcome == "ok":
+        manifest, retry, reasons = _bulk_manifest(leads, detail)
+        if retry:
+            print(f"  Bulk import created {len(manifest)}/{len(leads)} - retrying {len(retry)} one by one")
+        return manifest, retry, reasons
+
+    if outcome == "rejected":
+        print(f"  Bulk import rejected ({detail}) - falling back to one request per lead")
+        return [], leads, {}
+
+    print(f"  Bulk import failed ({detail}) - not re-posting {len(leads)} leads, the import may have gone through")
+    error = f"Bulk import failed ({detail}) - leads may already be in the campaign"
+    return [{"email": lead.get("email"), "status": "failed", "via": "bulk", "error": error} for lead in leads], [], {}
+
+
+def _bulk_manifest(leads: List[dict], result: dict):
+    """
+    Read a /leads/add response.
+
+    Returns:
+        (manifest rows for created leads, leads that weren't created, {email: reason})
+
+    Without per-row detail ("created_leads"), only the counts are known:
+    nothing is retried (that could duplicate leads), every row is marked
+    "submitted" and the shortfall is kept under reasons[""].
+    """
+    if "created_leads" not in result:
+        added = result.get("leads_uploaded", result.get("added", len(leads)))
+        manifest = [{"email": lead.get("email"), "status": "submitted", "via": "bulk"} for lead in leads]
+        return manifest, [], {"": len(leads) - added} if added < len(leads) else {}
+
+    created = {_email_key(row): row.get("id") for row in result["created_leads"]}
+    reasons = {
+        _email_key(row): row.get("reason") or row.get("error") or "Rejected"
+        for row in result.get("failed_leads", [])
+        if isinstance(row, dict)
+    }
+    manifest = [
+        {"email": lead.get("email"), "status": "added", "via": "bulk", "lead_id": created[_email_key(lead)]}
+        for lead in leads
+        if _email_key(lead) in created
+    ]
+    rejected = [lead for lead in leads if _email_key(lead) not in created]
+    return manifest, rejected, reasons
+
+
+def _upload_summary(manifest: List[dict], reasons: dict) -> dict:
+    """Totals + failed rows from an upload manifest (printing the first few errors)."""
+    for row in manifest:
+        if row["status"] == "failed" and _email_key(row) in reasons:
+            row["bulk_error"] = reasons[_email_key(row)]
+
+    failed = [row for row in manifest if row["status"] == "failed"]
+    shortfall = reasons.get("", 0)
+    added = sum(1 for row in manifest if row["status"] in ("added", "submitted")) - shortfall
+    errors = len(failed) + shortfall
+
+    _print_failed_leads(failed)
+    if shortfall:
+        print(f"  {shortfall} rows not created by the bulk import (duplicates/invalid - no per-row detail)")
+    print(f"Leads added: {added}, Errors: {errors}")
+    return {"added": added, "errors": errors, "failed": failed, "manifest": manifest}
+
+
+def _print_failed_leads(failed: List[dict]):
+    for row in failed[:3]:  # Only print first 3 errors
+        print(f"  Error adding lead {row['email']}: {row['error']}")
+
+
+def _leads_with_campaign(leads: List[dict], campaign_id: str, skip_if_in_workspace: bool) -> List[dict]:
+    """V2 API: Each lead needs 'campaign' field directly in the lead object."""
+    leads_with_campaign = []
+    for lead in leads:
+        lead_copy = lead.copy()
+        lead_copy["campaign"] = campaign_id
+        if skip_if_in_workspace:
+            lead_copy["skip_if_in_workspace"] = True
+        leads_with_campaign.append(lead_copy)
+    return leads_with_campaign
+
+
+class AsyncInstantlyClient:
+    """
+    asyncio version of InstantlyClient with the same methods, as coroutines.
+
+    Campaigns for several niches can be driven from one event loop. In-flight
+    requests to Instantly are capped by the AsyncHttpTransport (shared per
+    loop by default); every request also waits on the client's rate limiter,
+    and per-lead uploads retry 429/5xx like InstantlyClient's.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        transport: AsyncHttpTransport = None,
+        rate_limit: float = INSTANTLY_RATE_LIMIT,
+        backoff: BackoffPolicy = None
+    ):
+        self.api_key = api_key
+        self.transport = transport
+        self.rate_limiter = TokenBucket(rate_limit)
+        self.backoff = backoff or BackoffPolicy()
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+    async def _request(self, method: str, endpoint: str, data: dict = None) -> dict:
+        """Make API request to Instantly."""
+        url = f"{BASE_URL}{endpoint}"
+        transport = self.transport or get_async_transport()
+
+        await self.rate_limiter.acquire_async()
+        if method == "GET":
+            response = await transport.request("GET", url, headers=self.headers, params=data)
+        elif method in ("POST", "PATCH"):
+            response = await transport.request(method, url, headers=self.headers, json=data)
+        elif method == "DELETE":
+            response = await transport.request("DELETE", url, headers=self.headers)
+        else:
+            raise ValueError(f"Unsupported method: {method}")
+
+        if response.status_code >= 400:
+            print(f"HTTP Error: {response.status_code}")
+            print(f"Response: {response.text}")
+        response.raise_for_status()
+        return response.json() if response.text else {}
+
+    async def create_campaign(self, name: str, from_emails: List[str], daily_limit: int = 25) -> dict:
+        """Create campaign with embedded 3-step email sequence."""
+        print(f"Creating campaign: {name}")
+        result = await self._request("POST", "/campaigns", build_campaign_payload(name))
+        print(f"Campaign created: {result.get('id')}")
+        return result
+
+    async def activate_campaign(self, campaign_id: str) -> dict:
+        """Activate campaign to start sending."""
+        print(f"Activating campaign: {campaign_id}")
+        result = await self._request("POST", f"/campaigns/{campaign_id}/activate")
+        print(f"Campaign activated")
+        return result
+
+    async def pause_campaign(self, campaign_id: str) -> dict:
+        """Pause a running campaign."""
+        return await self._request("POST", f"/campaigns/{campaign_id}/pause")
+
+    async def get_campaign(self, campaign_id: str) -> dict:
+        """Get campaign details."""
+        return await self._request("GET", f"/campaigns/{campaign_id}")
+
+    async def list_campaigns(self, search: str = None, limit: int = None, starting_after: str = None) -> dict:
+        """List campaigns, one page at a time (see InstantlyClient.list_campaigns)."""
+        params = {"search": search, "limit": limit, "starting_after": starting_after}
+        return await self._request("GET", "/campaigns", {k: v for k, v in params.items() if v is not None} or None)
+
+    async def get_campaign_analytics(self, campaign_id: str) -> dict:
+        """Get campaign analytics."""
+        return await self._request("GET", f"/campaigns/{campaign_id}/analytics")
+
+    async def add_leads_to_campaign(
+        self,
+        campaign_id: str,
+        leads: List[dict],
+        skip_if_in_workspace: bool = False,
+        bulk: bool = True
+    ) -> dict:
+        """
+        Add leads to a campaign with one bulk import request, posting the
+        rejected rows concurrently one by one under the rate limiter (see
+        InstantlyClient).
+        """
+        print(f"Adding {len(leads)} leads to campaign {campaign_id}")
+
+        manifest = []
+        retry = leads
+        reasons = {}
+
+        if bulk and leads:
+            outcome, detail = await self._post_bulk(_bulk_leads_payload(leads, campaign_id, skip_if_in_workspace))
+            manifest, retry, reasons = _bulk_outcome(leads, outcome, detail)
+
+        leads_with_campaign = _leads_with_campaign(retry, campaign_id, skip_if_in_workspace)
+        manifest += await asyncio.gather(*[self._post_lead(lead) for lead in leads_with_campaign])
+
+        return _upload_summary(manifest, reasons)
+
+    async def _post_bulk(self, payload: dict) -> Tuple[str, object]:
+        """POST /leads/add with rate limiting and retries (see InstantlyClient._post_bulk)."""
+        transport = self.transport or get_async_transport()
+        attempt = 0
+
+        while True:
+            retry_after = None
+            try:
+                await self.rate_limiter.acquire_async()
+                response = await transport.request("POST", f"{BASE_URL}/leads/add", headers=self.headers, json=payload)
+            except Exception as e:
+                if not request_never_sent(e):
+                    return "failed", f"{type(e).__name__}: {e}"
+                status = None
+                error = str(e)
+            else:
+                status = response.status_code
+                self.rate_limiter.update_from_headers(response.headers)
+                outcome = _bulk_response_outcome(response)
+                if outcome is not None:
+                    if outcome[0] == "ok":
+                        self.rate_limiter.success()
+                    return outcome
+
+                error = f"HTTP {status}: {response.text[:200]}"
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if status == 429:
+                    self.rate_limiter.throttle(retry_after)
+
+            if not self.backoff.should_retry(attempt, status):
+                return "failed", error
+            if status != 429 or retry_after is None:
+                await asyncio.sleep(self.backoff.delay(attempt, retry_after))
+            attempt += 1
+
+    async def _post_lead(self, lead: dict) -> dict:
+        """Upload one lead with rate limiting and retries (see InstantlyClient._post_lead)."""
+        transport = self.transport or get_async_transport()
+        row = {"email": lead.get("email"), "via": "single"}
+        attempt = 0
+
+        while True:
+            row["attempts"] = attempt + 1
+            retry_after = None
+            try:
+                await self.rate_limiter.acquire_async()
+                response = await transport.request("POST", f"{BASE_URL}/leads", headers=self.headers, json=lead)
+            except Exception as e:
+                if not request_never_sent(e):
+                    return {**row, "status": "failed", "error": _unknown_post_error(e)}
+                status = None
+                row["error"] = str(e) or type(e).__name__
+            else:
+                status = response.status_code
+                self.rate_limiter.update_from_headers(response.headers)
+
+                if status < 400:
+                    self.rate_limiter.success()
+                    try:
+                        lead_id = (response.json() if response.text else {}).get("id")
+                    except ValueError:
+                        lead_id = None
+                    if lead_id:
+                        row.pop("error", None)
+                        return {**row, "status": "added", "lead_id": lead_id}
+                    return {**row, "status": "failed", "error": "Not created"}
+
+                row["error"] = f"HTTP {status}: {response.text[:200]}"
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if status == 429:
+                    self.rate_limiter.throttle(retry_after)
+
+            if not self.backoff.should_retry(attempt, status):
+                return {**row, "status": "failed"}
+            if status != 429 or retry_after is None:
+                await asyncio.sleep(self.backoff.delay(attempt, retry_after))
+            attempt += 1
+
+    async def move_leads_to_campaign(
+        self,
+        campaign_id: str,
+        lead_emails: List[str] = None,
+        filter_type: str = None
+    ) -> dict:
+        """Move leads to a campaign (alternative to add_leads)."""
+        payload = {
+            "to_campaign_id": campaign_id
+        }
+        if lead_emails:
+            payload["emails"] = lead_emails
+        if filter_type:
+            payload["filter"] = filter_type
+
+        return await self._request("POST", "/leads/move", payload)
+
+
+# =============================================================================
+# LAUNCH JOURNAL
+# =============================================================================
+
+class LaunchJournal:
+    """
+    Append-only record of one campaign launch in JSON Lines format.
+
+    Entries are {"creating": name}, {"campaign_id": id}, {"added": [emails]}
+    and {"activated": true}, each appended and fsync'd as soon as the step
+    succeeds. A re-run of launch_campaign replays them to reattach to the
+    campaign, upload only the leads not yet accepted and skip activation if
+    it already happened.
+
+    Usage:
+        journal = LaunchJournal.for_campaign("HVAC_Nov2025_JobCosting")
+        journal.load()
+        journal.record_added(["owner@acmehvac.com"])
+        journal.close()
+    """
+
+    def __init__(self, path: Optional[str]):
+        """path=None keeps the journal in memory only (nothing to resume from)."""
+        self.path = path
+        self.campaign_id = None
+        self.creating = False
+        self.activated = False
+        self.added = set()
+        self._file = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_campaign(cls, campaign_name: str, journal_dir: str = LAUNCH_JOURNAL_DIR) -> "LaunchJournal":
+        os.makedirs(journal_dir, exist_ok=True)
+        safe_name = re.sub(r"[^\w.-]+", "-", campaign_name).strip("-")
+        return cls(os.path.join(journal_dir, f"{safe_name}.jsonl"))
+
+    def load(self) -> "LaunchJournal":
+        """Replay the journal (a truncated last line from a crash is dropped)."""
+        if self.path is None or not os.path.exists(self.path):
+            return self
+
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+
+        complete = raw[:raw.rfind(b"\n") + 1]
+        if len(complete) < len(raw):
+            print(f"WARNING: Dropping incomplete last entry in {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(len(complete))
+
+        for line_number, line in enumerate(complete.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError as e:
+                print(f"WARNING: Skipping unreadable entry {line_number} in {self.path}: {e}")
+                continue
+            if "creating" in entry:
+                self.creating = True
+            if "campaign_id" in entry:
+                # A new ID (campaign recreated after a 404) starts a clean slate
+                self._set_campaign(entry["campaign_id"])
+            if "added" in entry:
+                self.added.update(email.lower() for email in entry["added"])
+            if entry.get("activated"):
+                self.activated = True
+
+        return self
+
+    def _set_campaign(self, campaign_id: Optional[str]):
+        """Switch to campaign_id, forgetting the previous campaign's uploads and activation."""
+        self.campaign_id = campaign_id
+        self.creating = False
+        self.added = set()
+        self.activated = False
+
+    def forget_campaign(self):
+        """The journalled campaign is gone: drop it but keep any pending "creating"."""
+        creating = self.creating
+        self._set_campaign(None)
+        self.creating = creating
+
+    def record_creating(self, campaign_name: str):
+        """Written before POST /campaigns, so a crash right after it is detectable."""
+        self.creating = True
+        self._append({"creating": campaign_name})
+
+    def record_campaign(self, campaign_id: str):
+        self._set_campaign(campaign_id)
+        self._append({"campaign_id": campaign_id})
+
+    def record_added(self, emails: List[str]):
+        emails = [email.lower() for email in emails if email]
+        if emails:
+            self.added.update(emails)
+            self._append({"added": emails})
+
+    def record_activated(self):
+        self.activated = True
+        self._append({"activated": True})
+
+    def _append(self, entry: dict):
+        if self.path is None:
+            return
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a')
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _find_campaign_by_name(client: InstantlyClient, campaign_name: str) -> Optional[str]:
+    """ID of an existing campaign with this exact name, if any (searches every page)."""
+    starting_after = None
+    while True:
+        page = client.list_campaigns(search=campaign_name, limit=100, starting_after=starting_after)
+        for campaign in page.get("items", []):
+            if campaign.get("name") == campaign_name:
+                return campaign.get("id")
+        starting_after = page.get("next_starting_after")
+        if not starting_after or not page.get("items"):
+            return None
+
+
+def _resume_campaign(client: InstantlyClient, journal: LaunchJournal, campaign_name: str) -> Optional[str]:
+    """
+    Campaign ID to reattach to, or None to create one.
+
+    Uses the journalled ID if Instantly still has the campaign. If the last
+    run crashed between POST /campaigns and journalling the ID (including a
+    re-create after the journalled campaign was deleted), the campaign is
+    looked up by name instead.
+    """
+    if journal.campaign_id:
+        try:
+            client.get_campaign(journal.campaign_id)
+            print(f"Resuming campaign {journal.campaign_id} ({len(journal.added)} leads already uploaded)")
+            return journal.campaign_id
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            print(f"Campaign {journal.campaign_id} no longer exists")
+            journal.forget_campaign()
+
+    if journal.creating:
+        campaign_id = _find_campaign_by_name(client, campaign_name)
+        if campaign_id:
+            print(f"Found campaign {campaign_id} created by an interrupted run")
+            journal.record_campaign(campaign_id)
+            return campaign_id
+
+    return None
+
+
+# =============================================================================
+# SUPPRESSION INDEX
+# =============================================================================
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Never a false negative; false positives stay near error_rate while it
+    holds at most capacity entries (1M entries at 0.1% is ~1.8 MB). It is
+    the in-memory front of SuppressionIndex, so the common case - a lead
+    that was never uploaded - is answered without touching disk.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, bits: bytearray = None, count: int = 0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.size + 7) // 8)
+        self.count = count
+
+    def _positions(self, value: str) -> List[int]:
+        # Double hashing: k positions from one 128-bit digest
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, value: str):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+    def save(self, path: str):
+        """Atomically write the filter: one JSON header line, then the raw bits."""
+        header = {"capacity": self.capacity, "error_rate": self.error_rate, "count": self.count}
+        tmp_file = path + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            f.write(self.bits)
+        os.replace(tmp_file, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BloomFilter"]:
+        """A saved filter, or None if the file is missing or damaged."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                header = json.loads(f.readline())
+                bits = bytearray(f.read())
+            bloom = cls(header["capacity"], header["error_rate"], bits, header["count"])
+        except (ValueError, KeyError, TypeError):
+            return None
+        return bloom if len(bits) == (bloom.size + 7) // 8 else None
+
+
+def _email_domain(email: str) -> str:
+    return email.rsplit("@", 1)[-1].strip().lower() if "@" in email else ""
+
+
+class SuppressionIndex:
+    """
+    Persistent set of every email and company domain already uploaded or
+    contacted, across all campaigns and runs.
+
+    The exact set lives in SQLite (WAL mode) and a Bloom filter sits in
+    front of it, so checking a new lead costs a few hashes; only a Bloom
+    "maybe" is confirmed on disk. The filter is saved next to the database
+    on close() and rebuilt from it whenever the two disagree.
+
+    Domains of uploaded emails are suppressed too (one contact per company),
+    except FREE_EMAIL_DOMAINS. Pass suppress_domains=False to match exact
+    emails only.
+
+    The database lives at output_dir/SUPPRESSION_INDEX_FILE unless an explicit
+    path is given.
+
+    Usage:
+        suppression = SuppressionIndex()  # user-workspace/.cache/instantly-suppression.sqlite
+        suppression.add(contacted_emails, source="contacted")  # e.g. an old export
+        launch_campaign(client, "Fire", "AESForms", leads, inboxes, suppression=suppression)
+        suppression.close()
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        suppress_domains: bool = True,
+        capacity: int = SUPPRESSION_BLOOM_CAPACITY,
+        error_rate: float = SUPPRESSION_BLOOM_ERROR_RATE,
+        output_dir: str = "user-workspace"
+    ):
+        path = path or os.path.join(output_dir, SUPPRESSION_INDEX_FILE)
+        self.path = path
+        self.bloom_file = path + ".bloom"
+        self.suppress_domains = suppress_domains
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.checked = 0
+        self.suppressed = 0
+        self.false_positives = 0
+        # Kept by filter_leads but not uploaded yet: {value: campaign}. Stops two
+        # campaigns launched concurrently from both taking the same lead.
+        self._pending = {}
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS suppressed ("
+            "value TEXT PRIMARY KEY, kind TEXT, source TEXT, campaign TEXT, added_at REAL)"
+        )
+        self._conn.commit()
+
+        rows = self._conn.execute("SELECT COUNT(*) FROM suppressed").fetchone()[0]
+        bloom = BloomFilter.load(self.bloom_file)
+        if bloom is None or bloom.count != rows or bloom.capacity < rows:
+            bloom = self._build_bloom(rows)
+        self._bloom = bloom
+
+    def _build_bloom(self, rows: int) -> BloomFilter:
+        bloom = BloomFilter(max(self.capacity, rows * 2), self.error_rate)
+        for (value,) in self._conn.execute("SELECT value FROM suppressed"):
+            bloom.add(value)
+        return bloom
+
+    def _keys(self, email: str) -> List[str]:
+        """Values that suppress this email: itself, plus its company domain."""
+        email = email.strip().lower()
+        if not email:
+            return []
+        domain = _email_domain(email)
+        if self.suppress_domains and domain and domain not in FREE_EMAIL_DOMAINS:
+            return [email, domain]
+        return [email]
+
+    def _stored(self, value: str, campaign: str = None) -> bool:
+        """In the index - not counting entries uploaded by campaign itself."""
+        if value not in self._bloom:
+            return False
+        row = self._conn.execute("SELECT campaign FROM suppressed WHERE value = ?", (value,)).fetchone()
+        if row is None:
+            self.false_positives += 1
+            return False
+        return campaign is None or row[0] != campaign
+
+    def __contains__(self, email: str) -> bool:
+        with self._lock:
+            return any(self._stored(key) for key in self._keys(email))
+
+    def filter_leads(self, leads: List[dict], campaign: str = None) -> Tuple[List[dict], List[dict]]:
+        """
+        Split leads into (to upload, suppressed).
+
+        A lead is suppressed if its email or domain was uploaded/contacted
+        before, is held by another campaign being launched right now, or
+        already appeared earlier in this list. Entries that campaign itself
+        uploaded don't count, so a campaign recreated under the same name
+        gets its leads again (the launch journal skips ones it still has).
+        Suppressed rows are {"email": ..., "reason": ...}.
+        """
+        kept = []
+        suppressed = []
+        seen = set()
+
+        with self._lock:
+            for lead in leads:
+                keys = self._keys(lead.get("email") or "")
+                self.checked += 1
+                reason = None
+
+                for key in keys:
+                    kind = "email" if "@" in key else "domain"
+                    if key in seen:
+                        reason = f"duplicate {kind} in this list"
+                    elif self._pending.get(key, campaign) != campaign:
+                        reason = f"{kind} being uploaded to {self._pending[key]}"
+                    elif self._stored(key, campaign):
+                        reason = f"{kind} already uploaded/contacted"
+                    if reason:
+                        break
+
+                if reason:
+                    self.suppressed += 1
+                    suppressed.append({"email": lead.get("email"), "reason": reason})
+                    continue
+
+                seen.update(keys)
+                for key in keys:
+                    self._pending[key] = campaign
+                kept.append(lead)
+
+        return kept, suppressed
+
+    def add(self, emails: List[str], source: str = "uploaded", campaign: str = None) -> int:
+        """
+        Suppress emails (and their domains) from now on.
+
+        Returns:
+            Number of new entries stored
+        """
+        keys = [key for email in emails if email for key in self._keys(email)]
+        return self._store(keys, source, campaign)
+
+    def add_domains(self, domains: List[str], source: str = "contacted") -> int:
+        """Suppress whole domains (e.g. customers, do-not-contact lists)."""
+        return self._store([domain.strip().lower() for domain in domains if domain], source, None)
+
+    def _store(self, values: List[str], source: str, campaign: Optional[str]) -> int:
+        added = 0
+        now = time.time()
+        with self._lock:
+            for value in values:
+                self._pending.pop(value, None)
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO suppressed VALUES (?, ?, ?, ?, ?)",
+                    (value, "email" if "@" in value else "domain", source, campaign, now)
+                )
+                if cursor.rowcount:
+                    self._bloom.add(value)
+                    added += 1
+            self._conn.commit()
+
+            if self._bloom.count > self._bloom.capacity:
+                self._bloom = self._build_bloom(self._bloom.count)
+        return added
+
+    def release(self, campaign: str = None):
+        """Drop a campaign's pending holds (its failed leads become available again)."""
+        with self._lock:
+            self._pending = {key: owner for key, owner in self._pending.items() if owner != campaign}
+
+    def stats(self) -> dict:
+        return {
+            "entries": self._bloom.count,
+            "checked": self.checked,
+            "suppressed": self.suppressed,
+            "bloom_false_positives": self.false_positives
+        }
+
+    def close(self):
+        """Save the Bloom filter (fast start next time) and close the database."""
+        with self._lock:
+            self._bloom.save(self.bloom_file)
+            self._conn.close()
+
+
 # =============================================================================
 # CAMPAIGN LAUNCHER
 # =============================================================================
@@ -325,7 +1255,11 @@ def launch_campaign(
     problem_angle: str,
     leads_data: List[dict],
     from_emails: List[str],
-    daily_limit: int = 25
+    daily_limit: int = 25,
+    output_dir: str = "user-workspace",
+    journal_dir: Optional[str] = LAUNCH_JOURNAL_DIR,
+    suppression: SuppressionIndex = None,
+    use_suppression: bool = True
 ) -> dict:
     """
     Launch a complete campaign for a niche.
@@ -335,6 +1269,17 @@ def launch_campaign(
     2. Add all leads with custom variables
     3. Activate campaign
 
+    Each step is recorded in a launch journal
+    (output_dir/journal_dir/{campaign_name}.jsonl), so re-running after a crash reattaches to the same campaign, uploads only
+    the leads not yet accepted and skips activation if it's done. Pass
+    journal_dir=None to always start fresh.
+
+    Leads whose email or company domain is in the suppression index (already
+    uploaded to any campaign, or imported as contacted) are dropped before
+    payloads are built, and every accepted lead is added to it. suppression
+    defaults to SUPPRESSION_INDEX_FILE under output_dir; use_suppression=False
+    turns it off.
+
     Returns campaign details including ID.
     """
     # Generate campaign name: {Niche}_{MonthYear}_{ProblemAngle}
@@ -345,64 +1290,260 @@ def launch_campaign(
     print(f"Launching campaign: {campaign_name}")
     print(f"{'='*60}")
 
-    # Step 1: Create campaign with embedded sequences
-    campaign = client.create_campaign(
-        name=campaign_name,
-        from_emails=from_emails,
-        daily_limit=daily_limit
-    )
-    campaign_id = campaign.get("id")
-
-    if not campaign_id:
-        raise Exception("Failed to create campaign - no ID returned")
-
-    # Step 2: Add leads with custom variables
-    # Format leads for Instantly
-    formatted_leads = []
-    for lead in leads_data:
-        formatted_leads.append(format_lead_for_instantly(
-            email=lead["email"],
-            first_name=lead["first_name"],
-            last_name=lead.get("last_name", ""),
-            company_name=lead["company_name"],
-            email_body=lead["email_body"],
-            subject_variant_a=lead["subject_variant_a"],
-            subject_variant_b=lead["subject_variant_b"],
-            subject_variant_c=lead["subject_variant_c"],
-            follow_up_day_3=lead["follow_up_day_3"],
-            follow_up_day_7=lead["follow_up_day_7"],
-            problem_angle=lead.get("problem_angle", problem_angle)
-        ))
-
-    # Add leads in batches of 100 to avoid timeout
-    batch_size = 100
-    total_added = 0
-
-    for i in range(0, len(formatted_leads), batch_size):
-        batch = formatted_leads[i:i + batch_size]
-        result = client.add_leads_to_campaign(campaign_id, batch)
-        total_added += result.get("added", 0)
-        time.sleep(0.5)  # Small delay between batches
-
-    print(f"Total leads added: {total_added}")
-
-    # Step 3: Activate campaign
-    client.activate_campaign(campaign_id)
-
-    print(f"\n✅ Campaign launched successfully!")
+    if journal_dir:
+        journal = LaunchJournal.for_campaign(campaign_name, os.path.join(output_dir, journal_dir)).load()
+    else:
+        journal = LaunchJournal(None)
+
+    owns_suppression = use_suppression and suppression is None
+    if owns_suppression:
+        suppression = SuppressionIndex(output_dir=output_dir)
+
+    try:
+        # Step 1: Create campaign with embedded sequences (or reattach)
+        campaign_id = _resume_campaign(client, journal, campaign_name)
+        resumed = campaign_id is not None
+
+        if not campaign_id:
+            journal.record_creating(campaign_name)
+            campaign = client.create_campaign(
+                name=campaign_name,
+                from_emails=from_emails,
+                daily_limit=daily_limit
+            )
+            campaign_id = campaign.get("id")
+
+            if not campaign_id:
+                raise Exception("Failed to create campaign - no ID returned")
+            journal.record_campaign(campaign_id)
+
+        # Step 2: Add leads with custom variables
+        # Skip leads a previous run uploaded, then anyone already contacted
+        remaining = [lead for lead in leads_data if lead["email"].lower() not in journal.added]
+        already_uploaded = len(leads_data) - len(remaining)
+        if already_uploaded:
+            print(f"Skipping {already_uploaded} leads uploaded by a previous run")
+
+        suppressed_leads = []
+        if suppression is not None:
+            remaining, suppressed_leads = suppression.filter_leads(remaining, campaign_name)
+            if suppressed_leads:
+                print(f"Suppressed {len(suppressed_leads)} leads already uploaded/contacted")
+
+        # Format leads for Instantly
+        formatted_leads = []
+        for lead in remaining:
+            formatted_leads.append(format_lead_for_instantly(
+                email=lead["email"],
+                first_name=lead["first_name"],
+                last_name=lead.get("last_name", ""),
+                company_name=lead["company_name"],
+                email_body=lead["email_body"],
+                subject_variant_a=lead["subject_variant_a"],
+                subject_variant_b=lead["subject_variant_b"],
+                subject_variant_c=lead["subject_variant_c"],
+                follow_up_day_3=lead["follow_up_day_3"],
+                follow_up_day_7=lead["follow_up_day_7"],
+                problem_angle=lead.get("problem_angle", problem_angle)
+            ))
+
+        # Add leads in bulk, LEAD_BATCH_SIZE per request
+        total_added = 0
+        failed_leads = []
+        upload_manifest = []
+
+        for i in range(0, len(formatted_leads), LEAD_BATCH_SIZE):
+            batch = formatted_leads[i:i + LEAD_BATCH_SIZE]
+            result = client.add_leads_to_campaign(campaign_id, batch)
+            total_added += result.get("added", 0)
+            failed_leads.extend(result.get("failed", []))
+            upload_manifest.extend(result.get("manifest", []))
+            accepted = [
+                row["email"] for row in result.get("manifest", [])
+                if row["status"] in ("added", "submitted")
+            ]
+            journal.record_added(accepted)
+            if suppression is not None:
+                suppression.add(accepted, campaign=campaign_name)
+            if i + LEAD_BATCH_SIZE < len(formatted_leads):
+                time.sleep(BATCH_DELAY)  # Small delay between batches
+
+        print(f"Total leads added: {total_added}")
+
+        # Step 3: Activate campaign (never an empty one)
+        if journal.activated:
+            print(f"Campaign {campaign_id} already activated")
+        elif not journal.added:
+            print(f"WARNING: No leads in campaign {campaign_id} - not activating it")
+        else:
+            client.activate_campaign(campaign_id)
+            journal.record_activated()
+    finally:
+        journal.close()
+        if suppression is not None:
+            suppression.release(campaign_name)
+        if owns_suppression:
+            suppression.close()
+
+    status = "active" if journal.activated else "empty"
+    print(f"\n{'✅ Campaign launched successfully!' if journal.activated else '⚠️ Campaign created but not activated (no leads)'}")
     print(f"   Campaign ID: {campaign_id}")
     print(f"   Campaign Name: {campaign_name}")
-    print(f"   Leads: {total_added}")
+    print(f"   Leads: {total_added}" + (f" ({len(failed_leads)} failed)" if failed_leads else "")
+          + (f" + {already_uploaded} from previous run" if already_uploaded else "")
+          + (f", {len(suppressed_leads)} suppressed" if suppressed_leads else ""))
     print(f"   Dashboard: https://app.instantly.ai/campaigns/{campaign_id}")
 
     return {
         "campaign_id": campaign_id,
         "campaign_name": campaign_name,
         "leads_added": total_added,
-        "status": "active"
+        "already_uploaded": already_uploaded,
+        "suppressed_leads": suppressed_leads,
+        "resumed": resumed,
+        "failed_leads": failed_leads,
+        "upload_manifest": upload_manifest,
+        "status": status
     }
 
 
+def _launch_campaign_config(
+    client: InstantlyClient,
+    config: dict,
+    from_emails: List[str],
+    daily_limit: int,
+    output_dir: str,
+    journal_dir: Optional[str],
+    suppression: Optional[SuppressionIndex]
+) -> dict:
+    """Run one launch_campaigns config, returning an error dict instead of raising."""
+    try:
+        return launch_campaign(
+            client=client,
+            niche_name=config["niche_name"],
+            problem_angle=config["problem_angle"],
+            leads_data=config["leads_data"],
+            from_emails=config.get("from_emails", from_emails),
+            daily_limit=config.get("daily_limit", daily_limit),
+            output_dir=output_dir,
+            journal_dir=journal_dir,
+            suppression=suppression,
+            use_suppression=suppression is not None
+        )
+    except Exception as e:
+        print(f"ERROR launching {config.get('niche_name')}: {e}")
+        return {
+            "niche_name": config.get("niche_name"),
+            "problem_angle": config.get("problem_angle"),
+            "error": str(e)
+        }
+
+
+def launch_campaigns(
+    client: InstantlyClient,
+    campaigns: List[dict],
+    from_emails: List[str],
+    daily_limit: int = 25,
+    max_concurrent: int = MAX_CONCURRENT_LAUNCHES,
+    output_dir: str = "user-workspace",
+    journal_dir: Optional[str] = LAUNCH_JOURNAL_DIR,
+    suppression: SuppressionIndex = None,
+    use_suppression: bool = True
+) -> dict:
+    """
+    Launch campaigns for several niches concurrently (Mission 2).
+
+    Each campaign is created, filled and activated by launch_campaign in its
+    own worker. Every request goes through the one client, so all campaigns
+    share its rate limit (rate_limit= on InstantlyClient) rather than each
+    getting its own. A failed campaign doesn't stop the others, and each is
+    journalled, so re-running resumes only what didn't finish. One
+    suppression index is shared by all of them, so a lead that appears in
+    several niche files goes to one campaign only.
+
+    Args:
+        client: InstantlyClient instance (its rate limit is the shared budget)
+        campaigns: List of {"niche_name": "Fire", "problem_angle": "AESForms",
+            "leads_data": [...]} - optional "from_emails" / "daily_limit" override
+            the defaults below
+        from_emails: Sending inboxes for every campaign
+        daily_limit: Daily sending limit per campaign
+        max_concurrent: Campaigns launched at once
+        output_dir: Workspace directory holding launch state
+        journal_dir: Launch journal directory under output_dir (None disables resume)
+        suppression: SuppressionIndex shared by every campaign (default:
+            SUPPRESSION_INDEX_FILE under output_dir)
+        use_suppression: Set False to upload leads without checking the index
+
+    Returns:
+        {"campaigns": [launch_campaign results, or {"niche_name", "error"}]
+         (same order as campaigns), "summary": combined totals}
+    """
+    start_time = time.time()
+    results = [None] * len(campaigns)
+
+    owns_suppression = use_suppression and suppression is None
+    if owns_suppression:
+        suppression = SuppressionIndex(output_dir=output_dir)
+
+    print(f"Launching {len(campaigns)} campaigns concurrently "
+          f"(max {max_concurrent} at once, {client.rate_limiter.max_rate:g} req/s shared)...")
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrent)) as executor:
+        futures = {
+            executor.submit(
+                _launch_campaign_config, client, config, from_emails, daily_limit,
+                output_dir, journal_dir, suppression
+            ): i
+            for i, config in enumerate(campaigns)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            results[i] = future.result()
+            print(f"\n[{done}/{len(campaigns)}] Finished: {campaigns[i].get('niche_name')}")
+
+    if owns_suppression:
+        suppression.close()
+
+    launched = [r for r in results if "error" not in r]
+    summary = {
+        "campaigns_launched": sum(1 for r in launched if r["status"] == "active"),
+        "campaigns_empty": sum(1 for r in launched if r["status"] == "empty"),
+        "campaigns_failed": len(results) - len(launched),
+        "leads_added": sum(r["leads_added"] for r in launched),
+        "already_uploaded": sum(r.get("already_uploaded", 0) for r in launched),
+        "suppressed": sum(len(r.get("suppressed_leads", [])) for r in launched),
+        "failed_leads": sum(len(r["failed_leads"]) for r in launched),
+        "rate_limit_hits": client.rate_limiter.throttle_count,
+        "elapsed_seconds": round(time.time() - start_time, 1)
+    }
+
+    _print_launch_summary(results, summary)
+
+    return {"campaigns": results, "summary": summary}
+
+
+def _print_launch_summary(results: List[dict], summary: dict):
+    """Print per-campaign lines and totals for launch_campaigns."""
+    print(f"\n{'='*60}")
+    print("LAUNCH SUMMARY")
+    print(f"{'='*60}")
+
+    for r in results:
+        if "error" not in r:
+            print(f"{'✅' if r['status'] == 'active' else '⚠️'} {r['campaign_name']}: {r['leads_added']} leads"
+                  + (f" ({len(r['failed_leads'])} failed)" if r['failed_leads'] else "")
+                  + f" - {r['campaign_id']}"
+                  + (" (no leads - not activated)" if r['status'] != 'active' else ""))
+        else:
+            print(f"❌ {r['niche_name']}_{r['problem_angle']}: {r['error']}")
+
+    print(f"\nTotal: {summary['campaigns_launched']} campaigns, {summary['leads_added']} leads added"
+          + (f", {summary['failed_leads']} failed" if summary['failed_leads'] else "")
+          + (f", {summary['suppressed']} suppressed" if summary['suppressed'] else ""))
+    print(f"Time: {summary['elapsed_seconds']}s ({summary['rate_limit_hits']} rate-limit hits)")
+
+
 # =============================================================================
 # EXAMPLE USAGE
 # =============================================================================
@@ -428,7 +1569,7 @@ if __name__ == "__main__":
     Usage:
     1. Set INSTANTLY_API_KEY
     2. Load your leads from {niche}-emails.json
-    3. Call launch_campaign() for each niche
+    3. Call launch_campaign() for each niche, or launch_campaigns() for all of them
 
     Example:
 
@@ -441,4 +1582,27 @@ if __name__ == "__main__":
             leads_data=leads,  # From fire-inspection-emails.json
             from_emails=["inbox1@domain.com", "inbox2@domain.com"]
         )
+
+    Several niches at once (one shared rate limit, combined summary):
+
+        results = launch_campaigns(client, [
+            {"niche_name": "Fire", "problem_angle": "AESForms", "leads_data": fire_leads},
+            {"niche_name": "HVAC", "problem_angle": "JobCosting", "leads_data": hvac_leads},
+            {"niche_name": "PropertyMgmt", "problem_angle": "Inspections", "leads_data": pm_leads}
+        ], from_emails=["inbox1@domain.com", "inbox2@domain.com"])
+        print(results["summary"])
+
+    Already-uploaded emails/domains are skipped automatically (suppression index
+    in user-workspace/.cache/instantly-suppression.sqlite). Add people contacted elsewhere:
+
+        suppression = SuppressionIndex()
+        suppression.add(["owner@acmehvac.com"], source="contacted")
+        suppression.add_domains(["existingcustomer.com"])
+        suppression.close()
+
+    asyncio (pip install aiohttp): drive several campaigns from one event loop
+
+        client = AsyncInstantlyClient("your_api_key")
+        campaign = await client.create_campaign("Fire_Nov2025_AESForms", from_emails)
+        await client.add_leads_to_campaign(campaign["id"], formatted_leads)
     """)